@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark de charge concurrente : débit de ConcurrentTaskManager de 1 à 32
+threads sur un mélange d'ajouts, lectures, changements de statut, statistiques
+et suppressions, avec vérification de cohérence à la fin
+
+Usage : python -m benchmarks.bench_concurrency [--operations 200000]
+"""
+import argparse
+import threading
+import time
+
+from src.task_manager.task import SlottedTask, Status
+from src.task_manager.threadsafe import ConcurrentTaskManager
+
+THREAD_COUNTS = [1, 2, 4, 8, 16, 32]
+
+
+def worker(manager, operations, seed_ids, barrier):
+    # Un tour = 5 opérations : ajout, lecture, changement de statut,
+    # statistiques, suppression de la tâche ajoutée
+    barrier.wait()
+    for i in range(operations // 5):
+        task_id = manager.add_task(f"Tâche {i}")
+        task = manager.get_task(seed_ids[i % len(seed_ids)])
+        task.status = Status.IN_PROGRESS if i % 2 else Status.TODO
+        manager.get_statistics()
+        manager.delete_task(task_id)
+
+
+def run(thread_count, operations, seed_count=10_000):
+    manager = ConcurrentTaskManager(task_class=SlottedTask)
+    seed_ids = [manager.add_task(f"Tâche {i}") for i in range(seed_count)]
+    barrier = threading.Barrier(thread_count + 1)
+    per_thread = operations // thread_count
+    threads = [
+        threading.Thread(target=worker, args=(manager, per_thread, seed_ids, barrier))
+        for _ in range(thread_count)
+    ]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    # Les compteurs doivent correspondre à un recomptage complet
+    stats = manager.get_statistics()
+    assert stats == manager._recount_statistics(), "statistiques incohérentes"
+    assert stats["total_tasks"] == seed_count, "ajouts ou suppressions perdus"
+    return per_thread * thread_count / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--operations", type=int, default=200_000)
+    parser.add_argument("--threads", type=int, nargs="+", default=THREAD_COUNTS)
+    args = parser.parse_args()
+
+    print(f"{args.operations:,} opérations par mesure")
+    baseline = None
+    for thread_count in args.threads:
+        throughput = run(thread_count, args.operations)
+        baseline = baseline or throughput
+        print(
+            f"  {thread_count:>2} threads  {throughput:12,.0f} ops/s  "
+            f"x{throughput / baseline:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark des baux : coût de claim, heartbeat et du ramassage des baux échus,
+en mémoire puis partagés entre processus (fichier de baux, base SQLite)
+
+Usage : python -m benchmarks.bench_leases [--count 100000] [--shared 200]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from src.task_manager.manager import TaskManager
+from src.task_manager.storage import JSONFileStorage, SQLiteStorage
+from src.task_manager.task import SlottedTask
+
+
+def per_call(function, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        function()
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def bench_local(count):
+    manager = TaskManager(task_class=SlottedTask)
+    manager.add_tasks(f"Tâche {i}" for i in range(count))
+    claims = per_call(lambda: manager.claim("w", ttl=60), count // 2)
+    task_id = manager.tasks[0].id
+    beats = per_call(lambda: manager.heartbeat(task_id, "w", ttl=60), 10_000)
+    # Ramassage sans bail échu, puis de tous les baux d'un coup
+    idle = per_call(manager.reap_expired_leases, 10_000)
+    start = time.perf_counter()
+    released = manager.reap_expired_leases(time.time() + 120)
+    elapsed = time.perf_counter() - start
+    print(f"En mémoire, {count // 2:,} baux en cours")
+    print(f"  claim                       {claims:8.1f} µs")
+    print(f"  heartbeat                   {beats:8.1f} µs")
+    print(f"  ramassage, aucun bail échu  {idle:8.1f} µs")
+    print(
+        f"  ramassage de {len(released):,} baux échus "
+        f"{elapsed * 1000:8.1f} ms"
+    )
+
+
+def bench_shared(label, filename, storage, count):
+    manager = TaskManager(filename, storage=storage, shared_leases=True)
+    manager.add_tasks(f"Tâche {i}" for i in range(count))
+    manager.save_to_file()
+    claims = per_call(lambda: manager.claim("w", ttl=60), count // 2)
+    task_id = manager.tasks[0].id
+    beats = per_call(lambda: manager.heartbeat(task_id, "w", ttl=60), count // 2)
+    manager.close()
+    print(f"  {label:<27} claim {claims:8.1f} µs   heartbeat {beats:8.1f} µs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--shared", type=int, default=200)
+    args = parser.parse_args()
+
+    bench_local(args.count)
+    print(f"Partagés entre processus, {args.shared // 2:,} baux en cours")
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "tasks.json")
+        bench_shared(
+            "fichier de baux", filename, JSONFileStorage(filename), args.shared
+        )
+        filename = os.path.join(directory, "tasks.db")
+        bench_shared("SQLite", filename, SQLiteStorage(filename), args.shared)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark mémoire : octets par tâche selon la représentation de Task
+
+Usage : python -m benchmarks.bench_memory [--count 1000000]
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from datetime import datetime
+
+from src.task_manager.task import Priority, SlottedTask, Status, Task
+
+
+class LegacyTask:
+    """Représentation d'origine : attributs dans le __dict__ de l'instance"""
+
+    def __init__(self, title, description="", priority=Priority.MEDIUM):
+        self.id = time.time()
+        self.title = title.strip()
+        self.description = description
+        self.priority = priority
+        self.status = Status.TODO
+        self.created_at = datetime.now()
+        self.completed_at = None
+        self.project_id = None
+
+
+def measure(task_class, count):
+    # Mesure la mémoire allouée par la création de `count` tâches
+    # Titres et descriptions sont partagés pour n'isoler que le coût par tâche
+    gc.collect()
+    tracemalloc.start()
+    tasks = [task_class("Tâche", "Description", Priority.HIGH) for _ in range(count)]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tasks
+    return allocated / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"Mémoire par tâche pour {args.count:,} tâches")
+    results = {}
+    for task_class in (LegacyTask, Task, SlottedTask):
+        per_task = results[task_class] = measure(task_class, args.count)
+        print(
+            f"  {task_class.__name__:<12} {per_task:8.1f} octets/tâche "
+            f"({per_task / results[LegacyTask]:.0%} de LegacyTask)"
+        )
+
+    # Task garde un __dict__ (réservé même s'il n'est jamais alloué) pour les
+    # attributs libres : la représentation par défaut n'y gagne rien
+    difference = results[Task] - results[LegacyTask]
+    if difference >= 0:
+        print(
+            f"  Task (par défaut) n'est pas plus petite que LegacyTask "
+            f"({difference:+.0f} octets/tâche)\n"
+            f"  Seul TaskManager(task_class=SlottedTask) réduit la mémoire"
+        )
+
+
+if __name__ == "__main__":
+    main()
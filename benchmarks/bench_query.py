@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark des requêtes : filtre combiné écrit en compréhension sur
+TaskManager.tasks contre le moteur de requêtes, qui part de l'index le plus
+sélectif
+
+Usage : python -m benchmarks.bench_query [--count 500000] [--repeat 5]
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from benchmarks.bench_save import build_tasks
+from src.task_manager.manager import TaskManager
+from src.task_manager.query import F
+from src.task_manager.task import Priority, SlottedTask, Status
+
+
+def timed(function, repeat):
+    # Meilleur temps sur plusieurs essais
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=500_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    manager = TaskManager(task_class=SlottedTask)
+    manager.tasks = build_tasks(args.count)
+    since = datetime.now() - timedelta(days=7)
+
+    def comprehension():
+        return [
+            task
+            for task in manager.tasks
+            if task.priority in (Priority.HIGH, Priority.URGENT)
+            and task.status != Status.DONE
+            and task.project_id == "projet-7"
+            and task.created_at >= since
+            and "1" in task.title
+        ]
+
+    def query():
+        return manager.query(
+            F.priority >= Priority.HIGH,
+            F.status != Status.DONE,
+            F.project_id == "projet-7",
+            F.created_at >= since,
+            F.title.contains("1"),
+        ).all()
+
+    def top_ten():
+        return manager.query(F.status == Status.TODO).order_by("-created_at").limit(10)
+
+    print(f"{args.count:,} tâches")
+    baseline, expected = timed(comprehension, args.repeat)
+    elapsed, result = timed(query, args.repeat)
+    assert result == expected
+    print(f"  compréhension        {baseline * 1000:8.1f} ms")
+    speedup = baseline / elapsed
+    print(f"  requête indexée      {elapsed * 1000:8.1f} ms (x{speedup:.1f})")
+    elapsed, _ = timed(lambda: top_ten().all(), args.repeat)
+    print(f"  10 plus récentes     {elapsed * 1000:8.1f} ms")
+    elapsed, _ = timed(lambda: manager.query(F.status == Status.TODO).count(), 1)
+    print(f"  comptage par index   {elapsed * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Benchmark de sauvegarde : temps d'écriture et taille sur disque, format indenté
+historique contre format compact
+
+Usage : python -m benchmarks.bench_save [--counts 100000 1000000]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from src.task_manager.storage import JSONFileStorage
+from src.task_manager.task import Priority, SlottedTask
+
+
+def build_tasks(count):
+    # Tâches variées : un quart terminées, projets répartis
+    priorities = list(Priority)
+    tasks = []
+    for i in range(count):
+        task = SlottedTask(f"Tâche {i}", f"Description de la tâche {i}")
+        task.priority = priorities[i % len(priorities)]
+        task.project_id = f"projet-{i % 50}"
+        if i % 4 == 0:
+            task.mark_completed()
+        tasks.append(task)
+    return tasks
+
+
+def measure(storage, tasks):
+    start = time.perf_counter()
+    storage.save(tasks)
+    elapsed = time.perf_counter() - start
+    return elapsed, os.path.getsize(storage.filename)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--counts", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for count in args.counts:
+            tasks = build_tasks(count)
+            print(f"{count:,} tâches")
+            results = {}
+            for label, compact in (("indenté", False), ("compact", True)):
+                filename = os.path.join(tmp_dir, f"{label}.json")
+                storage = JSONFileStorage(filename, compact=compact)
+                results[label] = measure(storage, tasks)
+                elapsed, size = results[label]
+                print(f"  {label:<8} {elapsed:7.2f} s  {size / 1e6:8.1f} Mo")
+
+            (pretty_time, pretty_size) = results["indenté"]
+            (compact_time, compact_size) = results["compact"]
+            print(
+                f"  gain     x{pretty_time / compact_time:.2f} en temps, "
+                f"{1 - compact_size / pretty_size:.0%} d'octets en moins"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la prochaine tâche à faire : filtre et tri des tâches TODO à
+chaque demande contre la file à priorité du gestionnaire
+
+Usage : python -m benchmarks.bench_scheduler [--count 200000] [--claims 1000]
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from src.task_manager.manager import TaskManager
+from src.task_manager.task import Priority, SlottedTask, Status
+
+START = datetime(2024, 1, 1)
+RANKS = {priority: rank for rank, priority in enumerate(Priority)}
+
+
+def build_tasks(count):
+    # Priorités en rotation, une tâche sur deux déjà commencée
+    priorities = list(Priority)
+    tasks = []
+    for i in range(count):
+        task = SlottedTask(f"Tâche {i}", priority=priorities[i * 7 % 4])
+        task.created_at = START + timedelta(seconds=i)
+        if i % 2:
+            task.status = Status.IN_PROGRESS
+        tasks.append(task)
+    return tasks
+
+
+def sorted_claim(manager):
+    # Approche actuelle : seau TODO trié à chaque demande
+    todo = manager.get_tasks_by_status(Status.TODO)
+    if not todo:
+        return None
+    todo.sort(key=lambda t: (-RANKS[t.priority], t.created_at))
+    todo[0].status = Status.IN_PROGRESS
+    return todo[0]
+
+
+def run(label, count, claims, claim):
+    manager = TaskManager(task_class=SlottedTask)
+    tasks = build_tasks(count)
+    start = time.perf_counter()
+    manager.tasks = tasks
+    loaded = time.perf_counter() - start
+    start = time.perf_counter()
+    titles = [claim(manager).title for _ in range(claims)]
+    elapsed = time.perf_counter() - start
+    print(
+        f"  {label:<20} chargement {loaded:6.2f} s   "
+        f"{elapsed / claims * 1e6:10.1f} µs par prise"
+    )
+    return titles
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--claims", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{args.count:,} tâches, {args.claims:,} prises successives")
+    # Moins de prises pour le tri : chacune parcourt toutes les tâches TODO
+    sorted_claims = min(args.claims, 50)
+    expected = run("tri à chaque prise", args.count, sorted_claims, sorted_claim)
+    titles = run("claim_next", args.count, args.claims, TaskManager.claim_next)
+    assert titles[:sorted_claims] == expected
+
+
+if __name__ == "__main__":
+    main()
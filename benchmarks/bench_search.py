@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la recherche plein texte : parcours avec test de sous-chaîne
+contre l'index inversé, et chargement avec index persisté contre
+reconstruction
+
+Usage : python -m benchmarks.bench_search [--count 500000]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from src.task_manager.manager import TaskManager
+from src.task_manager.search import normalize
+from src.task_manager.task import SlottedTask
+
+WORDS = (
+    "préparer réserver réunion salle client démo budget équipe rapport "
+    "facture livraison planning relecture déploiement serveur sauvegarde"
+).split()
+
+
+def build_tasks(count):
+    # Titres et descriptions de trois et six mots pris dans WORDS ; chaque
+    # titre finit par un numéro unique, terme rare
+    tasks = []
+    for i in range(count):
+        title = " ".join(WORDS[(i * k) % len(WORDS)] for k in (1, 3, 7))
+        description = " ".join(WORDS[(i + k) % len(WORDS)] for k in range(6))
+        tasks.append(SlottedTask(f"{title} {i}", description))
+    return tasks
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=500_000)
+    args = parser.parse_args()
+
+    tasks = build_tasks(args.count)
+    print(f"{args.count:,} tâches")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filename = os.path.join(tmp_dir, "tasks.json")
+        manager = TaskManager(filename, task_class=SlottedTask, persist_search=True)
+        elapsed, _ = timed(lambda: setattr(manager, "tasks", tasks))
+        print(f"  construction de l'index    {elapsed:8.2f} s")
+
+        def scan():
+            # Recherche naïve équivalente, sans accents ni casse
+            needles = [normalize(word) for word in ("reunion", "salle")]
+            return [
+                task
+                for task in manager.tasks
+                if all(
+                    needle in normalize(f"{task.title} {task.description}")
+                    for needle in needles
+                )
+            ]
+
+        elapsed, expected = timed(scan)
+        print(f"  parcours                   {elapsed * 1000:8.1f} ms")
+        elapsed, found = timed(lambda: manager.search("réunion salle"))
+        assert {task.id for task in found} == {task.id for task in expected}
+        print(f"  index                      {elapsed * 1000:8.1f} ms")
+        elapsed, _ = timed(lambda: manager.search("réunion salle", limit=10))
+        print(f"  index, 10 premiers         {elapsed * 1000:8.1f} ms")
+        elapsed, _ = timed(lambda: manager.search("dep"))
+        print(f"  index, préfixe « dep »     {elapsed * 1000:8.1f} ms")
+        rare = f"réunion {args.count // 2}"
+        elapsed, _ = timed(lambda: manager.search(rare))
+        print(f"  index, terme rare          {elapsed * 1000:8.1f} ms")
+        manager.save_to_file()
+
+        rebuilt = TaskManager(filename, task_class=SlottedTask, search=True)
+        elapsed, _ = timed(rebuilt.load_from_file)
+        print(f"  chargement, reconstruction {elapsed:8.2f} s")
+        reloaded = TaskManager(filename, task_class=SlottedTask, persist_search=True)
+        elapsed, _ = timed(reloaded.load_from_file)
+        print(f"  chargement, index persisté {elapsed:8.2f} s")
+        plain = TaskManager(filename, task_class=SlottedTask)
+        elapsed, _ = timed(plain.load_from_file)
+        print(f"  chargement sans index      {elapsed:8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
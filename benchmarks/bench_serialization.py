@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark de (dé)sérialisation : from_dict / to_dict tâche par tâche contre
+les chemins en lot from_dicts / to_dicts, sur demo_tasks.json agrandi
+
+Usage : python -m benchmarks.bench_serialization [--count 1000000]
+"""
+import argparse
+import json
+import os
+import time
+from datetime import datetime
+
+from src.task_manager.task import Priority, SlottedTask, Status
+
+DEMO_FILE = os.path.join(os.path.dirname(__file__), os.pardir, "demo_tasks.json")
+
+
+def scale_demo(count):
+    # Répète les tâches de démonstration avec des IDs uniques
+    with open(DEMO_FILE, "r", encoding="utf-8") as f:
+        demo = json.load(f)
+    return [dict(demo[i % len(demo)], id=i + 1) for i in range(count)]
+
+
+def legacy_from_dict(data):
+    # Ancien chemin de référence : constructeur complet (validation, ID et
+    # horodatage jetés) puis écrasement des champs
+    task = SlottedTask(
+        title=data["title"],
+        description=data.get("description", ""),
+        priority=Priority[data["priority"].upper()],
+    )
+    task.id = data["id"]
+    task.status = Status[data["status"].upper()]
+    task.created_at = datetime.fromisoformat(data["created_at"])
+    task.completed_at = (
+        datetime.fromisoformat(data["completed_at"])
+        if data.get("completed_at")
+        else None
+    )
+    task.project_id = data.get("project_id")
+    return task
+
+
+def timed(label, function):
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed:7.2f} s")
+    return elapsed, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    tasks_data = scale_demo(args.count)
+    print(f"{args.count:,} tâches")
+
+    legacy_load, _ = timed(
+        "constructeur complet",
+        lambda: [legacy_from_dict(data) for data in tasks_data],
+    )
+    timed(
+        "from_dict (boucle)",
+        lambda: [SlottedTask.from_dict(data) for data in tasks_data],
+    )
+    fast_load, tasks = timed(
+        "from_dicts (lot)", lambda: SlottedTask.from_dicts(tasks_data)
+    )
+    print(f"  gain chargement            x{legacy_load / fast_load:.2f}")
+
+    slow_save, _ = timed("to_dict (boucle)", lambda: [task.to_dict() for task in tasks])
+    fast_save, _ = timed("to_dicts (lot)", lambda: SlottedTask.to_dicts(tasks))
+    print(f"  gain sérialisation         x{slow_save / fast_save:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Benchmark de passage à l'échelle : sauvegarde et chargement parallèles de
+ShardedTaskManager selon le nombre de shards (un processus et un fichier par
+shard)
+
+Usage : python -m benchmarks.bench_sharding [--count 400000] [--shards 1 2 4 8]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.bench_save import build_tasks
+from src.task_manager.sharding import ShardedTaskManager
+from src.task_manager.task import SlottedTask
+
+
+def default_shard_counts():
+    # Puissances de deux jusqu'au nombre de cœurs
+    counts = [1]
+    while counts[-1] * 2 <= (os.cpu_count() or 1):
+        counts.append(counts[-1] * 2)
+    return counts
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=400_000)
+    parser.add_argument("--shards", type=int, nargs="+", default=default_shard_counts())
+    args = parser.parse_args()
+
+    tasks = build_tasks(args.count)
+    print(f"{args.count:,} tâches, {os.cpu_count()} cœur(s)")
+    baseline = None
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for shards in args.shards:
+            storage_file = os.path.join(tmp_dir, f"tasks-{shards}.json")
+            with ShardedTaskManager(
+                storage_file, shards=shards, task_class=SlottedTask
+            ) as manager:
+                manager.import_tasks(tasks)
+                save_time = timed(manager.save_to_file)
+                load_time = timed(manager.load_from_file)
+                assert manager.get_statistics()["total_tasks"] == args.count
+
+            baseline = baseline or (save_time, load_time)
+            print(
+                f"  {shards:>2} shard(s)  sauvegarde {save_time:6.2f} s "
+                f"(x{baseline[0] / save_time:.2f})  chargement {load_time:6.2f} s "
+                f"(x{baseline[1] / load_time:.2f})"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark du snapshot binaire : sauvegarde et chargement comparés au JSON
+
+Usage : python -m benchmarks.bench_snapshot [--count 200000] [--repeat 3]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.bench_save import build_tasks
+from src.task_manager.snapshot import BinarySnapshotStorage
+from src.task_manager.storage import JSONFileStorage
+from src.task_manager.task import SlottedTask
+
+
+def timed(function, repeat):
+    # Meilleur temps sur plusieurs essais
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    tasks = build_tasks(args.count)
+    print(f"{args.count:,} tâches")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        storages = {
+            "json": JSONFileStorage(os.path.join(tmp_dir, "tasks.json")),
+            "json compact": JSONFileStorage(
+                os.path.join(tmp_dir, "compact.json"), compact=True
+            ),
+            "binaire": BinarySnapshotStorage(os.path.join(tmp_dir, "tasks.bin")),
+        }
+        results = {}
+        for label, storage in storages.items():
+            save_time, _ = timed(lambda: storage.save(tasks), args.repeat)
+            load_time, loaded = timed(lambda: storage.load(SlottedTask), args.repeat)
+            assert len(loaded) == len(tasks)
+            size = os.path.getsize(storage.filename)
+            results[label] = (save_time, load_time)
+            print(
+                f"  {label:<13} sauvegarde {save_time:6.2f} s  "
+                f"chargement {load_time:6.2f} s  {size / 1e6:7.1f} Mo"
+            )
+
+    binary_save, binary_load = results.pop("binaire")
+    for label, (json_save, json_load) in results.items():
+        print(
+            f"  binaire / {label:<13}: sauvegarde x{json_save / binary_save:.1f}, "
+            f"chargement x{json_load / binary_load:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
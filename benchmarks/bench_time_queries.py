@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark des requêtes par date : parcours de toutes les tâches contre les
+index triés sur created_at et completed_at
+
+Usage : python -m benchmarks.bench_time_queries [--count 500000]
+"""
+import argparse
+import heapq
+import time
+from datetime import datetime, timedelta
+
+from src.task_manager.manager import TaskManager
+from src.task_manager.task import SlottedTask
+
+START = datetime(2024, 1, 1)
+
+
+def build_tasks(count):
+    # Une tâche par minute, une sur quatre terminée une heure après
+    tasks = []
+    for i in range(count):
+        task = SlottedTask(f"Tâche {i}")
+        task.created_at = START + timedelta(minutes=i)
+        if i % 4 == 0:
+            task.completed_at = task.created_at + timedelta(hours=1)
+        tasks.append(task)
+    return tasks
+
+
+def timed(function, repeat=5):
+    # Meilleur temps sur plusieurs essais
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def compare(label, scan, indexed):
+    scan_time, expected = timed(scan)
+    index_time, result = timed(indexed)
+    assert result == expected, label
+    print(
+        f"  {label:<28} parcours {scan_time * 1000:8.2f} ms   "
+        f"index {index_time * 1000:8.3f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=500_000)
+    args = parser.parse_args()
+
+    manager = TaskManager(task_class=SlottedTask)
+    elapsed, _ = timed(lambda: setattr(manager, "tasks", build_tasks(args.count)), 1)
+    print(f"{args.count:,} tâches, chargement et index en {elapsed:.2f} s")
+    tasks = manager.tasks
+    end = START + timedelta(minutes=args.count)
+    day_start = end - timedelta(days=1)
+    hour_start = end - timedelta(hours=1)
+
+    compare(
+        "créées le dernier jour",
+        lambda: [t for t in tasks if day_start <= t.created_at < end],
+        lambda: manager.get_tasks_created_between(day_start, end),
+    )
+    compare(
+        "terminées la dernière heure",
+        lambda: sorted(
+            (
+                t
+                for t in tasks
+                if t.completed_at is not None and hour_start <= t.completed_at
+            ),
+            key=lambda t: t.completed_at,
+        ),
+        lambda: manager.get_tasks_completed_between(hour_start),
+    )
+    compare(
+        "10 plus récentes",
+        lambda: heapq.nlargest(10, tasks, key=lambda t: t.created_at),
+        lambda: manager.get_recent_tasks(10),
+    )
+    _, added = timed(lambda: manager.add_task("Nouvelle tâche"), 1)
+    elapsed, _ = timed(lambda: manager.get_task(added).mark_completed(), 1)
+    print(f"  mark_completed avec index    {elapsed * 1e6:8.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, List, Optional
+
+from .manager import _UNCHANGED, TaskManager
+from .search import write_index
+from .storage import StorageBackend
+from .task import Priority, Status, Task
+
+# Nombre de tâches traitées entre deux passages de main à la boucle
+CHUNK_SIZE = 10_000
+
+
+class AsyncTaskManager:
+    """Gestionnaire de tâches pour asyncio : les E/S ne bloquent pas la boucle"""
+
+    def __init__(
+        self,
+        storage_file="tasks.json",
+        debug=False,
+        task_class=Task,
+        storage=None,
+        executor=None,
+        search=False,
+        persist_search=False,
+    ):
+        # Toute la logique reste dans un TaskManager manipulé depuis la boucle
+        # uniquement ; le thread d'E/S ne voit que des copies des tâches
+        if storage is not None and storage.thread_bound:
+            raise ValueError(
+                f"Stockage {type(storage).__name__} lié à son thread, "
+                "incompatible avec le thread d'E/S"
+            )
+        self.manager = TaskManager(
+            storage_file,
+            debug,
+            task_class,
+            storage,
+            search=search,
+            persist_search=persist_search,
+        )
+        # Un seul thread d'E/S par défaut : les accès au backend restent
+        # sérialisés, comme avec le TaskManager synchrone
+        self._own_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="task-manager-io"
+        )
+        # Empêche un chargement et une sauvegarde de se chevaucher ; créé dans
+        # la boucle au premier usage (Python 3.8 lie un Lock à sa boucle)
+        self._io_lock = None
+        # Événement posé pendant un chargement : les mutations l'attendent et
+        # s'appliquent au gestionnaire chargé
+        self._loading = None
+
+    @property
+    def changes(self):
+        # Flux des changements : `async for change in manager.changes.watch()`
+        return self.manager.changes
+
+    def _lock(self):
+        if self._io_lock is None:
+            self._io_lock = asyncio.Lock()
+        return self._io_lock
+
+    async def _loaded(self) -> TaskManager:
+        # Gestionnaire à modifier, une fois l'éventuel chargement terminé
+        while self._loading is not None:
+            await self._loading.wait()
+        return self.manager
+
+    async def _run(self, function, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, function, *args)
+
+    # Mutations et lectures : exécutées dans la boucle, sans point d'attente
+    # interne, donc atomiques vis-à-vis des autres coroutines
+    # Les mutations attendent la fin d'un chargement en cours, les lectures
+    # voient l'ancien état jusqu'à la substitution
+
+    async def add_task(self, title, description="", priority=Priority.MEDIUM):
+        return (await self._loaded()).add_task(title, description, priority)
+
+    async def delete_task(self, task_id) -> bool:
+        return (await self._loaded()).delete_task(task_id)
+
+    async def add_tasks(self, items) -> List:
+        return (await self._loaded()).add_tasks(items)
+
+    async def delete_tasks(self, task_ids) -> int:
+        return (await self._loaded()).delete_tasks(task_ids)
+
+    async def update_many(
+        self, task_ids, status=None, priority=None, project_id=_UNCHANGED
+    ) -> int:
+        manager = await self._loaded()
+        return manager.update_many(task_ids, status, priority, project_id)
+
+    async def get_task(self, task_id) -> Optional[Task]:
+        return self.manager.get_task(task_id)
+
+    async def search(self, text, limit=None, prefix=True) -> List[Task]:
+        return self.manager.search(text, limit, prefix)
+
+    async def peek_next(self) -> Optional[Task]:
+        return self.manager.peek_next()
+
+    async def claim_next(self) -> Optional[Task]:
+        # Sans point d'attente après le chargement : deux coroutines ne
+        # prennent pas la même tâche
+        return (await self._loaded()).claim_next()
+
+    async def get_statistics(self):
+        return self.manager.get_statistics()
+
+    async def _iterate(self, tasks) -> AsyncIterator[Task]:
+        # Rend la main à la boucle tous les CHUNK_SIZE résultats
+        for start in range(0, len(tasks), CHUNK_SIZE):
+            for task in tasks[start : start + CHUNK_SIZE]:
+                yield task
+            await asyncio.sleep(0)
+
+    def iter_tasks(self) -> AsyncIterator[Task]:
+        # Les itérateurs parcourent un instantané pris à l'appel
+        return self._iterate(self.manager.tasks)
+
+    def iter_tasks_by_status(self, status: Status) -> AsyncIterator[Task]:
+        return self._iterate(self.manager.get_tasks_by_status(status))
+
+    def iter_tasks_by_priority(self, priority: Priority) -> AsyncIterator[Task]:
+        return self._iterate(self.manager.get_tasks_by_priority(priority))
+
+    def iter_tasks_by_project(self, project_id) -> AsyncIterator[Task]:
+        return self._iterate(self.manager.get_tasks_by_project(project_id))
+
+    # Persistance : la sérialisation et les E/S tournent dans l'exécuteur
+
+    async def _copy(self, tasks) -> List[Task]:
+        # Copie détachée, par morceaux pour ne pas monopoliser la boucle ; une
+        # tâche modifiée après sa copie reste suivie pour la sauvegarde suivante
+        copies = []
+        for start in range(0, len(tasks), CHUNK_SIZE):
+            copies.extend(task.copy() for task in tasks[start : start + CHUNK_SIZE])
+            await asyncio.sleep(0)
+        return copies
+
+    async def save_to_file(self, filename=None):
+        # Même contrat que TaskManager.save_to_file, sans bloquer la boucle
+        async with self._lock():
+            manager = self.manager
+            storage = manager._storage_for(filename)
+            primary = storage is manager.storage
+            full = not primary or manager._full_save_needed
+            tasks = list(manager._tasks.values())
+            changed = list(manager._changed.values())
+            deleted = set(manager._deleted)
+            if primary:
+                # Les modifications faites pendant l'écriture sont suivies à
+                # nouveau et partiront avec la sauvegarde suivante
+                manager._mark_saved()
+
+            try:
+                # Un backend qui n'écrit que les changements n'a pas besoin de
+                # la copie de toutes les tâches ; il le dit lui-même, son état
+                # (segments lus, taille du journal) pouvant l'exiger
+                if full:
+                    await self._run(storage.save, await self._copy(tasks))
+                elif not storage.needs_all_tasks():
+                    await self._run(
+                        storage.save_changes, None, await self._copy(changed), deleted
+                    )
+                else:
+                    copies = await self._copy(tasks)
+                    changed_ids = {task.id for task in changed}
+                    await self._run(
+                        storage.save_changes,
+                        copies,
+                        [copy for copy in copies if copy.id in changed_ids],
+                        deleted,
+                    )
+            except BaseException as e:
+                if primary:
+                    self._restore_changes(full, changed, deleted)
+                if isinstance(e, (IOError, OSError)):
+                    raise Exception(f"Erreur lors de la sauvegarde: {e}")
+                raise
+            if primary:
+                await self._save_search_index()
+
+    async def _save_search_index(self):
+        # L'index est figé sur la boucle puis l'instantané est écrit dans
+        # l'exécuteur, qui ne touche jamais les dicts vivants
+        manager = self.manager
+        index = manager.search_index
+        if manager.search_file is None or not index.modified:
+            return
+        data = index.dumps()
+        index.modified = False
+        try:
+            await self._run(write_index, manager.search_file, data)
+        except BaseException as e:
+            index.modified = True
+            if isinstance(e, (IOError, OSError)):
+                raise Exception(f"Erreur lors de la sauvegarde: {e}")
+            raise
+
+    def _restore_changes(self, full, changed, deleted):
+        # Échec : les changements de la sauvegarde ratée redeviennent en attente
+        manager = self.manager
+        if full:
+            manager._full_save_needed = True
+        for task in changed:
+            if manager._tasks.get(task.id) is task:
+                manager._changed.setdefault(task.id, task)
+        manager._deleted.update(
+            task_id for task_id in deleted if task_id not in manager._tasks
+        )
+
+    async def load_from_file(self, filename=None):
+        # Le nouveau gestionnaire et ses index sont construits dans l'exécuteur
+        # puis substitués d'un coup : la boucle ne voit jamais d'état partiel
+        async with self._lock():
+            current = self.manager
+            storage = current.storage
+            loaded = TaskManager(
+                current.storage_file,
+                current.debug,
+                current.task_class,
+                storage,
+                search=current.search_index is not None,
+                persist_search=current.search_file is not None,
+            )
+            # Le flux survit au chargement : abonnés et numéros continuent
+            loaded.changes = current.changes
+            # Les mutations du gestionnaire attendent la substitution ; une
+            # tâche modifiée directement pendant la lecture est remplacée par
+            # sa version chargée et ne doit pas atteindre le backend lu
+            self._loading = asyncio.Event()
+            current.storage = StorageBackend()
+            try:
+                await self._run(loaded.load_from_file, filename)
+                self.manager = loaded
+            finally:
+                current.storage = storage
+                loading, self._loading = self._loading, None
+                loading.set()
+
+    async def flush(self):
+        await self._run(self.manager.flush)
+
+    async def close(self):
+        # Attend les sauvegardes en cours puis libère le backend et l'exécuteur
+        async with self._lock():
+            await self._run(self.manager.storage.close)
+            await self._save_search_index()
+        if self._own_executor:
+            self._executor.shutdown(wait=True)
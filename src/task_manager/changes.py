@@ -0,0 +1,173 @@
+import asyncio
+import logging
+from contextlib import nullcontext
+from typing import AsyncIterator, List
+
+# Nombre de changements gardés par défaut pour les reprises (since)
+HISTORY = 10_000
+
+logger = logging.getLogger(__name__)
+
+
+class Change:
+    """Un changement numéroté : ajout, suppression ou champ modifié d'une tâche"""
+
+    __slots__ = ("sequence", "kind", "task_id", "task", "old", "new")
+
+    def __init__(self, sequence, kind, task, old=None, new=None):
+        self.sequence = sequence
+        # "add", "delete", le champ modifié ("status", "priority",
+        # "project_id", "completed_at"), ou "reset" quand toutes les tâches
+        # sont remplacées (chargement)
+        self.kind = kind
+        self.task_id = task.id if task is not None else None
+        self.task = task
+        self.old = old
+        self.new = new
+
+    def __repr__(self):
+        return (
+            f"Change({self.sequence}, {self.kind!r}, {self.task_id!r}, "
+            f"{self.old!r}, {self.new!r})"
+        )
+
+
+class ChangeFeed:
+    """Flux ordonné des changements du gestionnaire, avec reprise"""
+
+    def __init__(self, history=HISTORY):
+        # Les history derniers changements sont gardés pour since() ; 0 ne
+        # garde rien et sert seulement les abonnés
+        self.history = history
+        self.last_sequence = 0
+        # Anneau : les champs de chaque changement sont rangés dans des listes
+        # préallouées, sans objet créé par changement ni pression sur le
+        # ramasse-miettes ; les Change ne sont construits qu'à la lecture
+        # La case en plus protège la lecture du plus ancien changement gardé
+        # pendant l'écriture du suivant
+        size = history + 1 if history else 0
+        self._kinds = [None] * size
+        self._tasks = [None] * size
+        self._olds = [None] * size
+        self._news = [None] * size
+        self._subscribers = []
+        # publish est appelée par un seul thread à la fois : le gestionnaire,
+        # sous son verrou d'écriture pour ConcurrentTaskManager, qui remplace
+        # cette garde par ce même verrou pour les abonnements
+        self.guard = nullcontext()
+
+    def publish(self, kind, task, old=None, new=None):
+        # Sans verrou : un lecteur d'un autre thread ne lit que les cases des
+        # numéros déjà publiés
+        sequence = self.last_sequence + 1
+        if self.history:
+            slot = sequence % len(self._kinds)
+            self._kinds[slot] = kind
+            self._tasks[slot] = task
+            self._olds[slot] = old
+            self._news[slot] = new
+        self.last_sequence = sequence
+        subscribers = self._subscribers
+        if subscribers:
+            self._notify(subscribers, [Change(sequence, kind, task, old, new)])
+
+    def publish_many(self, kind, tasks):
+        # Un changement par tâche
+        for task in tasks:
+            self.publish(kind, task)
+
+    @staticmethod
+    def _notify(subscribers, changes):
+        # La mutation est déjà appliquée quand les abonnés sont appelés : une
+        # erreur d'abonné est journalisée, sans remonter dans le mutateur ni
+        # priver les autres abonnés du changement
+        for change in changes:
+            for callback in subscribers:
+                try:
+                    callback(change)
+                except Exception:
+                    logger.exception("Abonné %r en échec sur %r", callback, change)
+
+    def since(self, sequence) -> List[Change]:
+        # Changements postérieurs à sequence, dans l'ordre
+        # Lève ValueError si une partie n'est plus dans l'historique, ou si
+        # sequence n'a jamais été atteint (autre instance, redémarrage) : le
+        # consommateur doit alors tout relire
+        last = self.last_sequence
+        if sequence > last:
+            raise ValueError(f"Séquence {sequence} inconnue (dernière: {last})")
+        self._check_retained(sequence, last)
+        size = len(self._kinds)
+        changes = []
+        for number in range(sequence + 1, last + 1):
+            slot = number % size
+            changes.append(
+                Change(
+                    number,
+                    self._kinds[slot],
+                    self._tasks[slot],
+                    self._olds[slot],
+                    self._news[slot],
+                )
+            )
+        # Des changements publiés pendant la lecture ont pu réutiliser les
+        # cases les plus anciennes
+        self._check_retained(sequence, self.last_sequence)
+        return changes
+
+    def _check_retained(self, sequence, last):
+        oldest = last - self.history + 1
+        if sequence + 1 < oldest:
+            raise ValueError(
+                f"Changements depuis {sequence} sortis de l'historique "
+                f"(plus ancien: {oldest})"
+            )
+
+    def subscribe(self, callback, since=None):
+        # callback(change) est appelé à chaque changement, depuis le thread
+        # qui l'a fait ; avec since, les changements manqués sont d'abord
+        # rejoués, sans trou ni doublon
+        with self.guard:
+            missed = [] if since is None else self.since(since)
+            # Nouvelle liste : publish parcourt celle qu'il a lue
+            self._subscribers = self._subscribers + [callback]
+            if missed:
+                self._notify([callback], missed)
+
+    def unsubscribe(self, callback):
+        with self.guard:
+            self._subscribers = [
+                subscriber for subscriber in self._subscribers if subscriber != callback
+            ]
+
+    async def watch(self, since=None) -> AsyncIterator[Change]:
+        # Itérateur asynchrone des changements postérieurs à since (par
+        # défaut, à partir de maintenant) ; demande un historique, et un
+        # consommateur plus lent que lui reçoit ValueError
+        loop = asyncio.get_running_loop()
+        wakeup = asyncio.Event()
+
+        def notify(change):
+            if not wakeup.is_set():
+                try:
+                    loop.call_soon_threadsafe(wakeup.set)
+                except RuntimeError:
+                    # Boucle fermée sans que l'itérateur soit refermé
+                    pass
+
+        with self.guard:
+            position = self.last_sequence if since is None else since
+            self._subscribers = self._subscribers + [notify]
+        try:
+            while True:
+                # Remis à zéro avant la lecture : un changement publié pendant
+                # le parcours réveille la boucle suivante
+                wakeup.clear()
+                changes = self.since(position)
+                if not changes:
+                    await wakeup.wait()
+                for change in changes:
+                    position = change.sequence
+                    yield change
+        finally:
+            self.unsubscribe(notify)
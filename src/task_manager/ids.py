@@ -0,0 +1,84 @@
+import itertools
+import threading
+import time
+import uuid
+from datetime import datetime
+
+# Époque des identifiants ordonnés dans le temps : 2020-01-01T00:00:00 UTC
+EPOCH_MS = 1577836800000
+
+# Répartition des 63 bits utiles : 41 bits de millisecondes (~69 ans),
+# 10 bits de nœud et 12 bits de séquence par milliseconde
+NODE_BITS = 10
+SEQUENCE_BITS = 12
+MAX_NODE_ID = (1 << NODE_BITS) - 1
+MAX_SEQUENCE = (1 << SEQUENCE_BITS) - 1
+TIMESTAMP_SHIFT = NODE_BITS + SEQUENCE_BITS
+
+
+class CounterIdGenerator:
+    """Générateur d'IDs entiers séquentiels"""
+
+    def __init__(self, start=1):
+        # itertools.count est atomique sous le GIL : pas besoin de verrou
+        self._counter = itertools.count(start)
+
+    def __call__(self):
+        return next(self._counter)
+
+
+class TimeOrderedIdGenerator:
+    """Générateur d'IDs entiers 64 bits ordonnés dans le temps (type Snowflake)"""
+
+    def __init__(self, node_id=0, clock=time.time):
+        # Validation de l'identifiant de nœud
+        if not 0 <= node_id <= MAX_NODE_ID:
+            raise ValueError(
+                f"L'identifiant de nœud doit être entre 0 et {MAX_NODE_ID}"
+            )
+
+        self.node_id = node_id
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._sequence = 0
+
+    def __call__(self):
+        with self._lock:
+            now_ms = int(self._clock() * 1000) - EPOCH_MS
+            # Si l'horloge recule, on reste sur la dernière milliseconde émise
+            # pour garantir des IDs strictement croissants
+            if now_ms <= self._last_ms:
+                self._sequence = (self._sequence + 1) & MAX_SEQUENCE
+                if self._sequence == 0:
+                    # Séquence épuisée : on emprunte la milliseconde suivante
+                    self._last_ms += 1
+            else:
+                self._last_ms = now_ms
+                self._sequence = 0
+
+            return (
+                (self._last_ms << TIMESTAMP_SHIFT)
+                | (self.node_id << SEQUENCE_BITS)
+                | self._sequence
+            )
+
+    @staticmethod
+    def min_id_at(moment: datetime) -> int:
+        # Plus petit ID qu'on peut générer à l'instant donné
+        # Sert de borne pour les recherches par plage de création
+        ms = int(moment.timestamp() * 1000) - EPOCH_MS
+        return max(ms, 0) << TIMESTAMP_SHIFT
+
+    @staticmethod
+    def datetime_of(task_id: int) -> datetime:
+        # Instant de génération encodé dans un ID
+        ms = (task_id >> TIMESTAMP_SHIFT) + EPOCH_MS
+        return datetime.fromtimestamp(ms / 1000)
+
+
+class UUIDIdGenerator:
+    """Générateur d'IDs UUID4 sous forme de chaîne hexadécimale"""
+
+    def __call__(self):
+        return uuid.uuid4().hex
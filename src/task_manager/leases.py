@@ -0,0 +1,287 @@
+import heapq
+import itertools
+import json
+import os
+from contextlib import contextmanager
+from typing import List, Optional
+
+from .storage import JournaledStorage, JSONFileStorage, SQLiteStorage, atomic_write
+from .task import Status
+
+try:
+    import fcntl
+except ImportError:  # Windows : pas de verrou consultatif flock
+    fcntl = None
+
+# Nombre d'entrées périmées toléré avant de reconstruire le tas des échéances
+_MIN_COMPACTION = 64
+
+
+def lease_file(storage_file) -> str:
+    # tasks.json -> tasks.leases.json
+    root, _ = os.path.splitext(storage_file)
+    return f"{root}.leases.json"
+
+
+class Lease:
+    """Bail d'un worker sur une tâche, jusqu'à une échéance (time.time())"""
+
+    __slots__ = ("task_id", "worker_id", "expires_at")
+
+    def __init__(self, task_id, worker_id, expires_at):
+        self.task_id = task_id
+        self.worker_id = worker_id
+        # None : tâche terminée sous ce bail, gardée par le registre partagé
+        # pour que les autres processus ne la reprennent pas
+        self.expires_at = expires_at
+
+    @property
+    def finished(self):
+        return self.expires_at is None
+
+    def __repr__(self):
+        return f"Lease({self.task_id!r}, {self.worker_id!r}, {self.expires_at!r})"
+
+
+class LeaseTable:
+    """Baux en mémoire : id -> bail, et tas des échéances"""
+
+    def __init__(self, keep_finished=False):
+        self._leases = {}
+        # Tas (échéance, numéro, bail) ; un bail renouvelé ou rendu laisse une
+        # entrée périmée, jetée quand elle arrive au sommet
+        self._heap = []
+        self._counter = itertools.count()
+        # Registre partagé : les tâches terminées restent marquées jusqu'à ce
+        # que leur complétion soit écrite dans le fichier de tâches
+        self.keep_finished = keep_finished
+        # Incrémentée quand des marqueurs sont retirés : une copie des tâches
+        # chargée à une génération antérieure doit relire leurs statuts
+        self.generation = 0
+        # Vrai si la table a changé depuis sa lecture
+        self.modified = False
+
+    def __len__(self):
+        return len(self._leases)
+
+    def __iter__(self):
+        return iter(list(self._leases.values()))
+
+    @contextmanager
+    def transaction(self):
+        # Table locale : déjà protégée par le verrou du gestionnaire
+        yield self
+
+    def get(self, task_id) -> Optional[Lease]:
+        return self._leases.get(task_id)
+
+    def put(self, lease):
+        # Pose ou renouvelle un bail
+        self._leases[lease.task_id] = lease
+        if not lease.finished:
+            entry = (lease.expires_at, next(self._counter), lease)
+            heapq.heappush(self._heap, entry)
+            self._compact()
+        self.modified = True
+
+    def remove(self, task_id) -> Optional[Lease]:
+        lease = self._leases.pop(task_id, None)
+        if lease is not None:
+            self.modified = True
+        return lease
+
+    def finish(self, lease):
+        # Bail rendu avec la tâche terminée
+        if self.keep_finished:
+            self.put(Lease(lease.task_id, lease.worker_id, None))
+        else:
+            self.remove(lease.task_id)
+
+    def expire(self, now) -> List[Lease]:
+        # Retire et retourne les baux échus à now ; O(1) tant qu'aucun
+        # n'échoit, O(log n) par bail échu
+        expired = []
+        heap = self._heap
+        leases = self._leases
+        while heap and heap[0][0] <= now:
+            lease = heapq.heappop(heap)[2]
+            if leases.get(lease.task_id) is lease:
+                del leases[lease.task_id]
+                expired.append(lease)
+        if expired:
+            self.modified = True
+        return expired
+
+    def _compact(self):
+        # Heartbeats fréquents : les entrées périmées ne doivent pas dominer
+        stale = len(self._heap) - len(self._leases)
+        if stale > _MIN_COMPACTION and stale > len(self._leases):
+            self._heap = [
+                (lease.expires_at, next(self._counter), lease)
+                for lease in self._leases.values()
+                if not lease.finished
+            ]
+            heapq.heapify(self._heap)
+
+
+class FileLeaseStore:
+    """Baux partagés entre processus : fichier JSON sous verrou flock"""
+
+    # Chaque processus a sa copie des tâches : les tâches terminées restent
+    # marquées dans le fichier de baux
+    keep_finished = True
+
+    def __init__(self, filename):
+        if fcntl is None:
+            raise RuntimeError("Baux partagés par fichier non supportés (flock)")
+        self.filename = filename
+        # Verrou sur un fichier voisin : le fichier de baux est remplacé à
+        # chaque écriture et ne peut pas porter le verrou lui-même
+        self.lock_file = f"{filename}.lock"
+
+    @contextmanager
+    def transaction(self):
+        # Lecture, modifications et réécriture sous verrou exclusif ; le
+        # fichier n'est réécrit que s'il a changé, et pas en cas d'erreur
+        with open(self.lock_file, "a") as lock:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                table = self._read()
+                yield table
+                if table.modified:
+                    atomic_write(self.filename, lambda f: self._write(f, table))
+            finally:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+    def _read(self) -> LeaseTable:
+        table = LeaseTable(keep_finished=True)
+        try:
+            with open(self.filename, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            data = {"generation": 0, "leases": []}
+        for task_id, worker_id, expires_at in data["leases"]:
+            table.put(Lease(task_id, worker_id, expires_at))
+        table.generation = data["generation"]
+        table.modified = False
+        return table
+
+    @staticmethod
+    def _write(f, table):
+        # Lignes [id, worker, échéance] : les IDs gardent leur type JSON
+        rows = [[lease.task_id, lease.worker_id, lease.expires_at] for lease in table]
+        data = {"generation": table.generation, "leases": rows}
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+
+
+class _SQLiteLeases:
+    """Baux de la table leases, dans la transaction en cours"""
+
+    def __init__(self, connection):
+        self._connection = connection
+
+    def get(self, task_id) -> Optional[Lease]:
+        row = self._connection.execute(
+            "SELECT worker_id, expires_at FROM leases WHERE task_id = ?", (task_id,)
+        ).fetchone()
+        return Lease(task_id, *row) if row else None
+
+    def put(self, lease):
+        # La tâche passe à in_progress dans la même transaction, même si la
+        # copie en mémoire de ce processus avait déjà ce statut
+        self._connection.execute(
+            "INSERT OR REPLACE INTO leases (task_id, worker_id, expires_at) "
+            "VALUES (?, ?, ?)",
+            (lease.task_id, lease.worker_id, lease.expires_at),
+        )
+        self._set_status([lease.task_id], Status.TODO, Status.IN_PROGRESS)
+
+    def remove(self, task_id) -> Optional[Lease]:
+        lease = self.get(task_id)
+        if lease is not None:
+            self._connection.execute(
+                "DELETE FROM leases WHERE task_id = ?", (task_id,)
+            )
+            self._set_status([task_id], Status.IN_PROGRESS, Status.TODO)
+        return lease
+
+    def finish(self, lease):
+        # Le statut done est écrit par le gestionnaire ; la ligne de tâche fait
+        # foi, aucun marqueur n'est gardé
+        self._connection.execute(
+            "DELETE FROM leases WHERE task_id = ?", (lease.task_id,)
+        )
+
+    def expire(self, now) -> List[Lease]:
+        # Une recherche dans l'index des échéances, vide tant qu'aucun bail
+        # n'échoit
+        expired = [
+            Lease(*row)
+            for row in self._connection.execute(
+                "SELECT task_id, worker_id, expires_at FROM leases "
+                "WHERE expires_at <= ?",
+                (now,),
+            )
+        ]
+        if expired:
+            self._connection.execute("DELETE FROM leases WHERE expires_at <= ?", (now,))
+            self._set_status(
+                [lease.task_id for lease in expired], Status.IN_PROGRESS, Status.TODO
+            )
+        return expired
+
+    def _set_status(self, task_ids, old, new):
+        self._connection.executemany(
+            "UPDATE tasks SET status = ? WHERE id = ? AND status = ?",
+            [(new.value, task_id, old.value) for task_id in task_ids],
+        )
+
+
+class SQLiteLeaseStore:
+    """Baux partagés entre processus : table leases de la base SQLite"""
+
+    # La ligne de tâche fait foi : aucun marqueur de tâche terminée
+    keep_finished = False
+
+    def __init__(self, storage):
+        # Même connexion que le stockage : ses écritures en attente sont
+        # validées avant chaque transaction de baux
+        self.storage = storage
+        storage._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS leases (
+                task_id PRIMARY KEY,
+                worker_id NOT NULL,
+                expires_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_leases_expires_at ON leases (expires_at);
+            """
+        )
+
+    @contextmanager
+    def transaction(self):
+        # BEGIN IMMEDIATE : un seul processus à la fois entre la lecture des
+        # baux et leur écriture ; les autres attendent le verrou de la base
+        storage = self.storage
+        storage.commit()
+        connection = storage._connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield _SQLiteLeases(connection)
+        except BaseException:
+            connection.rollback()
+            storage._pending = 0
+            raise
+        storage.commit()
+
+
+def shared_lease_store(storage):
+    # Registre partagé adapté au stockage : table de la base SQLite, ou
+    # fichier de baux à côté du fichier JSON
+    if isinstance(storage, SQLiteStorage):
+        return SQLiteLeaseStore(storage)
+    if isinstance(storage, (JSONFileStorage, JournaledStorage)):
+        return FileLeaseStore(lease_file(storage.filename))
+    raise ValueError(
+        f"Baux partagés non supportés par le stockage {type(storage).__name__}"
+    )
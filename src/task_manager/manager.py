@@ -1,103 +1,839 @@
 import json
+import time
+from contextlib import ExitStack
+from datetime import datetime
 from typing import List, Optional
 
+from .changes import HISTORY, ChangeFeed
+from .leases import Lease, LeaseTable, shared_lease_store
+from .query import Field, Query
+from .ready import ReadyQueue
+from .search import SearchIndex, search_file
+from .storage import JSONFileStorage
 from .task import Priority, Status, Task
+from .timeindex import TimeIndex
+from .write_behind import WriteBehindStorage
+
+# Valeur par défaut de update_many pour « projet inchangé » : None désassigne
+_UNCHANGED = object()
 
 
 class TaskManager:
     """Gestionnaire principal des tâches"""
 
-    def __init__(self, storage_file="tasks.json"):
-        # Initialise la liste des tâches vide et définit le fichier de stockage
+    def __init__(
+        self,
+        storage_file="tasks.json",
+        debug=False,
+        task_class=Task,
+        storage=None,
+        write_behind=False,
+        search=False,
+        persist_search=False,
+        shared_leases=False,
+        change_history=HISTORY,
+    ):
+        # Initialise l'index des tâches vide et définit le fichier de stockage
         # par défaut
-        self.tasks = []
+        # L'index id -> Task est un dict : il conserve l'ordre d'insertion et
+        # rend la recherche et la suppression en O(1) sans décaler de liste
+        self._tasks = {}
+        self._tasks_list = None
+        # Index secondaires : une valeur -> {id: Task} pour chaque champ filtré
+        self._by_status = {status: {} for status in Status}
+        self._by_priority = {priority: {} for priority in Priority}
+        self._by_project = {}
+        # Index triés par date de création et de complétion
+        self._by_created_at = TimeIndex()
+        self._by_completed_at = TimeIndex()
+        # Tâches TODO par priorité puis ancienneté, pour peek_next/claim_next
+        self._ready = ReadyQueue()
         self.storage_file = storage_file
+        # Backend de persistance : document JSON par défaut, JournaledStorage
+        # ou SQLiteStorage qui reçoivent chaque mutation au fil de l'eau
+        self.storage = storage or JSONFileStorage(storage_file)
+        # En écriture différée, les mutations et les sauvegardes sont confiées
+        # à un thread d'arrière-plan : save_to_file ne bloque plus l'appelant
+        if write_behind:
+            self.storage = WriteBehindStorage(self.storage)
+        # En mode debug, get_statistics vérifie les compteurs par un recomptage
+        self.debug = debug
+        # Classe des tâches créées et chargées (Task ou SlottedTask, plus compacte)
+        self.task_class = task_class
+        # Méthode liée créée une seule fois et partagée par toutes les tâches
+        self._listener = self._on_task_changed
+        # Modifications depuis la dernière sauvegarde : tâches ajoutées ou
+        # modifiées et IDs supprimés, pour les sauvegardes incrémentales
+        self._changed = {}
+        self._deleted = set()
+        # Vrai tant que le stockage n'a pas reçu l'ensemble des tâches ; un
+        # backend qui écrit chaque mutation est à jour sans chargement
+        self._full_save_needed = not self.storage.records_mutations
+        # Vrai une fois toutes les tâches en mémoire (chargement ou
+        # remplacement) : les index répondent alors sans interroger la base
+        self._holds_all_tasks = False
+        # Pendant update_many, les changements sont transmis au stockage par
+        # lot à la fin plutôt qu'un par un
+        self._defer_records = False
+        # Index plein texte optionnel des titres et descriptions ; persisté à
+        # côté du fichier de stockage, il n'est pas reconstruit au démarrage
+        self.search_index = SearchIndex() if search or persist_search else None
+        self.search_file = search_file(storage_file) if persist_search else None
+        # Flux numéroté des ajouts, suppressions et changements de champ :
+        # abonnés synchrones, itérateur asynchrone et reprise depuis un numéro
+        self.changes = ChangeFeed(change_history)
+        # Baux des workers (claim) connus de ce processus, avec leurs échéances
+        self._leases = LeaseTable()
+        # Registre qui arbitre les baux : la table locale, ou avec
+        # shared_leases un registre partagé entre processus par le stockage
+        # (table SQLite, fichier de baux à côté du fichier JSON)
+        self.lease_store = (
+            shared_lease_store(self.storage) if shared_leases else self._leases
+        )
+        # Génération du fichier de baux à laquelle cette copie des tâches a
+        # été lue ou mise à jour
+        self._lease_generation = 0
+
+    @property
+    def tasks(self) -> List[Task]:
+        # Copie de la liste des tâches dans l'ordre d'insertion : la modifier
+        # ne touche pas les index (passer par add_task, delete_task ou tasks =)
+        # La liste en cache n'est reconstruite qu'après une série de
+        # modifications ; seule sa copie, peu coûteuse, est faite à chaque accès
+        if self._tasks_list is None:
+            self._tasks_list = list(self._tasks.values())
+        return list(self._tasks_list)
+
+    @tasks.setter
+    def tasks(self, tasks):
+        # Remplace toutes les tâches et reconstruit les index
+        # tasks peut être un générateur lu en flux : les index actuels sont mis
+        # de côté et rétablis si la lecture échoue en cours de route
+        previous = {name: getattr(self, name) for name in self._INDEX_STATE}
+        try:
+            self._rebuild(tasks)
+        except BaseException:
+            for task in self._tasks.values():
+                task._listener = None
+            for name, value in previous.items():
+                setattr(self, name, value)
+            for task in self._tasks.values():
+                task._listener = self._listener
+            if self.search_index is not None:
+                with self.search_index.bulk():
+                    self.search_index.retain(self._tasks)
+                    for task in self._tasks.values():
+                        self.search_index.add(task)
+            raise
+        for task in previous["_tasks"].values():
+            if self._tasks.get(task.id) is not task:
+                task._listener = None
+        self.changes.publish("reset", None)
+
+    # Attributs remplacés par tasks et rétablis si le chargement échoue
+    _INDEX_STATE = (
+        "_tasks",
+        "_tasks_list",
+        "_by_status",
+        "_by_priority",
+        "_by_project",
+        "_by_created_at",
+        "_by_completed_at",
+        "_ready",
+        "_changed",
+        "_deleted",
+        "_full_save_needed",
+        "_holds_all_tasks",
+    )
+
+    def _rebuild(self, tasks):
+        # Index neufs, remplis au fil de l'itération de tasks
+        self._tasks = {}
+        self._tasks_list = None
+        self._by_status = {status: {} for status in Status}
+        self._by_priority = {priority: {} for priority in Priority}
+        self._by_project = {}
+        self._by_created_at = TimeIndex()
+        self._by_completed_at = TimeIndex()
+        self._ready = ReadyQueue()
+        self._changed = {}
+        self._deleted = set()
+        self._full_save_needed = True
+        self._holds_all_tasks = True
+        search_index = self.search_index
+        # Les index triés et la file des tâches à faire ne sont ordonnés qu'une
+        # fois, à la fin ; l'index plein texte garde les tâches dont le texte
+        # n'a pas changé
+        with ExitStack() as stack:
+            for index in (self._by_created_at, self._by_completed_at, self._ready):
+                stack.enter_context(index.bulk())
+            if search_index is not None:
+                stack.enter_context(search_index.bulk())
+            for task in tasks:
+                if task.id in self._tasks:
+                    raise ValueError(f"ID de tâche en double: {task.id}")
+                self._index(task)
+            if search_index is not None:
+                search_index.retain(self._tasks)
+
+    def _index(self, task):
+        # Ajoute la tâche à l'index principal et aux index secondaires
+        # puis s'abonne à ses changements pour garder les index à jour
+        self._tasks[task.id] = task
+        self._tasks_list = None
+        self._by_status[task.status][task.id] = task
+        self._by_priority[task.priority][task.id] = task
+        self._by_project.setdefault(task.project_id, {})[task.id] = task
+        self._by_created_at.add(task, task.created_at)
+        self._by_completed_at.add(task, task.completed_at)
+        if task.status == Status.TODO:
+            self._ready.push(task)
+        task._listener = self._listener
+        if self.search_index is not None:
+            self.search_index.add(task)
+
+    def _unindex(self, task):
+        # Retire la tâche de tous les index et se désabonne de ses changements
+        status, priority, project_id, completed_at = self._indexed_values(task)
+        task._listener = None
+        del self._tasks[task.id]
+        self._tasks_list = None
+        del self._by_status[status][task.id]
+        del self._by_priority[priority][task.id]
+        self._remove_from_project(project_id, task.id)
+        self._by_created_at.remove(task, task.created_at)
+        self._by_completed_at.remove(task, completed_at)
+        self._ready.discard(task.id)
+        self._leases.remove(task.id)
+        if self.search_index is not None:
+            self.search_index.remove(task.id)
+
+    def _indexed_values(self, task):
+        # Valeurs sous lesquelles la tâche est rangée dans les index
+        return task.status, task.priority, task.project_id, task.completed_at
+
+    def _remove_from_project(self, project_id, task_id):
+        # Les seaux de projet vides sont supprimés pour ne pas s'accumuler
+        bucket = self._by_project[project_id]
+        del bucket[task_id]
+        if not bucket:
+            del self._by_project[project_id]
+
+    def _on_task_changed(self, task, field, old, new):
+        # Déplace la tâche d'un seau à l'autre quand un champ indexé change
+        if field == "status":
+            del self._by_status[old][task.id]
+            self._by_status[new][task.id] = task
+            # Une tâche qui quitte TODO devient périmée dans la file
+            if old == Status.TODO:
+                self._ready.discard(task.id)
+            elif new == Status.TODO:
+                self._ready.push(task)
+        elif field == "priority":
+            del self._by_priority[old][task.id]
+            self._by_priority[new][task.id] = task
+            if task.id in self._ready:
+                self._ready.push(task)
+        elif field == "project_id":
+            self._remove_from_project(old, task.id)
+            self._by_project.setdefault(new, {})[task.id] = task
+        elif field == "completed_at":
+            self._by_completed_at.remove(task, old)
+            self._by_completed_at.add(task, new)
+        self._changed[task.id] = task
+        if not self._defer_records:
+            self.storage.record_update(task, field, new)
+        self.changes.publish(field, task, old, new)
 
     def add_task(self, title, description="", priority=Priority.MEDIUM):
-        # Crée une nouvelle tâche avec les paramètres fournis et l'ajoute à la liste
+        # Crée une nouvelle tâche avec les paramètres fournis et l'ajoute à l'index
         # Retourne l'ID unique de la tâche créée
-        task = Task(title, description, priority)
-        self.tasks.append(task)
+        task = self.task_class(title, description, priority)
+        # Un générateur remplacé peut produire un ID déjà chargé depuis un fichier
+        while self.get_task(task.id) is not None:
+            task.id = self.task_class.id_generator()
+        self._add(task)
         return task.id
 
+    def _add(self, task):
+        # Indexe une tâche neuve dont l'ID est libre et la transmet au stockage
+        self._index(task)
+        self._changed[task.id] = task
+        self._deleted.discard(task.id)
+        self.storage.record_add(task)
+        self.changes.publish("add", task)
+
+    def add_tasks(self, items) -> List:
+        # Ajout en masse : chaque élément est un titre ou un dict d'arguments
+        # de add_task ; tout est validé avant le premier ajout, si bien qu'une
+        # erreur laisse le gestionnaire inchangé
+        # Retourne les IDs créés, dans l'ordre
+        tasks = []
+        new_ids = set()
+        for item in items:
+            if isinstance(item, str):
+                task = self.task_class(item)
+            else:
+                task = self.task_class(**item)
+            while task.id in new_ids or self.get_task(task.id) is not None:
+                task.id = self.task_class.id_generator()
+            new_ids.add(task.id)
+            tasks.append(task)
+
+        for task in tasks:
+            self._index(task)
+            self._changed[task.id] = task
+            self._deleted.discard(task.id)
+        self.storage.record_add_many(tasks)
+        self.changes.publish_many("add", tasks)
+        return [task.id for task in tasks]
+
     def get_task(self, task_id) -> Optional[Task]:
-        # Recherche et retourne une tâche par son ID unique
+        # Recherche et retourne une tâche par son ID unique en O(1)
+        # Avec un backend interrogeable, une tâche absente de la mémoire est
+        # cherchée dans la base puis gardée dans l'index
         # Retourne None si aucune tâche n'est trouvée
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        task = self._tasks.get(task_id)
+        if task is None and self._storage_queries:
+            task = self.storage.get_task(task_id, self.task_class)
+            if task is not None:
+                self._index(task)
+        return task
+
+    @property
+    def _storage_queries(self) -> bool:
+        # Les requêtes vont au backend interrogeable tant que le gestionnaire
+        # n'en a lu qu'une partie ; après un chargement ou un remplacement des
+        # tâches, les index en mémoire sont complets et bien plus rapides que
+        # le décodage des lignes
+        # Avec des baux partagés, d'autres processus écrivent dans la base :
+        # elle seule est à jour
+        if not self.storage.supports_queries:
+            return False
+        return not self._holds_all_tasks or self.lease_store is not self._leases
+
+    def _materialize(self, tasks) -> List[Task]:
+        # Remplace les tâches lues en base par les objets déjà en mémoire,
+        # pour qu'une tâche n'ait qu'une seule instance suivie
+        result = []
+        for task in tasks:
+            existing = self._tasks.get(task.id)
+            if existing is None:
+                self._index(task)
+                existing = task
+            result.append(existing)
+        return result
 
     def get_tasks_by_status(self, status: Status) -> List[Task]:
-        # Filtre et retourne toutes les tâches ayant le statut spécifié
-        return [task for task in self.tasks if task.status == status]
+        # Retourne toutes les tâches ayant le statut spécifié depuis son seau
+        if self._storage_queries:
+            return self._materialize(
+                self.storage.get_tasks_by_status(status, self.task_class)
+            )
+        return list(self._by_status[status].values())
 
     def get_tasks_by_priority(self, priority: Priority) -> List[Task]:
-        # Filtre et retourne toutes les tâches ayant la priorité spécifiée
-        return [task for task in self.tasks if task.priority == priority]
+        # Retourne toutes les tâches ayant la priorité spécifiée depuis son seau
+        if self._storage_queries:
+            return self._materialize(
+                self.storage.get_tasks_by_priority(priority, self.task_class)
+            )
+        return list(self._by_priority[priority].values())
+
+    def get_tasks_by_project(self, project_id) -> List[Task]:
+        # Retourne toutes les tâches assignées au projet spécifié
+        if self._storage_queries:
+            return self._materialize(
+                self.storage.get_tasks_by_project(project_id, self.task_class)
+            )
+        return list(self._by_project.get(project_id, {}).values())
+
+    def get_tasks_created_between(self, start=None, end=None) -> List[Task]:
+        # Tâches créées dans [start, end), par date croissante, en O(log n + k)
+        # depuis l'index trié ; une borne None n'est pas limitée
+        if self._storage_queries:
+            return self._time_query("created_at", start, end).all()
+        return self._by_created_at.between(start, end)
+
+    def get_tasks_completed_between(self, start=None, end=None) -> List[Task]:
+        # Tâches terminées dans [start, end), par date de complétion croissante
+        if self._storage_queries:
+            return self._time_query("completed_at", start, end).all()
+        return self._by_completed_at.between(start, end)
+
+    def get_recent_tasks(self, count) -> List[Task]:
+        # Les count dernières tâches créées, la plus récente d'abord
+        if self._storage_queries:
+            return self._time_query("created_at", descending=True).limit(count).all()
+        return self._by_created_at.latest(count)
+
+    def get_recently_completed(self, count) -> List[Task]:
+        # Les count dernières tâches terminées, la plus récente d'abord
+        if self._storage_queries:
+            query = self._time_query("completed_at", descending=True)
+            return query.limit(count).all()
+        return self._by_completed_at.latest(count)
+
+    def _time_query(self, field, start=None, end=None, descending=False):
+        # Équivalent en requête, poussé à la base (colonnes indexées)
+        query = self.query(Field(field) != None)  # noqa: E711
+        if start is not None:
+            query.where(Field(field) >= start)
+        if end is not None:
+            query.where(Field(field) < end)
+        return query.order_by(f"-{field}" if descending else field)
+
+    def peek_next(self) -> Optional[Task]:
+        # Prochaine tâche à faire : statut TODO, priorité la plus haute puis
+        # création la plus ancienne ; None s'il n'y en a pas
+        # En O(log n) amorti depuis la file, ou par une requête en base
+        if self._storage_queries:
+            return self._next_query().first()
+        return self._ready.peek()
+
+    def claim_next(self) -> Optional[Task]:
+        # Retire la prochaine tâche de la file en la passant à IN_PROGRESS
+        # Retourne la tâche prise, ou None s'il n'y a rien à faire
+        task = self.peek_next()
+        if task is not None:
+            task.status = Status.IN_PROGRESS
+        return task
+
+    def _next_query(self):
+        return (
+            self.query(Field("status") == Status.TODO)
+            .order_by("-priority", "created_at")
+            .limit(1)
+        )
+
+    def claim(self, worker_id, ttl) -> Optional[Task]:
+        # Prend la prochaine tâche à faire pour worker_id : elle passe à
+        # IN_PROGRESS sous un bail de ttl secondes, que heartbeat prolonge ;
+        # un bail échu remet la tâche à TODO
+        # Avec shared_leases, plusieurs processus se partagent les tâches
+        # Retourne la tâche prise, ou None s'il n'y a rien à faire
+        now = time.time()
+        with self.lease_store.transaction() as leases:
+            self._reap(leases, now)
+            if self.lease_store.keep_finished:
+                self._catch_up(leases)
+            task = self.peek_next()
+            while task is not None:
+                current = leases.get(task.id)
+                if current is None:
+                    break
+                # Prise ou terminée par un autre processus : la copie locale suit
+                self._follow_lease(task, current)
+                task = self.peek_next()
+            if task is None:
+                return None
+            self._put_lease(leases, Lease(task.id, worker_id, now + ttl))
+            task.status = Status.IN_PROGRESS
+        return task
+
+    def heartbeat(self, task_id, worker_id, ttl) -> bool:
+        # Repousse à maintenant + ttl l'échéance du bail de worker_id
+        # Retourne False si le bail est perdu : échu ou repris par un autre
+        now = time.time()
+        with self.lease_store.transaction() as leases:
+            self._reap(leases, now)
+            if not self._holds(leases.get(task_id), worker_id):
+                return False
+            self._put_lease(leases, Lease(task_id, worker_id, now + ttl))
+        return True
+
+    def release(self, task_id, worker_id, done=True) -> bool:
+        # Rend le bail de worker_id : la tâche est terminée si done, remise à
+        # TODO sinon
+        # Retourne False si le bail est perdu
+        with self.lease_store.transaction() as leases:
+            self._reap(leases, time.time())
+            current = leases.get(task_id)
+            if not self._holds(current, worker_id):
+                return False
+            task = self.get_task(task_id)
+            if done:
+                leases.finish(current)
+                if task is not None:
+                    task.mark_completed()
+            else:
+                leases.remove(task_id)
+                if task is not None:
+                    task.status = Status.TODO
+            self._leases.remove(task_id)
+        return True
+
+    def get_lease(self, task_id) -> Optional[Lease]:
+        # Bail en cours sur la tâche, lu dans le registre
+        with self.lease_store.transaction() as leases:
+            self._reap(leases, time.time())
+            lease = leases.get(task_id)
+        return None if lease is None or lease.finished else lease
+
+    def reap_expired_leases(self, now=None) -> List:
+        # Remet à TODO les tâches dont le bail est échu ; claim, heartbeat et
+        # release le font déjà en passant. Les échéances sont dans un tas :
+        # tant qu'aucun bail n'échoit, rien n'est parcouru
+        # Retourne les IDs des tâches libérées
+        with self.lease_store.transaction() as leases:
+            return self._reap(leases, time.time() if now is None else now)
+
+    @staticmethod
+    def _holds(lease, worker_id):
+        return lease is not None and not lease.finished and lease.worker_id == worker_id
+
+    def _put_lease(self, leases, lease):
+        leases.put(lease)
+        if leases is not self._leases:
+            # Miroir local : son échéance déclenchera une relecture du registre
+            self._leases.put(lease)
+
+    def _reap(self, leases, now) -> List:
+        released = [lease.task_id for lease in leases.expire(now)]
+        if leases is not self._leases:
+            for task_id in released:
+                self._leases.remove(task_id)
+            # Baux vus par ce processus arrivés à échéance : le registre dit
+            # s'ils ont été renouvelés, terminés ou libérés entre-temps
+            for lease in self._leases.expire(now):
+                current = leases.get(lease.task_id)
+                if current is None:
+                    released.append(lease.task_id)
+                else:
+                    task = self._tasks.get(lease.task_id)
+                    if task is not None:
+                        self._follow_lease(task, current)
+        for task_id in released:
+            task = self._tasks.get(task_id)
+            if task is not None and task.status == Status.IN_PROGRESS:
+                task.status = Status.TODO
+        return released
+
+    def _forget_leases(self, task_ids):
+        # Une tâche supprimée n'a plus de bail ni de marqueur dans le registre
+        # partagé
+        if task_ids and self.lease_store is not self._leases:
+            with self.lease_store.transaction() as leases:
+                for task_id in task_ids:
+                    leases.remove(task_id)
+
+    def _prune_finished(self, leases):
+        # Appelée une fois les tâches écrites, sous le verrou du registre : les
+        # marqueurs des tâches terminées dans cette copie sont retirés ; les
+        # copies chargées avant relisent leurs statuts (_catch_up) en voyant
+        # la nouvelle génération
+        pruned = False
+        for lease in leases:
+            task = self._tasks.get(lease.task_id)
+            if lease.finished and task is not None and task.status == Status.DONE:
+                leases.remove(lease.task_id)
+                pruned = True
+        if pruned:
+            leases.generation += 1
+            self._lease_generation = leases.generation
+
+    def _catch_up(self, leases):
+        # Des marqueurs ont été retirés depuis la lecture de cette copie : les
+        # complétions correspondantes sont relues dans le stockage
+        if leases.generation == self._lease_generation:
+            return
+        try:
+            stored = self.storage.load(self.task_class)
+        except FileNotFoundError:
+            stored = []
+        for stored_task in stored:
+            task = self._tasks.get(stored_task.id)
+            if (
+                stored_task.status == Status.DONE
+                and task is not None
+                and task.status != Status.DONE
+                and self._leases.get(task.id) is None
+            ):
+                task.status = Status.DONE
+                task.completed_at = stored_task.completed_at
+        self._lease_generation = leases.generation
+
+    def _follow_lease(self, task, lease):
+        # Aligne la copie locale d'une tâche sur le bail d'un autre processus
+        if lease.finished:
+            self._leases.remove(task.id)
+            if task.status != Status.DONE:
+                task.mark_completed()
+        else:
+            self._leases.put(lease)
+            task.status = Status.IN_PROGRESS
+
+    def query(self, *predicates) -> Query:
+        # Requête composable : filtres F.<champ>, order_by, limit, offset,
+        # count ; servie par l'index le plus sélectif ou poussée à la base
+        return Query(self, predicates)
+
+    def _run_query(self, function, query):
+        return function(self, query)
+
+    def search(self, text, limit=None, prefix=True) -> List[Task]:
+        # Recherche plein texte dans les titres et descriptions, sans tenir
+        # compte des accents ni de la casse ; chaque mot peut être un début
+        # de mot si prefix
+        # Retourne les tâches contenant tous les mots, les plus pertinentes
+        # d'abord
+        if self.search_index is None:
+            raise RuntimeError("Recherche plein texte non activée (search=True)")
+        results = self.search_index.search(text, limit, prefix)
+        return [self._tasks[task_id] for task_id, _ in results]
+
+    def reindex_task(self, task_id) -> bool:
+        # Le titre, la description et created_at ne sont pas suivis : après
+        # les avoir modifiés, on réindexe la tâche
+        task = self.get_task(task_id)
+        if task is None:
+            return False
+        self._by_created_at.remove(task, task.created_at)
+        self._by_created_at.add(task, task.created_at)
+        if task.id in self._ready:
+            self._ready.push(task)
+        if self.search_index is not None:
+            self.search_index.add(task)
+        return True
 
     def delete_task(self, task_id) -> bool:
-        # Supprime une tâche de la liste en utilisant son ID
+        # Supprime une tâche de l'index en utilisant son ID, en O(1)
         # Retourne True si la tâche a été trouvée et supprimée, False sinon
-        for i, task in enumerate(self.tasks):
-            if task.id == task_id:
-                self.tasks.pop(i)
-                return True
-        return False
+        task = self.get_task(task_id)
+        if task is None:
+            return False
+        self._unindex(task)
+        self._changed.pop(task_id, None)
+        self._deleted.add(task_id)
+        self.storage.record_delete(task_id)
+        self._forget_leases([task_id])
+        self.changes.publish("delete", task)
+        return True
+
+    def delete_tasks(self, task_ids) -> int:
+        # Suppression en masse en une passe, IDs absents ou répétés ignorés
+        # Retourne le nombre de tâches supprimées
+        deleted = []
+        for task_id in task_ids:
+            task = self.get_task(task_id)
+            if task is None:
+                continue
+            self._unindex(task)
+            self._changed.pop(task_id, None)
+            self._deleted.add(task_id)
+            deleted.append(task)
+        task_ids = [task.id for task in deleted]
+        self.storage.record_delete_many(task_ids)
+        self._forget_leases(task_ids)
+        self.changes.publish_many("delete", deleted)
+        return len(deleted)
+
+    def update_many(
+        self, task_ids, status=None, priority=None, project_id=_UNCHANGED
+    ) -> int:
+        # Applique les mêmes valeurs à plusieurs tâches ; un champ omis reste
+        # inchangé (project_id=None désassigne le projet)
+        # Les index sont tenus à jour au fil des changements et le stockage
+        # reçoit un lot par champ modifié ; les tâches passées à DONE
+        # reçoivent aussi leur completed_at, celles qui quittent DONE le perdent
+        # Retourne le nombre de tâches trouvées
+        if status is not None and not isinstance(status, Status):
+            raise ValueError("Le statut doit être une instance de Status")
+        if priority is not None and not isinstance(priority, Priority):
+            raise ValueError("La nouvelle priorité doit être une instance de Priority")
+        changes = [
+            (field, value)
+            for field, value, unchanged in (
+                ("status", status, None),
+                ("priority", priority, None),
+                ("project_id", project_id, _UNCHANGED),
+            )
+            if value is not unchanged
+        ]
+
+        tasks = []
+        for task_id in dict.fromkeys(task_ids):
+            task = self.get_task(task_id)
+            if task is not None:
+                tasks.append(task)
+
+        self._defer_records = True
+        try:
+            for field, value in changes:
+                changed = [task for task in tasks if getattr(task, field) != value]
+                # Le statut les faisant quitter DONE, Task efface leur completed_at
+                reopened = [
+                    task
+                    for task in changed
+                    if field == "status" and task.status == Status.DONE
+                ]
+                for task in changed:
+                    setattr(task, field, value)
+                if changed:
+                    self.storage.record_update_many(changed, field, value)
+                if reopened:
+                    self.storage.record_update_many(reopened, "completed_at", None)
+                if field == "status" and value == Status.DONE and changed:
+                    # Comme mark_completed : les tâches passées à DONE sont
+                    # datées, une seule date pour tout le lot
+                    completed_at = datetime.now()
+                    for task in changed:
+                        task.completed_at = completed_at
+                    self.storage.record_update_many(
+                        changed, "completed_at", completed_at
+                    )
+        finally:
+            self._defer_records = False
+        return len(tasks)
 
     def save_to_file(self, filename=None):
-        # Sauvegarde toutes les tâches au format JSON dans un fichier
+        # Sauvegarde toutes les tâches via le backend de stockage, ou au format
+        # JSON dans le fichier indiqué
         # Gère les erreurs d'écriture en levant une exception explicite
-        filename = filename or self.storage_file
+        # Vers le stockage principal, seules les modifications depuis la
+        # dernière sauvegarde sont transmises, sauf après un remplacement
+        # complet des tâches
+        storage = self._storage_for(filename)
+        if storage is self.storage and self.lease_store.keep_finished:
+            # Sous le verrou du fichier de baux : les complétions écrites ne
+            # sont plus marquées dans le registre
+            with self.lease_store.transaction() as leases:
+                self._catch_up(leases)
+                self._save(storage)
+                self._prune_finished(leases)
+        else:
+            self._save(storage)
+        if storage is self.storage:
+            self._mark_saved()
+            self._save_search_index()
+
+    def _save(self, storage):
         try:
-            with open(filename, "w", encoding="utf-8") as f:
-                tasks_data = [task.to_dict() for task in self.tasks]
-                json.dump(tasks_data, f, indent=2, ensure_ascii=False)
+            if storage is self.storage and not self._full_save_needed:
+                storage.save_changes(
+                    self._tasks.values(), list(self._changed.values()), self._deleted
+                )
+            else:
+                storage.save(self.tasks)
         except (IOError, OSError) as e:
             raise Exception(f"Erreur lors de la sauvegarde: {e}")
 
+    def _save_search_index(self):
+        # L'index persisté n'est réécrit que s'il a changé
+        if self.search_file is not None and self.search_index.modified:
+            try:
+                self.search_index.save(self.search_file)
+            except (IOError, OSError) as e:
+                raise Exception(f"Erreur lors de la sauvegarde: {e}")
+
+    def _mark_saved(self):
+        # Le stockage est à jour : on oublie les modifications en attente
+        if self._full_save_needed:
+            tasks = self._tasks.values()
+        else:
+            tasks = self._changed.values()
+        for task in tasks:
+            task.mark_clean()
+        self._changed = {}
+        self._deleted = set()
+        self._full_save_needed = False
+
+    def has_unsaved_changes(self) -> bool:
+        # Vrai si une sauvegarde écrirait quelque chose
+        return self._full_save_needed or bool(self._changed or self._deleted)
+
     def load_from_file(self, filename=None):
-        # Charge les tâches depuis un fichier JSON et les reconstitue en objets Task
+        # Charge les tâches via le backend de stockage, ou depuis le fichier JSON
+        # indiqué, et les reconstitue en objets Task
         # Gère le cas où le fichier n'existe pas en initialisant une liste vide
-        filename = filename or self.storage_file
+        storage = self._storage_for(filename)
+        if storage is self.storage and self.search_file is not None:
+            # Seules les tâches nouvelles ou modifiées depuis l'écriture de
+            # l'index seront tokenisées
+            self.search_index.load(self.search_file)
+        if storage is self.storage and self.lease_store.keep_finished:
+            # Génération du fichier de baux à laquelle les tâches sont lues
+            with self.lease_store.transaction() as leases:
+                self._load(storage)
+                self._lease_generation = leases.generation
+        else:
+            self._load(storage)
+        # Chargées depuis le stockage principal, les tâches y sont déjà
+        if storage is self.storage:
+            self._full_save_needed = False
+
+    def _load(self, storage):
         try:
-            with open(filename, "r", encoding="utf-8") as f:
-                tasks_data = json.load(f)
-                self.tasks = [Task.from_dict(task_data) for task_data in tasks_data]
+            self.tasks = storage.load(self.task_class)
         except FileNotFoundError:
             # Si le fichier n'existe pas, on commence avec une liste vide
             self.tasks = []
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             raise Exception(f"Erreur lors du chargement: {e}")
 
+    def _storage_for(self, filename):
+        # Un nom de fichier explicite désigne un export/import JSON ponctuel
+        if filename is None or filename == self.storage_file:
+            return self.storage
+        return JSONFileStorage(filename)
+
+    def flush(self):
+        # Attend que les écritures différées soient faites
+        try:
+            self.storage.flush()
+        except (IOError, OSError) as e:
+            raise Exception(f"Erreur lors de la sauvegarde: {e}")
+
+    def close(self):
+        # Rend durables les écritures en attente et libère le backend
+        self.storage.close()
+        self._save_search_index()
+
     def get_statistics(self):
-        # Calcule et retourne les statistiques complètes des tâches :
+        # Retourne les statistiques complètes des tâches en O(1) :
         # - Nombre total de tâches
         # - Nombre de tâches terminées
         # - Répartition par priorité
         # - Répartition par statut
-        total_tasks = len(self.tasks)
-        completed_tasks = len(
-            [task for task in self.tasks if task.status == Status.DONE]
-        )
+        # Les compteurs sont les tailles des seaux des index secondaires,
+        # maintenus à chaque ajout, suppression, chargement et changement de Task
+        # Un backend interrogeable calcule les statistiques lui-même
+        if self._storage_queries:
+            return self.storage.get_statistics()
 
-        # Comptage par priorité
-        tasks_by_priority = {}
-        for priority in Priority:
-            tasks_by_priority[priority.value] = len(
-                [task for task in self.tasks if task.priority == priority]
-            )
+        stats = {
+            "total_tasks": len(self._tasks),
+            "completed_tasks": len(self._by_status[Status.DONE]),
+            "tasks_by_priority": {
+                priority.value: len(bucket)
+                for priority, bucket in self._by_priority.items()
+            },
+            "tasks_by_status": {
+                status.value: len(bucket) for status, bucket in self._by_status.items()
+            },
+        }
 
-        # Comptage par statut
-        tasks_by_status = {}
-        for status in Status:
-            tasks_by_status[status.value] = len(
-                [task for task in self.tasks if task.status == status]
-            )
+        if self.debug:
+            expected = self._recount_statistics()
+            if stats != expected:
+                raise RuntimeError(
+                    f"Statistiques incohérentes: {stats} au lieu de {expected}"
+                )
+
+        return stats
+
+    def _recount_statistics(self):
+        # Recalcule les statistiques par un parcours complet des tâches
+        # Utilisé en mode debug pour valider les compteurs incrémentaux
+        tasks_by_priority = {priority.value: 0 for priority in Priority}
+        tasks_by_status = {status.value: 0 for status in Status}
+        for task in self._tasks.values():
+            tasks_by_priority[task.priority.value] += 1
+            tasks_by_status[task.status.value] += 1
 
         return {
-            "total_tasks": total_tasks,
-            "completed_tasks": completed_tasks,
+            "total_tasks": len(self._tasks),
+            "completed_tasks": tasks_by_status[Status.DONE.value],
             "tasks_by_priority": tasks_by_priority,
             "tasks_by_status": tasks_by_status,
         }
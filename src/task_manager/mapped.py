@@ -0,0 +1,242 @@
+import mmap
+import struct
+from typing import Iterator, List, Optional
+
+from .columnar import (
+    NO_TIMESTAMP,
+    PRIORITIES,
+    PRIORITY_CODES,
+    STATUS_CODES,
+    STATUSES,
+    from_epoch_us,
+    to_epoch_us,
+)
+from .snapshot import (
+    ID_FLOAT,
+    ID_INT,
+    PROJECT_INT,
+    PROJECT_NONE,
+    PROJECT_STR,
+    bits_to_float,
+    encode_id,
+    encode_project,
+)
+from .storage import atomic_write
+from .task import Priority, SlottedTask, Status
+
+# En-tête : signature, version, nombre de tâches
+MAGIC = b"TMMP"
+VERSION = 1
+_HEADER = struct.Struct("<4sHQ")
+
+# Disposition du fichier, toutes sections contiguës :
+#   en-tête | statuts (1 octet/tâche) | priorités (1 octet/tâche)
+#   | enregistrements de taille fixe | tas de chaînes UTF-8
+# Les colonnes d'octets de statut et de priorité permettent de filtrer sans
+# toucher aux enregistrements ni décoder de chaîne
+# Enregistrement : type d'ID, type de projet, ID (64 bits), created_at,
+# completed_at, puis (offset, longueur) dans le tas pour le titre, la
+# description, l'ID texte et le projet
+_RECORD = struct.Struct("<BBqqqQIQIQIQI")
+
+
+def write_mapped_snapshot(filename, tasks):
+    # Écrit un snapshot projetable en mémoire, de façon atomique
+    tasks = list(tasks)
+    statuses = bytearray()
+    priorities = bytearray()
+    records = []
+    heap = bytearray()
+
+    def add_text(text):
+        # Ajoute une chaîne au tas et retourne (offset, longueur)
+        data = text.encode("utf-8")
+        offset = len(heap)
+        heap.extend(data)
+        return offset, len(data)
+
+    for task in tasks:
+        id_kind, id_bits, id_text = encode_id(task.id)
+        project_kind, project_text = encode_project(task.project_id)
+        completed_at = task.completed_at
+        statuses.append(STATUS_CODES[task.status])
+        priorities.append(PRIORITY_CODES[task.priority])
+        records.append(
+            _RECORD.pack(
+                id_kind,
+                project_kind,
+                id_bits,
+                to_epoch_us(task.created_at),
+                to_epoch_us(completed_at) if completed_at else NO_TIMESTAMP,
+                *add_text(task.title),
+                *add_text(task.description),
+                *add_text(id_text),
+                *add_text(project_text),
+            )
+        )
+
+    def write(f):
+        f.write(_HEADER.pack(MAGIC, VERSION, len(tasks)))
+        f.write(statuses)
+        f.write(priorities)
+        f.write(b"".join(records))
+        f.write(heap)
+
+    atomic_write(filename, write, binary=True)
+
+
+class MappedSnapshot:
+    """Snapshot en lecture seule projeté en mémoire, tâches créées à la demande"""
+
+    def __init__(self, filename, task_class=SlottedTask):
+        self.filename = filename
+        self.task_class = task_class
+        with open(filename, "rb") as f:
+            # La projection est partagée par tous les processus via le cache
+            # de pages : aucune copie des données par lecteur
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if len(self._map) < _HEADER.size:
+                raise ValueError("Snapshot projeté tronqué")
+            magic, version, count = _HEADER.unpack_from(self._map, 0)
+            if magic != MAGIC:
+                raise ValueError("Le fichier n'est pas un snapshot projetable")
+            if version != VERSION:
+                raise ValueError(f"Version de snapshot non supportée: {version}")
+            self._count = count
+            self._status_start = _HEADER.size
+            self._priority_start = self._status_start + count
+            self._records_start = self._priority_start + count
+            self._heap_start = self._records_start + count * _RECORD.size
+            if self._heap_start > len(self._map):
+                raise ValueError("Snapshot projeté corrompu: taille inattendue")
+        except Exception:
+            self._map.close()
+            raise
+
+        # Index id -> ligne construit au premier get_task seulement
+        self._rows = None
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def _text(self, offset, length):
+        start = self._heap_start + offset
+        return self._map[start : start + length].decode("utf-8")
+
+    def _decode_id(self, id_kind, id_bits, offset, length):
+        if id_kind == ID_INT:
+            return id_bits
+        if id_kind == ID_FLOAT:
+            return bits_to_float(id_bits)
+        return self._text(offset, length)
+
+    def __getitem__(self, row):
+        # Matérialise la tâche d'une ligne : seul cet enregistrement est décodé
+        if not 0 <= row < self._count:
+            raise IndexError(row)
+        (
+            id_kind,
+            project_kind,
+            id_bits,
+            created_at,
+            completed_at,
+            title_offset,
+            title_length,
+            description_offset,
+            description_length,
+            id_offset,
+            id_length,
+            project_offset,
+            project_length,
+        ) = _RECORD.unpack_from(self._map, self._records_start + row * _RECORD.size)
+
+        if project_kind == PROJECT_NONE:
+            project_id = None
+        else:
+            project_id = self._text(project_offset, project_length)
+            if project_kind == PROJECT_INT:
+                project_id = int(project_id)
+            elif project_kind != PROJECT_STR:
+                raise ValueError(f"Type de projet inconnu: {project_kind}")
+
+        return self.task_class._restore(
+            self._decode_id(id_kind, id_bits, id_offset, id_length),
+            self._text(title_offset, title_length),
+            self._text(description_offset, description_length),
+            PRIORITIES[self._map[self._priority_start + row]],
+            STATUSES[self._map[self._status_start + row]],
+            from_epoch_us(created_at),
+            None if completed_at == NO_TIMESTAMP else from_epoch_us(completed_at),
+            project_id,
+        )
+
+    def __iter__(self) -> Iterator:
+        for row in range(self._count):
+            yield self[row]
+
+    def get_task(self, task_id) -> Optional[SlottedTask]:
+        if self._rows is None:
+            # Seuls les enregistrements sont lus ; le tas ne l'est que pour les
+            # IDs texte
+            records = memoryview(self._map)[self._records_start : self._heap_start]
+            try:
+                self._rows = {
+                    self._decode_id(fields[0], fields[2], fields[9], fields[10]): row
+                    for row, fields in enumerate(_RECORD.iter_unpack(records))
+                }
+            finally:
+                records.release()
+        row = self._rows.get(task_id)
+        return None if row is None else self[row]
+
+    def _rows_with_code(self, start, code) -> List[int]:
+        # Parcourt la colonne d'octets avec mmap.find : la recherche tourne en C
+        # et seules les lignes trouvées sont visitées
+        needle = bytes([code])
+        end = start + self._count
+        rows = []
+        pos = self._map.find(needle, start, end)
+        while pos != -1:
+            rows.append(pos - start)
+            pos = self._map.find(needle, pos + 1, end)
+        return rows
+
+    def rows_by_status(self, status: Status) -> List[int]:
+        return self._rows_with_code(self._status_start, STATUS_CODES[status])
+
+    def rows_by_priority(self, priority: Priority) -> List[int]:
+        return self._rows_with_code(self._priority_start, PRIORITY_CODES[priority])
+
+    def get_tasks_by_status(self, status: Status) -> list:
+        return [self[row] for row in self.rows_by_status(status)]
+
+    def get_tasks_by_priority(self, priority: Priority) -> list:
+        return [self[row] for row in self.rows_by_priority(priority)]
+
+    def get_statistics(self):
+        # Comptages sur les colonnes d'octets, sans matérialiser de tâche
+        statuses = self._map[self._status_start : self._priority_start]
+        priorities = self._map[self._priority_start : self._records_start]
+        tasks_by_status = {
+            status.value: statuses.count(code) for status, code in STATUS_CODES.items()
+        }
+        return {
+            "total_tasks": self._count,
+            "completed_tasks": tasks_by_status[Status.DONE.value],
+            "tasks_by_priority": {
+                priority.value: priorities.count(code)
+                for priority, code in PRIORITY_CODES.items()
+            },
+            "tasks_by_status": tasks_by_status,
+        }
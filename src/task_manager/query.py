@@ -0,0 +1,613 @@
+import copy
+import heapq
+import itertools
+import operator
+from typing import List, Optional
+
+from .columnar import to_epoch_us
+from .task import Priority, Status, Task
+
+# Champs interrogeables : ce sont aussi les colonnes de SQLiteStorage
+FIELDS = (
+    "id",
+    "title",
+    "description",
+    "priority",
+    "status",
+    "created_at",
+    "completed_at",
+    "project_id",
+)
+
+# Champs pouvant valoir None : NULL en base
+_NULLABLE = ("completed_at", "project_id")
+
+# Les valeurs énumérées sont ordonnées par leur rang de déclaration : LOW < URGENT
+_ENUMS = {"priority": Priority, "status": Status}
+_RANKS = {
+    field: {member: rank for rank, member in enumerate(enum)}
+    for field, enum in _ENUMS.items()
+}
+
+_COMPARE = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+}
+_SQL_OPERATORS = {"lt": "<", "le": "<=", "gt": ">", "ge": ">="}
+
+# Champs date servis par un index trié du gestionnaire (_by_created_at, ...)
+_TIME_FIELDS = ("created_at", "completed_at")
+
+
+def _sql_value(field, value):
+    # Valeur Python vers sa forme en colonne SQLite
+    if field in _ENUMS:
+        return value.value
+    if field in ("created_at", "completed_at") and value is not None:
+        return to_epoch_us(value)
+    return value
+
+
+class Predicate:
+    """Filtre sur les tâches, combinable par &, | et ~"""
+
+    def __and__(self, other):
+        return And([self, other])
+
+    def __or__(self, other):
+        return Or([self, other])
+
+    def __invert__(self):
+        return Not(self)
+
+    def matches(self, task) -> bool:
+        raise NotImplementedError
+
+    def to_sql(self):
+        # (clause, paramètres), ou None si le filtre ne se traduit pas en SQL
+        return None
+
+    def candidates(self, manager):
+        # Collections de tâches d'un index contenant exactement les tâches
+        # qui vérifient le filtre, ou None si aucun index ne le sert
+        return None
+
+
+class Comparison(Predicate):
+    """Comparaison d'un champ à une valeur"""
+
+    def __init__(self, field, op, value):
+        self.field = field
+        self.op = op
+        self.value = value
+
+    def matches(self, task) -> bool:
+        value = getattr(task, self.field)
+        if self.op in ("eq", "ne"):
+            return _COMPARE[self.op](value, self.value)
+        # Comme en SQL, une valeur absente n'est ni avant ni après une autre
+        return value is not None and _COMPARE[self.op](value, self.value)
+
+    def to_sql(self):
+        field = self.field
+        value = _sql_value(field, self.value)
+        if self.op == "eq":
+            if value is None:
+                return f"{field} IS NULL", ()
+            return f"{field} = ?", (value,)
+        if self.op == "ne":
+            return f"{field} IS NOT ?", (value,)
+        return f"{field} {_SQL_OPERATORS[self.op]} ?", (value,)
+
+    def candidates(self, manager):
+        if self.op != "eq":
+            return None
+        if self.field == "id":
+            task = manager._tasks.get(self.value)
+            return [[task] if task is not None else []]
+        if self.field == "project_id":
+            return [manager._by_project.get(self.value, {}).values()]
+        return None
+
+
+class In(Predicate):
+    """Champ égal à l'une des valeurs données"""
+
+    def __init__(self, field, values):
+        self.field = field
+        self.values = tuple(dict.fromkeys(values))
+        self._lookup = frozenset(self.values)
+
+    def matches(self, task) -> bool:
+        return getattr(task, self.field) in self._lookup
+
+    def to_sql(self):
+        values = [_sql_value(self.field, v) for v in self.values if v is not None]
+        clauses = []
+        if values:
+            placeholders = ", ".join("?" * len(values))
+            clauses.append(f"{self.field} IN ({placeholders})")
+        if None in self._lookup:
+            clauses.append(f"{self.field} IS NULL")
+        if not clauses:
+            return "0", ()
+        return f"({' OR '.join(clauses)})", tuple(values)
+
+    def candidates(self, manager):
+        if self.field == "status":
+            return [manager._by_status[value].values() for value in self.values]
+        if self.field == "priority":
+            return [manager._by_priority[value].values() for value in self.values]
+        if self.field == "project_id":
+            return [
+                manager._by_project.get(value, {}).values() for value in self.values
+            ]
+        if self.field == "id":
+            tasks = (manager._tasks.get(value) for value in self.values)
+            return [[task for task in tasks if task is not None]]
+        return None
+
+
+class Contains(Predicate):
+    """Texte contenu dans un champ, sans tenir compte de la casse"""
+
+    def __init__(self, field, text):
+        self.field = field
+        self.text = text.casefold()
+
+    def matches(self, task) -> bool:
+        value = getattr(task, self.field)
+        return value is not None and self.text in value.casefold()
+
+    # Pas de traduction SQL : LIKE n'ignore la casse que pour l'ASCII, le
+    # filtre est appliqué aux lignes renvoyées par la base
+
+
+class And(Predicate):
+    """Toutes les conditions"""
+
+    def __init__(self, parts):
+        self.parts = []
+        for part in parts:
+            self.parts.extend(part.parts if isinstance(part, And) else [part])
+
+    def matches(self, task) -> bool:
+        return all(part.matches(task) for part in self.parts)
+
+    def to_sql(self):
+        return _join_sql(self.parts, " AND ")
+
+
+class Or(Predicate):
+    """Au moins une des conditions"""
+
+    def __init__(self, parts):
+        self.parts = []
+        for part in parts:
+            self.parts.extend(part.parts if isinstance(part, Or) else [part])
+
+    def matches(self, task) -> bool:
+        return any(part.matches(task) for part in self.parts)
+
+    def to_sql(self):
+        return _join_sql(self.parts, " OR ")
+
+
+class Not(Predicate):
+    """Négation d'une condition"""
+
+    def __init__(self, part):
+        self.part = part
+
+    def matches(self, task) -> bool:
+        return not self.part.matches(task)
+
+    def to_sql(self):
+        sql = self.part.to_sql()
+        if sql is None:
+            return None
+        # NULL compte comme faux, comme dans matches()
+        return f"NOT IFNULL({sql[0]}, 0)", sql[1]
+
+
+def _join_sql(parts, separator):
+    # Traduisible seulement si chaque partie l'est
+    clauses = []
+    params = []
+    for part in parts:
+        sql = part.to_sql()
+        if sql is None:
+            return None
+        clauses.append(sql[0])
+        params.extend(sql[1])
+    return f"({separator.join(clauses)})", tuple(params)
+
+
+class Field:
+    """Champ de Task à partir duquel on construit des filtres"""
+
+    def __init__(self, name):
+        if name not in FIELDS:
+            raise ValueError(f"Champ inconnu: {name}")
+        self.name = name
+
+    def _compare(self, op, value):
+        enum = _ENUMS.get(self.name)
+        if enum is None:
+            return Comparison(self.name, op, value)
+        if not isinstance(value, enum):
+            raise ValueError(
+                f"{self.name} se compare à une instance de {enum.__name__}"
+            )
+        # Sur un champ énuméré, toute comparaison devient une liste de valeurs,
+        # servie par les seaux du gestionnaire
+        ranks = _RANKS[self.name]
+        return In(
+            self.name,
+            [m for m in enum if _COMPARE[op](ranks[m], ranks[value])],
+        )
+
+    def __eq__(self, value):
+        return self._compare("eq", value)
+
+    def __ne__(self, value):
+        return self._compare("ne", value)
+
+    def __lt__(self, value):
+        return self._compare("lt", value)
+
+    def __le__(self, value):
+        return self._compare("le", value)
+
+    def __gt__(self, value):
+        return self._compare("gt", value)
+
+    def __ge__(self, value):
+        return self._compare("ge", value)
+
+    __hash__ = None
+
+    def in_(self, values):
+        values = list(values)
+        enum = _ENUMS.get(self.name)
+        if enum is not None and not all(isinstance(v, enum) for v in values):
+            raise ValueError(
+                f"{self.name} se compare à une instance de {enum.__name__}"
+            )
+        return In(self.name, values)
+
+    def contains(self, text):
+        return Contains(self.name, text)
+
+
+class F:
+    """Champs interrogeables : F.priority >= Priority.HIGH, F.title.contains("bug")"""
+
+    id = Field("id")
+    title = Field("title")
+    description = Field("description")
+    priority = Field("priority")
+    status = Field("status")
+    created_at = Field("created_at")
+    completed_at = Field("completed_at")
+    project_id = Field("project_id")
+
+
+class Query:
+    """Requête composable sur un TaskManager, exécutée à la demande"""
+
+    def __init__(self, manager, predicates=()):
+        self._manager = manager
+        self._predicates = []
+        self._order = []
+        self._limit = None
+        self._offset = 0
+        self.where(*predicates)
+
+    def where(self, *predicates) -> "Query":
+        # Les filtres successifs se cumulent (ET)
+        for predicate in predicates:
+            if isinstance(predicate, And):
+                self._predicates.extend(predicate.parts)
+            else:
+                self._predicates.append(predicate)
+        return self
+
+    def order_by(self, *fields) -> "Query":
+        # "created_at" croissant, "-created_at" décroissant ; les valeurs
+        # absentes viennent toujours en dernier
+        order = []
+        for name in fields:
+            descending = name.startswith("-")
+            order.append((Field(name.lstrip("-")).name, descending))
+        self._order = order
+        return self
+
+    def limit(self, count) -> "Query":
+        if count is not None and count < 0:
+            raise ValueError("La limite doit être positive")
+        self._limit = count
+        return self
+
+    def offset(self, count) -> "Query":
+        if count < 0:
+            raise ValueError("Le décalage doit être positif")
+        self._offset = count
+        return self
+
+    def all(self) -> List[Task]:
+        # Sans order_by, l'ordre est celui de l'index utilisé
+        return self._manager._run_query(_select, self)
+
+    def __iter__(self):
+        return iter(self.all())
+
+    def first(self) -> Optional[Task]:
+        query = copy.copy(self)
+        query._limit = 1 if self._limit is None else min(self._limit, 1)
+        tasks = query.all()
+        return tasks[0] if tasks else None
+
+    def count(self) -> int:
+        # Nombre de résultats, limite et décalage compris, sans construire la
+        # liste quand l'index suffit
+        return self._manager._run_query(_count, self)
+
+    def explain(self) -> dict:
+        # Plan choisi : base de données, index ou parcours complet
+        return self._manager._run_query(_explain, self)
+
+    def _page(self, total) -> int:
+        total = max(0, total - self._offset)
+        return total if self._limit is None else min(total, self._limit)
+
+
+class _DateRange:
+    """Comparaisons cumulées sur un champ date, servies par son index trié"""
+
+    def __init__(self, field, comparisons):
+        self.field = field
+        self.parts = comparisons
+        self.start = self.end = None
+        self.start_inclusive = True
+        self.end_inclusive = False
+        for comparison in comparisons:
+            value = comparison.value
+            if comparison.op in ("gt", "ge", "eq"):
+                inclusive = comparison.op != "gt"
+                if (
+                    self.start is None
+                    or value > self.start
+                    or (value == self.start and not inclusive)
+                ):
+                    self.start, self.start_inclusive = value, inclusive
+            if comparison.op in ("lt", "le", "eq"):
+                inclusive = comparison.op != "lt"
+                if (
+                    self.end is None
+                    or value < self.end
+                    or (value == self.end and not inclusive)
+                ):
+                    self.end, self.end_inclusive = value, inclusive
+
+    def candidates(self, manager):
+        index = getattr(manager, f"_by_{self.field}")
+        return [
+            index.range(self.start, self.end, self.start_inclusive, self.end_inclusive)
+        ]
+
+
+def _date_ranges(predicates) -> dict:
+    # Une plage par champ date comparé : created_at >= A et created_at < B
+    # deviennent une seule plage [A, B) de l'index trié
+    ranges = {}
+    for field in _TIME_FIELDS:
+        comparisons = [
+            p
+            for p in predicates
+            if isinstance(p, Comparison)
+            and p.field == field
+            and p.op != "ne"
+            and p.value is not None
+        ]
+        if comparisons:
+            ranges[field] = _DateRange(field, comparisons)
+    return ranges
+
+
+class _Plan:
+    """Source des candidats et filtres restant à appliquer en Python"""
+
+    __slots__ = (
+        "source",
+        "index",
+        "collections",
+        "size",
+        "residual",
+        "sql",
+        "ordered",
+    )
+
+    def __init__(
+        self, source, residual, index=None, collections=(), size=0, sql=None
+    ):
+        self.source = source
+        self.index = index
+        self.collections = collections
+        self.size = size
+        self.residual = residual
+        self.sql = sql
+        # Vrai si les candidats arrivent déjà dans l'ordre demandé
+        self.ordered = False
+
+
+def _plan(manager, query) -> _Plan:
+    predicates = query._predicates
+    if manager._storage_queries:
+        # Les filtres traduisibles sont poussés à la base, les autres sont
+        # appliqués aux lignes renvoyées
+        pushed = [p for p in predicates if p.to_sql() is not None]
+        residual = [p for p in predicates if p.to_sql() is None]
+        sql = _join_sql(pushed, " AND ") if pushed else None
+        return _Plan("sql", residual, sql=sql)
+
+    # Index le plus sélectif : celui qui propose le moins de candidats
+    ranges = _date_ranges(predicates)
+    sources = [(predicate, (predicate,)) for predicate in predicates]
+    sources.extend((date_range, date_range.parts) for date_range in ranges.values())
+    best = None
+    for source, covered in sources:
+        collections = source.candidates(manager)
+        if collections is None:
+            continue
+        size = sum(len(collection) for collection in collections)
+        if best is None or size < best[0]:
+            best = (size, source, covered, collections)
+    if best is None:
+        plan = _Plan(
+            "scan",
+            list(predicates),
+            collections=[manager._tasks.values()],
+            size=len(manager._tasks),
+        )
+    else:
+        size, chosen, covered, collections = best
+        residual = [p for p in predicates if all(p is not c for c in covered)]
+        plan = _Plan("index", residual, chosen.field, collections, size)
+
+    # Tri sur une date avec limite : l'index trié est parcouru dans l'ordre
+    # et le parcours s'arrête dès que la page est complète, en O(log n + k)
+    # quand les filtres restants retiennent la plupart des candidats
+    if len(query._order) == 1 and query._limit is not None:
+        field, descending = query._order[0]
+        date_range = ranges.get(field)
+        if best is not None and best[1] is not date_range:
+            return plan
+        if date_range is not None:
+            view = date_range.candidates(manager)[0]
+        elif field == "created_at":
+            # completed_at sans borne exclurait les tâches non terminées
+            view = manager._by_created_at.range()
+        else:
+            return plan
+        plan = _Plan(
+            "index",
+            plan.residual,
+            field,
+            [reversed(view) if descending else view],
+            len(view),
+        )
+        plan.ordered = True
+    return plan
+
+
+def _sort_key(field):
+    ranks = _RANKS.get(field)
+    if ranks is None:
+        return operator.attrgetter(field)
+    return lambda task: ranks[getattr(task, field)]
+
+
+def _split_missing(tasks, field):
+    present = []
+    missing = []
+    for task in tasks:
+        (missing if getattr(task, field) is None else present).append(task)
+    return present, missing
+
+
+def _ordered(tasks, order, needed):
+    # Tri multi-critères par passes stables, du dernier critère au premier ;
+    # avec un seul critère et une limite, seuls les premiers sont gardés
+    if len(order) == 1 and needed is not None:
+        field, descending = order[0]
+        present, missing = _split_missing(tasks, field)
+        select = heapq.nlargest if descending else heapq.nsmallest
+        top = select(needed, present, key=_sort_key(field))
+        return top + missing[: needed - len(top)]
+    tasks = list(tasks)
+    for field, descending in reversed(order):
+        present, missing = _split_missing(tasks, field)
+        present.sort(key=_sort_key(field), reverse=descending)
+        tasks = present + missing
+    return tasks
+
+
+def _sql_order(order) -> str:
+    terms = []
+    for field, descending in order:
+        ranks = _RANKS.get(field)
+        if ranks is None:
+            expression = field
+        else:
+            cases = " ".join(
+                f"WHEN '{member.value}' THEN {rank}" for member, rank in ranks.items()
+            )
+            expression = f"CASE {field} {cases} END"
+        if field in _NULLABLE:
+            terms.append(f"{field} IS NULL")
+        terms.append(f"{expression} DESC" if descending else expression)
+    terms.append("rowid")
+    return ", ".join(terms)
+
+
+def _matching(tasks, residual):
+    if not residual:
+        return tasks
+    return (task for task in tasks if all(p.matches(task) for p in residual))
+
+
+def _select_sql(manager, query, plan) -> List[Task]:
+    where, params = plan.sql or ("", ())
+    order = _sql_order(query._order)
+    if not plan.residual:
+        rows = manager.storage.query(
+            manager.task_class, where, params, order, query._limit, query._offset
+        )
+        return manager._materialize(rows)
+    rows = manager.storage.query(manager.task_class, where, params, order)
+    rows = _matching(rows, plan.residual)
+    end = None if query._limit is None else query._offset + query._limit
+    return manager._materialize(itertools.islice(rows, query._offset, end))
+
+
+def _select(manager, query) -> List[Task]:
+    plan = _plan(manager, query)
+    if plan.source == "sql":
+        return _select_sql(manager, query, plan)
+    tasks = _matching(itertools.chain.from_iterable(plan.collections), plan.residual)
+    end = None if query._limit is None else query._offset + query._limit
+    if query._order and not plan.ordered:
+        tasks = _ordered(tasks, query._order, end)
+    return list(itertools.islice(tasks, query._offset, end))
+
+
+def _count(manager, query) -> int:
+    plan = _plan(manager, query)
+    if plan.residual:
+        total = len(
+            _select(manager, copy.copy(query).limit(None).offset(0).order_by())
+        )
+    elif plan.source == "sql":
+        where, params = plan.sql or ("", ())
+        total = manager.storage.count(where, params)
+    else:
+        total = plan.size
+    return query._page(total)
+
+
+def _explain(manager, query) -> dict:
+    plan = _plan(manager, query)
+    explanation = {"source": plan.source, "residual": len(plan.residual)}
+    if plan.source == "sql":
+        explanation["where"] = plan.sql[0] if plan.sql else ""
+    else:
+        explanation["index"] = plan.index
+        explanation["candidates"] = plan.size
+        if plan.ordered:
+            explanation["ordered"] = True
+    return explanation
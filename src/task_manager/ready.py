@@ -0,0 +1,86 @@
+import heapq
+import itertools
+from contextlib import contextmanager
+from typing import Optional
+
+from .task import Priority
+
+# Rang négatif : le tas est un tas min, URGENT doit sortir en premier
+_URGENCY = {priority: -rank for rank, priority in enumerate(Priority)}
+
+# Nombre d'entrées périmées toléré avant de reconstruire le tas
+_MIN_COMPACTION = 64
+
+
+class ReadyQueue:
+    """File des tâches à faire : la plus prioritaire, puis la plus ancienne"""
+
+    def __init__(self):
+        # Tas d'entrées (urgence, created_at, numéro, tâche) ; le numéro
+        # départage deux dates égales par ordre d'arrivée et évite de comparer
+        # les tâches
+        self._heap = []
+        # id -> entrée vivante ; une entrée du tas absente d'ici est périmée et
+        # jetée quand elle arrive au sommet (suppression paresseuse)
+        self._entries = {}
+        self._counter = itertools.count()
+        self._bulk = False
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, task_id):
+        return task_id in self._entries
+
+    @contextmanager
+    def bulk(self):
+        # Chargement : ajouts en fin de tas puis un seul heapify en O(n)
+        self._bulk = True
+        try:
+            yield self
+        finally:
+            self._bulk = False
+            heapq.heapify(self._heap)
+
+    def push(self, task):
+        # Ajoute la tâche ou remplace son entrée (priorité ou date changée)
+        entry = (_URGENCY[task.priority], task.created_at, next(self._counter), task)
+        self._entries[task.id] = entry
+        if self._bulk:
+            self._heap.append(entry)
+        else:
+            heapq.heappush(self._heap, entry)
+        self._compact()
+
+    def discard(self, task_id):
+        # O(1) : l'entrée reste dans le tas jusqu'à ce qu'elle en sorte
+        if self._entries.pop(task_id, None) is not None:
+            self._compact()
+
+    def peek(self) -> Optional[object]:
+        # Tâche en tête, sans la retirer
+        heap = self._heap
+        entries = self._entries
+        while heap:
+            entry = heap[0]
+            if entries.get(entry[3].id) is entry:
+                return entry[3]
+            heapq.heappop(heap)
+        return None
+
+    def pop(self) -> Optional[object]:
+        task = self.peek()
+        if task is not None:
+            heapq.heappop(self._heap)
+            del self._entries[task.id]
+        return task
+
+    def _compact(self):
+        # Les entrées périmées ne sortent qu'en atteignant le sommet : quand
+        # elles dépassent les vivantes, le tas est reconstruit
+        if self._bulk:
+            return
+        stale = len(self._heap) - len(self._entries)
+        if stale > _MIN_COMPACTION and stale > len(self._entries):
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
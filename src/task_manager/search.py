@@ -0,0 +1,236 @@
+import bisect
+import heapq
+import marshal
+import math
+import os
+import re
+import unicodedata
+import zlib
+from collections import Counter
+from contextlib import contextmanager
+from typing import List, Tuple
+
+from .storage import atomic_write
+
+# Version du format du fichier d'index
+VERSION = 1
+
+# Un terme du titre compte double par rapport à un terme de la description
+TITLE_WEIGHT = 2
+# Un terme trouvé par préfixe compte moitié moins qu'un terme exact
+PREFIX_FACTOR = 0.5
+
+_WORD = re.compile(r"\w+")
+# Marques diacritiques isolées par la décomposition NFKD : é -> e + ◌́
+_MARKS = re.compile(r"[\u0300-\u036f]")
+
+
+def normalize(text) -> str:
+    # Minuscules sans accents : « Préparer » et « preparer » se confondent
+    if not text.isascii():
+        text = _MARKS.sub("", unicodedata.normalize("NFKD", text))
+    return text.casefold()
+
+
+def tokenize(text) -> List[str]:
+    return _WORD.findall(normalize(text)) if text else []
+
+
+def search_file(storage_file) -> str:
+    # tasks.json -> tasks.search.idx
+    root, _ = os.path.splitext(storage_file)
+    return f"{root}.search.idx"
+
+
+def write_index(filename, data):
+    # Écrit un instantané produit par SearchIndex.dumps
+    atomic_write(filename, lambda f: f.write(data), binary=True)
+
+
+def _checksum(task) -> int:
+    # Empreinte du texte indexé : une tâche dont le titre ou la description a
+    # changé est réindexée, les autres sont gardées telles quelles
+    return zlib.crc32(f"{task.title}\0{task.description}".encode("utf-8"))
+
+
+class SearchIndex:
+    """Index inversé des titres et descriptions, avec recherche par préfixe"""
+
+    def __init__(self):
+        # terme -> {id: poids}
+        self._postings = {}
+        # id -> (empreinte, termes) pour retirer ou comparer une tâche
+        self._documents = {}
+        # Vocabulaire trié : les termes d'un préfixe forment une plage (bisect)
+        self._terms = []
+        self._bulk = False
+        # Vrai si l'index a changé depuis son dernier chargement ou écriture
+        self.modified = False
+
+    def __len__(self):
+        return len(self._documents)
+
+    def __contains__(self, task_id):
+        return task_id in self._documents
+
+    @contextmanager
+    def bulk(self):
+        # Ajouts et retraits en masse : le vocabulaire est trié une seule fois
+        # à la fin au lieu d'une insertion triée par nouveau terme
+        self._bulk = True
+        try:
+            yield self
+        finally:
+            self._bulk = False
+            self._terms = sorted(self._postings)
+
+    def add(self, task):
+        # Indexe la tâche, ou la réindexe si son texte a changé
+        checksum = _checksum(task)
+        document = self._documents.get(task.id)
+        if document is not None:
+            if document[0] == checksum:
+                return
+            self.remove(task.id)
+        # Comptage en C : les termes du titre sont comptés TITLE_WEIGHT fois
+        weights = Counter(tokenize(task.title) * TITLE_WEIGHT)
+        weights.update(tokenize(task.description))
+        all_postings = self._postings
+        for term, weight in weights.items():
+            postings = all_postings.get(term)
+            if postings is None:
+                postings = all_postings[term] = {}
+                if not self._bulk:
+                    bisect.insort(self._terms, term)
+            postings[task.id] = weight
+        self._documents[task.id] = (checksum, tuple(weights))
+        self.modified = True
+
+    def remove(self, task_id):
+        document = self._documents.pop(task_id, None)
+        if document is None:
+            return
+        for term in document[1]:
+            postings = self._postings[term]
+            del postings[task_id]
+            if not postings:
+                del self._postings[term]
+                if not self._bulk:
+                    del self._terms[bisect.bisect_left(self._terms, term)]
+        self.modified = True
+
+    def retain(self, task_ids):
+        # Retire les tâches absentes de task_ids (conteneur d'IDs)
+        for task_id in [i for i in self._documents if i not in task_ids]:
+            self.remove(task_id)
+
+    def clear(self):
+        self._postings = {}
+        self._documents = {}
+        self._terms = []
+        self.modified = True
+
+    def _expand(self, term, prefix):
+        # Termes du vocabulaire correspondant à un terme de la requête
+        if not prefix:
+            return [term] if term in self._postings else []
+        terms = self._terms
+        start = bisect.bisect_left(terms, term)
+        end = start
+        while end < len(terms) and terms[end].startswith(term):
+            end += 1
+        return terms[start:end]
+
+    def search(self, text, limit=None, prefix=True) -> List[Tuple[object, float]]:
+        # Tâches contenant tous les termes de la requête, chacun pouvant être
+        # le début d'un mot si prefix, classées par score décroissant
+        # Score : somme des poids des termes, pondérés par leur rareté
+        query_terms = list(dict.fromkeys(tokenize(text)))
+        if not query_terms:
+            return []
+        count = len(self._documents)
+        # Termes du vocabulaire de chaque mot, avec leur coefficient
+        expansions = []
+        for term in query_terms:
+            tokens = []
+            for token in self._expand(term, prefix):
+                postings = self._postings[token]
+                factor = math.log(1 + count / len(postings))
+                if token != term:
+                    factor *= PREFIX_FACTOR
+                tokens.append((postings, factor))
+            if not tokens:
+                return []
+            expansions.append((sum(len(postings) for postings, _ in tokens), tokens))
+
+        # Le mot le plus rare donne les candidats ; pour les suivants, on
+        # sonde les candidats restants quand c'est moins cher que de parcourir
+        # toutes leurs listes
+        expansions.sort(key=lambda expansion: expansion[0])
+        scores = None
+        for size, tokens in expansions:
+            if scores is not None and len(scores) * len(tokens) < size:
+                scores = self._probe(scores, tokens)
+            else:
+                matches = {}
+                for postings, factor in tokens:
+                    for task_id, weight in postings.items():
+                        matches[task_id] = matches.get(task_id, 0) + weight * factor
+                if scores is not None:
+                    matches = {
+                        task_id: score + matches[task_id]
+                        for task_id, score in scores.items()
+                        if task_id in matches
+                    }
+                scores = matches
+            if not scores:
+                return []
+        if limit is not None:
+            return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+    @staticmethod
+    def _probe(scores, tokens):
+        # Garde les candidats présents dans au moins une des listes
+        result = {}
+        for task_id, score in scores.items():
+            found = False
+            for postings, factor in tokens:
+                weight = postings.get(task_id)
+                if weight is not None:
+                    score += weight * factor
+                    found = True
+            if found:
+                result[task_id] = score
+        return result
+
+    def dumps(self) -> bytes:
+        # Format marshal : les dicts de l'index sont relus en C, sans JSON à
+        # décoder ni boucle Python ; c'est un cache, reconstruit s'il est
+        # illisible (autre version de Python par exemple)
+        # L'instantané ne partage rien avec l'index et peut être écrit ailleurs
+        return marshal.dumps((VERSION, self._documents, self._postings))
+
+    def save(self, filename):
+        write_index(filename, self.dumps())
+        self.modified = False
+
+    def load(self, filename) -> bool:
+        # Remplace le contenu par celui du fichier, sans retokeniser ; un
+        # fichier absent, illisible ou d'un autre format laisse l'index vide
+        # et il sera reconstruit depuis les tâches
+        self.clear()
+        try:
+            with open(filename, "rb") as f:
+                version, documents, postings = marshal.loads(f.read())
+        except FileNotFoundError:
+            return False
+        except (EOFError, ValueError, TypeError):
+            return False
+        if version != VERSION:
+            return False
+        self._documents = documents
+        self._postings = postings
+        self._terms = sorted(postings)
+        self.modified = False
+        return True
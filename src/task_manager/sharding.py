@@ -0,0 +1,243 @@
+import multiprocessing
+import os
+import zlib
+from typing import List, Optional
+
+from .manager import TaskManager
+from .storage import JSONFileStorage
+from .task import Priority, Status, Task
+
+
+def shard_of(task_id, shard_count) -> int:
+    # Partition stable d'un ID : le hash() de Python est salé par processus
+    # pour les chaînes, ce qui déplacerait les tâches d'un redémarrage à l'autre
+    return zlib.crc32(str(task_id).encode("utf-8")) % shard_count
+
+
+def shard_file(storage_file, shard) -> str:
+    # tasks.json -> tasks.shard-0.json
+    root, ext = os.path.splitext(storage_file)
+    return f"{root}.shard-{shard}{ext}"
+
+
+# Opérations exécutées dans les processus de shard sur leur TaskManager
+
+
+def _add_task(manager, task):
+    if manager.get_task(task.id) is not None:
+        raise ValueError(f"ID de tâche en double: {task.id}")
+    manager._add(task)
+    return task.id
+
+
+def _import_tasks(manager, tasks):
+    for task in tasks:
+        _add_task(manager, task)
+    return len(tasks)
+
+
+def _update_task(manager, task_id, method, *args):
+    # Les tâches renvoyées au parent sont des copies : les modifications
+    # passent par le shard propriétaire
+    task = manager.get_task(task_id)
+    if task is None:
+        return False
+    getattr(task, method)(*args)
+    return True
+
+
+_OPERATIONS = {
+    "add": _add_task,
+    "import": _import_tasks,
+    "update": _update_task,
+    "get": TaskManager.get_task,
+    "delete": TaskManager.delete_task,
+    "by_status": TaskManager.get_tasks_by_status,
+    "by_priority": TaskManager.get_tasks_by_priority,
+    "by_project": TaskManager.get_tasks_by_project,
+    "statistics": TaskManager.get_statistics,
+    "save": TaskManager.save_to_file,
+    "load": TaskManager.load_from_file,
+}
+
+
+def _serve(connection, storage_file, task_class, storage_factory):
+    # Boucle d'un processus de shard : une requête, une réponse
+    storage = storage_factory(storage_file)
+    manager = TaskManager(storage_file, task_class=task_class, storage=storage)
+    while True:
+        operation, args = connection.recv()
+        if operation == "close":
+            manager.close()
+            connection.send(("ok", None))
+            return
+        try:
+            result = ("ok", _OPERATIONS[operation](manager, *args))
+        except Exception as e:
+            result = ("error", e)
+        try:
+            connection.send(result)
+        except Exception as e:
+            # Exception ou résultat non sérialisable
+            connection.send(("error", RuntimeError(repr(e))))
+
+
+class ShardedTaskManager:
+    """Gestionnaire réparti par ID sur plusieurs processus, un fichier par shard"""
+
+    def __init__(
+        self,
+        storage_file="tasks.json",
+        shards=None,
+        task_class=Task,
+        storage_factory=JSONFileStorage,
+    ):
+        # storage_factory(filename) est appelée dans chaque processus : un
+        # backend lié à son thread (SQLiteStorage) y est créé sur place
+        self.storage_file = storage_file
+        self.shard_count = shards or os.cpu_count() or 1
+        self.task_class = task_class
+        self._connections = []
+        self._processes = []
+        context = multiprocessing.get_context()
+        for shard in range(self.shard_count):
+            parent_end, child_end = context.Pipe()
+            process = context.Process(
+                target=_serve,
+                args=(
+                    child_end,
+                    shard_file(storage_file, shard),
+                    task_class,
+                    storage_factory,
+                ),
+                name=f"task-manager-shard-{shard}",
+                daemon=True,
+            )
+            process.start()
+            child_end.close()
+            self._connections.append(parent_end)
+            self._processes.append(process)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def _receive(connection):
+        status, value = connection.recv()
+        if status == "error":
+            raise value
+        return value
+
+    def _call(self, shard, operation, *args):
+        connection = self._connections[shard]
+        connection.send((operation, args))
+        return self._receive(connection)
+
+    def _broadcast(self, operation, *args) -> list:
+        # Toutes les requêtes partent avant la première réponse : les shards
+        # travaillent en parallèle
+        for connection in self._connections:
+            connection.send((operation, args))
+        return self._gather()
+
+    def _gather(self) -> list:
+        # Une réponse par shard, dans l'ordre ; toutes sont lues avant de
+        # lever une erreur pour garder les canaux alignés
+        results = []
+        error = None
+        for connection in self._connections:
+            try:
+                results.append(self._receive(connection))
+            except Exception as e:
+                error = error or e
+        if error is not None:
+            raise error
+        return results
+
+    def _route(self, task_id, operation, *args):
+        return self._call(shard_of(task_id, self.shard_count), operation, *args)
+
+    def add_task(self, title, description="", priority=Priority.MEDIUM):
+        # La tâche est validée et identifiée ici, puis confiée à son shard
+        task = self.task_class(title, description, priority)
+        return self._route(task.id, "add", task)
+
+    def import_tasks(self, tasks):
+        # Ajout en masse : un seul message par shard
+        batches = [[] for _ in range(self.shard_count)]
+        for task in tasks:
+            batches[shard_of(task.id, self.shard_count)].append(task)
+        for connection, batch in zip(self._connections, batches):
+            connection.send(("import", (batch,)))
+        return sum(self._gather())
+
+    def get_task(self, task_id) -> Optional[Task]:
+        # Copie de la tâche : la modifier ne change pas le shard
+        return self._route(task_id, "get", task_id)
+
+    def delete_task(self, task_id) -> bool:
+        return self._route(task_id, "delete", task_id)
+
+    def mark_completed(self, task_id) -> bool:
+        return self._route(task_id, "update", task_id, "mark_completed")
+
+    def update_priority(self, task_id, new_priority: Priority) -> bool:
+        if not isinstance(new_priority, Priority):
+            raise ValueError("La nouvelle priorité doit être une instance de Priority")
+        return self._route(task_id, "update", task_id, "update_priority", new_priority)
+
+    def assign_to_project(self, task_id, project_id) -> bool:
+        return self._route(task_id, "update", task_id, "assign_to_project", project_id)
+
+    def _merge(self, operation, *args) -> List[Task]:
+        # Résultats concaténés shard par shard
+        return [task for tasks in self._broadcast(operation, *args) for task in tasks]
+
+    def get_tasks_by_status(self, status: Status) -> List[Task]:
+        return self._merge("by_status", status)
+
+    def get_tasks_by_priority(self, priority: Priority) -> List[Task]:
+        return self._merge("by_priority", priority)
+
+    def get_tasks_by_project(self, project_id) -> List[Task]:
+        return self._merge("by_project", project_id)
+
+    def get_statistics(self):
+        # Somme des compteurs de chaque shard
+        stats = {
+            "total_tasks": 0,
+            "completed_tasks": 0,
+            "tasks_by_priority": {priority.value: 0 for priority in Priority},
+            "tasks_by_status": {status.value: 0 for status in Status},
+        }
+        for shard_stats in self._broadcast("statistics"):
+            stats["total_tasks"] += shard_stats["total_tasks"]
+            stats["completed_tasks"] += shard_stats["completed_tasks"]
+            for key in ("tasks_by_priority", "tasks_by_status"):
+                for value, count in shard_stats[key].items():
+                    stats[key][value] += count
+        return stats
+
+    def save_to_file(self):
+        # Chaque shard écrit son fichier en parallèle
+        self._broadcast("save")
+
+    def load_from_file(self):
+        self._broadcast("load")
+
+    def close(self):
+        # Ferme les backends puis attend la fin des processus
+        if not self._processes:
+            return
+        try:
+            self._broadcast("close")
+        finally:
+            for connection in self._connections:
+                connection.close()
+            for process in self._processes:
+                process.join()
+            self._connections = []
+            self._processes = []
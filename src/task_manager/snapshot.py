@@ -0,0 +1,298 @@
+import struct
+import sys
+from array import array
+from datetime import datetime
+from itertools import accumulate, compress, starmap
+from operator import attrgetter, itemgetter
+
+from .columnar import PRIORITIES, PRIORITY_CODES, STATUS_CODES, STATUSES
+from .storage import JSONFileStorage, StorageBackend, atomic_write
+from .task import Task
+
+# En-tête de fichier : signature, version du format, options, nombre de
+# tâches, nombre de projets distincts et taille en octets du tas de chaînes
+MAGIC = b"TMSN"
+VERSION = 3
+_HEADER = struct.Struct("<4sHHQQQ")
+
+# Disposition en colonnes, toutes sections contiguës après l'en-tête :
+#   priorités | statuts | types d'ID | présence de completed_at (1 octet par
+#   tâche) | types des projets (1 octet par projet distinct)
+#   | index du projet (uint32 par tâche) | ID (int64 par tâche)
+#   | created_at (11 octets par tâche) | completed_at présents (11 octets)
+#   | longueurs des chaînes (option TEXT_LENGTHS) | tas de chaînes UTF-8
+# Chaque colonne se décode en un appel C (bytes, array, struct.iter_unpack,
+# str.split) et les tâches sont construites par map : aucune boucle Python
+# par tâche dans le cas courant
+# Les dates sont stockées par leurs composantes (année, mois, ...,
+# microseconde), passées telles quelles au constructeur de datetime : ni
+# calcul ni timedelta par date
+# Le tas contient les projets distincts, puis titre et description de chaque
+# tâche, puis les ID texte, séparés par NUL ; si une chaîne contient NUL, les
+# longueurs (en caractères) sont écrites à part et le tas n'a pas de séparateur
+TEXT_LENGTHS = 1
+_SEPARATOR = "\x00"
+# Composantes d'une date : année, mois, jour, heure, minute, seconde,
+# microseconde
+_DATETIME = struct.Struct("<HBBBBBI")
+_datetime_fields = attrgetter(
+    "year", "month", "day", "hour", "minute", "second", "microsecond"
+)
+_INT64 = struct.Struct("<q")
+_FLOAT64 = struct.Struct("<d")
+
+_get_id = attrgetter("id")
+_get_title = attrgetter("title")
+_get_description = attrgetter("description")
+_get_priority = attrgetter("priority")
+_get_status = attrgetter("status")
+_get_created_at = attrgetter("created_at")
+_get_completed_at = attrgetter("completed_at")
+_get_project_id = attrgetter("project_id")
+# Codes indexés par identité des membres d'Enum (uniques) : le hachage d'un
+# membre passe par du code Python, celui de son id() non
+_PRIORITY_ID_CODES = {id(priority): code for priority, code in PRIORITY_CODES.items()}
+_STATUS_ID_CODES = {id(status): code for status, code in STATUS_CODES.items()}
+
+# Types d'ID et de project_id
+ID_INT = 0
+ID_FLOAT = 1
+ID_STR = 2
+PROJECT_NONE = 0
+PROJECT_STR = 1
+PROJECT_INT = 2
+
+
+def float_to_bits(value):
+    # Représentation IEEE 754 d'un flottant sous forme d'entier 64 bits
+    return _INT64.unpack(_FLOAT64.pack(value))[0]
+
+
+def bits_to_float(bits):
+    # Conversion inverse de float_to_bits
+    return _FLOAT64.unpack(_INT64.pack(bits))[0]
+
+
+def encode_id(task_id):
+    # Retourne (type, valeur 64 bits, texte)
+    if isinstance(task_id, bool):
+        raise ValueError(f"ID de tâche non supporté: {task_id!r}")
+    if isinstance(task_id, int):
+        return ID_INT, task_id, ""
+    if isinstance(task_id, float):
+        return ID_FLOAT, float_to_bits(task_id), ""
+    if isinstance(task_id, str):
+        return ID_STR, 0, task_id
+    raise ValueError(f"ID de tâche non supporté: {task_id!r}")
+
+
+def encode_project(project_id):
+    # Retourne (type, texte)
+    if project_id is None:
+        return PROJECT_NONE, ""
+    if isinstance(project_id, str):
+        return PROJECT_STR, project_id
+    if isinstance(project_id, int) and not isinstance(project_id, bool):
+        return PROJECT_INT, str(project_id)
+    raise ValueError(f"project_id non supporté: {project_id!r}")
+
+
+def _pack_column(typecode, values):
+    # Colonne numérique en little-endian
+    column = array(typecode, values)
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column.tobytes()
+
+
+def _unpack_column(typecode, data):
+    column = array(typecode)
+    column.frombytes(data)
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column
+
+
+def _pack_datetimes(moments):
+    # Un fuseau horaire ne tiendrait pas dans les composantes
+    if not set(map(datetime.utcoffset, moments)) <= {None}:
+        raise ValueError("Date avec fuseau horaire non supportée")
+    return b"".join(starmap(_DATETIME.pack, map(_datetime_fields, moments)))
+
+
+def _unpack_datetimes(data):
+    try:
+        return list(starmap(datetime, _DATETIME.iter_unpack(data)))
+    except ValueError:
+        raise ValueError("Snapshot binaire corrompu: date invalide") from None
+
+
+def dump_snapshot(f, tasks):
+    # Écrit les tâches au format binaire dans un fichier ouvert en mode binaire
+    tasks = list(tasks)
+    count = len(tasks)
+    ids = list(map(_get_id, tasks))
+    if set(map(type, ids)) <= {int}:
+        id_kinds = bytes(count)
+        id_texts = []
+    else:
+        encoded = [encode_id(task_id) for task_id in ids]
+        id_kinds = bytes(map(itemgetter(0), encoded))
+        ids = list(map(itemgetter(1), encoded))
+        id_texts = [text for kind, _, text in encoded if kind == ID_STR]
+    try:
+        id_column = _pack_column("q", ids)
+    except OverflowError:
+        raise ValueError("ID de tâche hors de l'intervalle 64 bits") from None
+
+    # Projets distincts numérotés dans l'ordre d'apparition
+    project_ids = list(map(_get_project_id, tasks))
+    if not set(map(type, project_ids)) <= {str, int, type(None)}:
+        # Projet d'un type non supporté (bool compris) : erreur explicite
+        for project_id in project_ids:
+            encode_project(project_id)
+    codes = {}
+    project_codes = [codes.setdefault(p, len(codes)) for p in project_ids]
+    projects = [encode_project(project_id) for project_id in codes]
+
+    completed_at = list(map(_get_completed_at, tasks))
+    texts = [None] * (2 * count)
+    texts[0::2] = map(_get_title, tasks)
+    texts[1::2] = map(_get_description, tasks)
+    texts[:0] = map(itemgetter(1), projects)
+    texts += id_texts
+
+    options = 0
+    heap = _SEPARATOR.join(texts)
+    if heap.count(_SEPARATOR) != max(len(texts) - 1, 0):
+        options |= TEXT_LENGTHS
+        heap = "".join(texts)
+    heap = heap.encode("utf-8")
+
+    f.write(_HEADER.pack(MAGIC, VERSION, options, count, len(codes), len(heap)))
+    priorities = map(id, map(_get_priority, tasks))
+    f.write(bytes(map(_PRIORITY_ID_CODES.__getitem__, priorities)))
+    statuses = map(id, map(_get_status, tasks))
+    f.write(bytes(map(_STATUS_ID_CODES.__getitem__, statuses)))
+    f.write(id_kinds)
+    f.write(bytes(map(bool, completed_at)))
+    f.write(bytes(map(itemgetter(0), projects)))
+    f.write(_pack_column("I", project_codes))
+    f.write(id_column)
+    f.write(_pack_datetimes(list(map(_get_created_at, tasks))))
+    f.write(_pack_datetimes(list(filter(None, completed_at))))
+    if options & TEXT_LENGTHS:
+        f.write(_pack_column("I", map(len, texts)))
+    f.write(heap)
+
+
+def _split_texts(heap, count, lengths):
+    # Découpe le tas en count chaînes
+    if lengths is None:
+        texts = heap.split(_SEPARATOR) if heap or count else []
+    else:
+        ends = list(accumulate(lengths))
+        if (ends[-1] if ends else 0) != len(heap):
+            raise ValueError("Snapshot binaire corrompu: tas de chaînes incohérent")
+        texts = list(map(heap.__getitem__, map(slice, [0] + ends[:-1], ends)))
+    if len(texts) != count:
+        raise ValueError("Snapshot binaire corrompu: tas de chaînes incohérent")
+    return texts
+
+
+def load_snapshot(data, task_class=Task):
+    # Reconstruit les tâches depuis le contenu binaire complet d'un snapshot
+    if len(data) < _HEADER.size:
+        raise ValueError("Snapshot binaire tronqué")
+    magic, version, options, count, project_count, heap_size = _HEADER.unpack_from(
+        data, 0
+    )
+    if magic != MAGIC:
+        raise ValueError("Le fichier n'est pas un snapshot binaire de tâches")
+    if version != VERSION:
+        raise ValueError(f"Version de snapshot non supportée: {version}")
+
+    offset = _HEADER.size
+
+    def take(size):
+        # Section suivante du fichier
+        nonlocal offset
+        start, offset = offset, offset + size
+        if offset > len(data):
+            raise ValueError("Snapshot binaire corrompu: taille inattendue")
+        return data[start:offset]
+
+    priorities = take(count)
+    statuses = take(count)
+    id_kinds = take(count)
+    completed_flags = take(count)
+    project_kinds = take(project_count)
+    project_codes = _unpack_column("I", take(4 * count))
+    ids = _unpack_column("q", take(8 * count)).tolist()
+    created_at = _unpack_datetimes(take(_DATETIME.size * count))
+    completed = _unpack_datetimes(
+        take(_DATETIME.size * (count - completed_flags.count(0)))
+    )
+    text_count = project_count + 2 * count + id_kinds.count(ID_STR)
+    lengths = None
+    if options & TEXT_LENGTHS:
+        lengths = _unpack_column("I", take(4 * text_count))
+    heap = take(heap_size)
+    if offset != len(data):
+        raise ValueError("Snapshot binaire corrompu: taille inattendue")
+    texts = _split_texts(heap.decode("utf-8"), text_count, lengths)
+
+    projects = [
+        None if kind == PROJECT_NONE else text if kind == PROJECT_STR else int(text)
+        for kind, text in zip(project_kinds, texts[:project_count])
+    ]
+    text_end = project_count + 2 * count
+    if id_kinds.count(ID_INT) != count:
+        # ID_INT vaut 0 : compress ne garde que les autres lignes
+        id_texts = iter(texts[text_end:])
+        for row in compress(range(count), id_kinds):
+            if id_kinds[row] == ID_STR:
+                ids[row] = next(id_texts)
+            else:
+                ids[row] = bits_to_float(ids[row])
+    completed = iter(completed)
+
+    return list(
+        map(
+            task_class._restore,
+            ids,
+            texts[project_count:text_end:2],
+            texts[project_count + 1 : text_end : 2],
+            map(PRIORITIES.__getitem__, priorities),
+            map(STATUSES.__getitem__, statuses),
+            created_at,
+            [next(completed) if flag else None for flag in completed_flags],
+            map(projects.__getitem__, project_codes),
+        )
+    )
+
+
+class BinarySnapshotStorage(StorageBackend):
+    """Stockage par snapshot binaire versionné, plus rapide que le JSON"""
+
+    def __init__(self, filename):
+        self.filename = filename
+
+    def load(self, task_class):
+        with open(self.filename, "rb") as f:
+            return load_snapshot(f.read(), task_class)
+
+    def save(self, tasks):
+        atomic_write(self.filename, lambda f: dump_snapshot(f, tasks), binary=True)
+
+
+def json_to_snapshot(json_file, snapshot_file):
+    # Convertit un fichier de tâches JSON en snapshot binaire
+    tasks = JSONFileStorage(json_file, stream=True).load(Task)
+    BinarySnapshotStorage(snapshot_file).save(tasks)
+
+
+def snapshot_to_json(snapshot_file, json_file, compact=False):
+    # Convertit un snapshot binaire en fichier de tâches JSON
+    tasks = BinarySnapshotStorage(snapshot_file).load(Task)
+    JSONFileStorage(json_file, compact=compact).save(tasks)
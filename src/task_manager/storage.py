@@ -0,0 +1,854 @@
+import itertools
+import json
+import os
+import sqlite3
+import time
+from datetime import datetime
+
+from .columnar import from_epoch_us, to_epoch_us
+from .task import Priority, Status, Task
+
+# Taille des blocs lus par le chargeur en flux
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def encode_field(field, value):
+    # Conversion d'une valeur de champ de Task vers sa forme JSON
+    if field in ("status", "priority"):
+        return value.value
+    if field == "completed_at":
+        return value.isoformat() if value else None
+    return value
+
+
+def decode_field(field, value):
+    # Conversion inverse de encode_field
+    if field == "status":
+        return Status(value)
+    if field == "priority":
+        return Priority(value)
+    if field == "completed_at":
+        return datetime.fromisoformat(value) if value else None
+    return value
+
+
+# Taille du tampon d'écriture des sauvegardes
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Encodeur compact réutilisé : pas d'indentation ni d'espaces superflus
+_COMPACT_ENCODER = json.JSONEncoder(
+    ensure_ascii=False, separators=(",", ":"), check_circular=False
+)
+
+
+def atomic_write(filename, write, binary=False):
+    # Écrit dans un fichier temporaire voisin, le force sur disque puis le
+    # substitue à la cible : un crash laisse l'ancien fichier intact
+    tmp_file = f"{filename}.tmp"
+    if binary:
+        open_file = open(tmp_file, "wb", buffering=WRITE_BUFFER_SIZE)
+    else:
+        open_file = open(
+            tmp_file, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE
+        )
+    try:
+        with open_file as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, filename)
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+
+
+def _batched(iterable, size):
+    # Découpe un itérable en listes d'au plus size éléments
+    iterator = iter(iterable)
+    batch = list(itertools.islice(iterator, size))
+    while batch:
+        yield batch
+        batch = list(itertools.islice(iterator, size))
+
+
+def write_tasks_compact(f, tasks, batch_size=1000):
+    # Encode les tâches par lots dans le flux tamponné, sans construire la
+    # liste complète des dicts ni le document entier en mémoire
+    # Un lot est encodé comme un tableau dont on retire les crochets : un seul
+    # appel à l'encodeur C par lot au lieu d'un par tâche
+    encode = _COMPACT_ENCODER.encode
+    write = f.write
+    write("[")
+    separator = ""
+    for batch in _batched(tasks, batch_size):
+        write(separator)
+        write(encode(Task.to_dicts(batch))[1:-1])
+        separator = ","
+    write("]")
+
+
+def iter_task_dicts(f, chunk_size=STREAM_CHUNK_SIZE):
+    # Parcourt un tableau JSON de premier niveau élément par élément
+    # Seul le bloc courant et l'élément en cours de décodage sont en mémoire
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def fill():
+        # Ajoute un bloc au tampon en abandonnant la partie déjà décodée
+        nonlocal buffer, pos, eof
+        chunk = f.read(chunk_size)
+        if not chunk:
+            eof = True
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+    def skip_whitespace():
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos].isspace():
+                pos += 1
+            if pos < len(buffer) or eof:
+                return
+            fill()
+
+    skip_whitespace()
+    if buffer[pos : pos + 1] != "[":
+        raise ValueError("Le fichier de tâches doit contenir un tableau JSON")
+    pos += 1
+
+    # Premier élément, ou élément attendu après une virgule
+    expect_value = True
+    first = True
+    while True:
+        skip_whitespace()
+        if pos >= len(buffer):
+            raise ValueError("Tableau JSON de tâches incomplet")
+        char = buffer[pos]
+        if char == "]" and (first or not expect_value):
+            return
+        if not expect_value:
+            if char != ",":
+                raise ValueError(f"Virgule attendue dans le tableau JSON: {char!r}")
+            pos += 1
+            expect_value = True
+            continue
+
+        # Décodage d'un élément ; s'il est coupé par la fin du bloc, on relit
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                fill()
+                continue
+            # Un nombre coupé par la fin du bloc se décode en un préfixe valide :
+            # on n'accepte l'élément qu'une fois le séparateur suivant visible
+            after = end
+            while after < len(buffer) and buffer[after].isspace():
+                after += 1
+            if not eof and (after == len(buffer) or buffer[after] not in ",]"):
+                fill()
+                continue
+            break
+        pos = end
+        expect_value = False
+        first = False
+        yield value
+
+
+def iter_tasks_from_file(filename, task_class=Task, chunk_size=STREAM_CHUNK_SIZE):
+    # Générateur de Task depuis un fichier JSON, en mémoire constante
+    # Permet de traiter des fichiers plus gros que la RAM
+    with open(filename, "r", encoding="utf-8") as f:
+        # Les fichiers de stockage sont écrits par to_dict : chemin rapide
+        from_trusted_dict = task_class.from_trusted_dict
+        for task_data in iter_task_dicts(f, chunk_size):
+            yield from_trusted_dict(task_data)
+
+
+class StorageBackend:
+    """Interface commune des backends de persistance du TaskManager"""
+
+    # Un backend qui sait répondre aux requêtes (get_task, get_tasks_by_*,
+    # get_statistics) les reçoit du gestionnaire au lieu des index en mémoire
+    supports_queries = False
+    # Un backend qui écrit chaque mutation au fil de l'eau reste à jour sans
+    # chargement préalable : le gestionnaire ne lui demande une réécriture
+    # complète (save) qu'après un remplacement des tâches
+    records_mutations = False
+    # Un backend lié au thread qui l'a ouvert (connexion SQLite) ne peut pas
+    # être confié à un thread d'E/S
+    thread_bound = False
+
+    def load(self, task_class):
+        # Retourne la liste des tâches persistées
+        raise NotImplementedError
+
+    def save(self, tasks):
+        # Persiste l'ensemble des tâches
+        raise NotImplementedError
+
+    def save_changes(self, tasks, changed, deleted):
+        # Persiste les tâches ajoutées ou modifiées (changed) et les IDs
+        # supprimés (deleted) depuis la dernière sauvegarde
+        # Par défaut, réécriture complète ; un backend incrémental n'écrit que
+        # les enregistrements concernés
+        self.save(tasks)
+
+    def needs_all_tasks(self) -> bool:
+        # Faux si le prochain save_changes n'utilisera pas tasks : l'appelant
+        # peut alors passer None et éviter d'en copier la liste
+        return True
+
+    def record_add(self, task):
+        # Notifiée à chaque ajout ; rien à faire pour un stockage par document
+        pass
+
+    def record_delete(self, task_id):
+        # Notifiée à chaque suppression
+        pass
+
+    def record_update(self, task, field, value):
+        # Notifiée à chaque changement de statut, priorité, projet ou completed_at
+        pass
+
+    # Variantes par lot, appelées par les opérations en masse du gestionnaire
+    # Par défaut, un appel unitaire par élément
+
+    def record_add_many(self, tasks):
+        for task in tasks:
+            self.record_add(task)
+
+    def record_delete_many(self, task_ids):
+        for task_id in task_ids:
+            self.record_delete(task_id)
+
+    def record_update_many(self, tasks, field, value):
+        # Le même champ reçoit la même valeur pour toutes les tâches
+        for task in tasks:
+            self.record_update(task, field, value)
+
+    def flush(self):
+        # Rend durables les écritures différées ; rien à faire par défaut
+        pass
+
+    def close(self):
+        # Libère les ressources du backend
+        pass
+
+
+class JSONFileStorage(StorageBackend):
+    """Stockage par défaut : un document JSON réécrit à chaque sauvegarde"""
+
+    def __init__(self, filename, stream=False, compact=False):
+        self.filename = filename
+        # En mode flux, le chargement construit les Task au fil de la lecture
+        # au lieu de garder le JSON brut et tous les dicts décodés en mémoire
+        self.stream = stream
+        # En mode compact, la sauvegarde n'indente pas et encode au fil de l'eau
+        self.compact = compact
+
+    def load(self, task_class):
+        if self.stream:
+            return iter_tasks_from_file(self.filename, task_class)
+        with open(self.filename, "r", encoding="utf-8") as f:
+            return task_class.from_dicts(json.load(f))
+
+    def save(self, tasks):
+        if self.compact:
+            atomic_write(self.filename, lambda f: write_tasks_compact(f, tasks))
+        else:
+            atomic_write(self.filename, lambda f: self._write_indented(f, tasks))
+
+    @staticmethod
+    def _write_indented(f, tasks):
+        # Format historique, lisible à la main
+        tasks_data = Task.to_dicts(tasks)
+        json.dump(tasks_data, f, indent=2, ensure_ascii=False)
+
+
+class JournaledStorage(StorageBackend):
+    """Stockage journalisé : snapshot JSON + journal de mutations en ajout seul"""
+
+    records_mutations = True
+
+    def __init__(
+        self,
+        filename,
+        journal_file=None,
+        compact_threshold=16 * 1024 * 1024,
+        sync_every=100,
+        sync_interval=1.0,
+    ):
+        # Le snapshot garde le format JSON habituel, le journal est à côté
+        self.filename = filename
+        self.journal_file = journal_file or f"{filename}.journal"
+        # Taille du journal (octets) au-delà de laquelle save_changes() compacte
+        self.compact_threshold = compact_threshold
+        # Les fsync sont groupés : tous les N ajouts ou toutes les N secondes
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self._journal = None
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        # Vrai une fois l'état complet lu ou écrit par cette instance : les
+        # tâches du gestionnaire peuvent alors servir au compactage
+        self._synced = False
+
+    def load(self, task_class):
+        tasks = self._read(task_class)
+        self._synced = True
+        return tasks
+
+    def _read(self, task_class):
+        # Charge le snapshot puis rejoue le journal par-dessus
+        try:
+            tasks = {
+                task.id: task
+                for task in iter_tasks_from_file(self.filename, task_class)
+            }
+        except FileNotFoundError:
+            tasks = {}
+
+        self._replay(tasks, task_class)
+        return list(tasks.values())
+
+    def _replay(self, tasks, task_class):
+        # Le rejeu est idempotent : un crash entre l'écriture du snapshot et la
+        # remise à zéro du journal ne fait que rejouer des mutations déjà vues
+        try:
+            f = open(self.journal_file, "rb")
+        except FileNotFoundError:
+            return
+
+        with f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Dernière ligne tronquée par un crash : on l'ignore
+                    break
+                self._apply(tasks, task_class, json.loads(line))
+
+        # On retire la ligne tronquée pour que les prochains ajouts restent lisibles
+        self._trim_torn_tail()
+
+    def _trim_torn_tail(self):
+        # Coupe le journal juste après son dernier saut de ligne : une ligne
+        # tronquée par un crash ne doit pas fusionner avec le prochain ajout
+        try:
+            f = open(self.journal_file, "r+b")
+        except FileNotFoundError:
+            return
+
+        with f:
+            size = end = f.seek(0, os.SEEK_END)
+            while end > 0:
+                start = max(0, end - 4096)
+                f.seek(start)
+                newline = f.read(end - start).rfind(b"\n")
+                if newline >= 0:
+                    end = start + newline + 1
+                    break
+                end = start
+            if end != size:
+                f.truncate(end)
+
+    @staticmethod
+    def _apply(tasks, task_class, event):
+        op = event["op"]
+        if op == "add":
+            task = task_class.from_trusted_dict(event["task"])
+            tasks[task.id] = task
+        elif op == "delete":
+            tasks.pop(event["id"], None)
+        elif op == "update":
+            task = tasks.get(event["id"])
+            if task is not None:
+                field = event["field"]
+                setattr(task, field, decode_field(field, event["value"]))
+                # Rejouée depuis le journal, la valeur est déjà persistée
+                task.mark_clean()
+        else:
+            raise ValueError(f"Opération de journal inconnue: {op}")
+
+    def _append(self, event):
+        self._append_many([event])
+
+    def _append_many(self, events):
+        # Une ligne par mutation ; un lot est écrit d'un seul write puis fsync
+        # groupé
+        if not events:
+            return
+        if self._journal is None:
+            self._trim_torn_tail()
+            self._journal = open(self.journal_file, "ab")
+        lines = "".join(
+            json.dumps(event, ensure_ascii=False, separators=(",", ":")) + "\n"
+            for event in events
+        )
+        self._journal.write(lines.encode("utf-8"))
+        self._journal.flush()
+        self._pending += len(events)
+        if (
+            self._pending >= self.sync_every
+            or time.monotonic() - self._last_sync >= self.sync_interval
+        ):
+            self.sync()
+
+    def sync(self):
+        # Force l'écriture sur disque des ajouts en attente
+        if self._journal is not None and self._pending:
+            os.fsync(self._journal.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def record_add(self, task):
+        self._append({"op": "add", "task": task.to_dict()})
+
+    def record_delete(self, task_id):
+        self._append({"op": "delete", "id": task_id})
+
+    def record_update(self, task, field, value):
+        self.record_update_many([task], field, value)
+
+    def record_add_many(self, tasks):
+        self._append_many(
+            [{"op": "add", "task": data} for data in Task.to_dicts(tasks)]
+        )
+
+    def record_delete_many(self, task_ids):
+        self._append_many([{"op": "delete", "id": task_id} for task_id in task_ids])
+
+    def record_update_many(self, tasks, field, value):
+        value = encode_field(field, value)
+        self._append_many(
+            [
+                {"op": "update", "id": task.id, "field": field, "value": value}
+                for task in tasks
+            ]
+        )
+
+    def journal_size(self):
+        try:
+            return os.path.getsize(self.journal_file)
+        except FileNotFoundError:
+            return 0
+
+    def save(self, tasks):
+        # Remplacement complet des tâches : le journal ne le décrit pas, un
+        # nouveau snapshot est écrit
+        self.compact(tasks)
+        self._synced = True
+
+    def save_changes(self, tasks, changed, deleted):
+        # Les mutations sont déjà dans le journal : sauvegarder revient à les
+        # rendre durables, et à compacter si le journal devient trop gros
+        # Sans les tâches (None), le compactage attend la sauvegarde suivante
+        # Un gestionnaire qui n'a pas chargé le fichier ne voit qu'une partie
+        # des tâches : l'état compacté est alors relu depuis le disque
+        self.sync()
+        if self.journal_size() < self.compact_threshold:
+            return
+        if not self._synced:
+            self.compact(self._read(Task))
+        elif tasks is not None:
+            self.compact(tasks)
+
+    def needs_all_tasks(self) -> bool:
+        return self._synced and self.journal_size() >= self.compact_threshold
+
+    def compact(self, tasks):
+        # Écrit un nouveau snapshot de façon atomique puis vide le journal
+        atomic_write(self.filename, lambda f: write_tasks_compact(f, tasks))
+
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        with open(self.journal_file, "wb") as f:
+            os.fsync(f.fileno())
+        self._pending = 0
+
+    def close(self):
+        self.sync()
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+
+class _Segment:
+    """Un fichier de segment et ses tâches, dans l'ordre d'insertion"""
+
+    __slots__ = ("name", "tasks")
+
+    def __init__(self, name):
+        self.name = name
+        self.tasks = {}
+
+
+class SegmentedJSONStorage(StorageBackend):
+    """Stockage JSON en segments : seuls les segments modifiés sont réécrits"""
+
+    MANIFEST = "manifest.json"
+    VERSION = 1
+
+    def __init__(self, directory, segment_size=10_000):
+        # Un répertoire : un manifeste qui liste les segments dans l'ordre,
+        # chaque segment étant un tableau JSON compact d'au plus segment_size
+        # tâches
+        self.directory = directory
+        self.segment_size = segment_size
+        self._segments = []
+        self._segment_of = {}
+        self._next_segment = 0
+        # Faux tant que l'état en mémoire ne reflète pas le contenu du disque
+        self._synced = False
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def _read_manifest(self):
+        with open(self._path(self.MANIFEST), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != self.VERSION:
+            raise ValueError(
+                f"Version de manifeste non supportée: {manifest.get('version')}"
+            )
+        return manifest
+
+    def _write_manifest(self):
+        manifest = {
+            "version": self.VERSION,
+            "segments": [segment.name for segment in self._segments],
+            "next_segment": self._next_segment,
+        }
+        atomic_write(self._path(self.MANIFEST), lambda f: json.dump(manifest, f))
+
+    def _reset(self):
+        self._segments = []
+        self._segment_of = {}
+
+    def _add_segment(self, name=None):
+        # Les noms ne sont jamais réutilisés : un segment réécrit ou supprimé
+        # ne peut pas écraser un fichier encore listé par le manifeste
+        if name is None:
+            name = f"segment-{self._next_segment:06d}.json"
+            self._next_segment += 1
+        segment = _Segment(name)
+        self._segments.append(segment)
+        return segment
+
+    def _place(self, segment, task):
+        segment.tasks[task.id] = task
+        self._segment_of[task.id] = segment
+
+    def _write_segment(self, segment):
+        atomic_write(
+            self._path(segment.name),
+            lambda f: write_tasks_compact(f, segment.tasks.values()),
+        )
+
+    def _remove_files(self, names):
+        for name in names:
+            try:
+                os.remove(self._path(name))
+            except FileNotFoundError:
+                pass
+
+    def load(self, task_class):
+        self._reset()
+        self._synced = False
+        manifest = self._read_manifest()
+        tasks = []
+        for name in manifest["segments"]:
+            with open(self._path(name), "r", encoding="utf-8") as f:
+                segment_tasks = task_class.from_dicts(json.load(f))
+            segment = self._add_segment(name)
+            for task in segment_tasks:
+                self._place(segment, task)
+            tasks.extend(segment_tasks)
+        self._next_segment = manifest["next_segment"]
+        self._synced = True
+        return tasks
+
+    def save(self, tasks):
+        # Réécriture complète dans de nouveaux segments, puis bascule du
+        # manifeste : l'ancien état reste lisible jusqu'au remplacement
+        os.makedirs(self.directory, exist_ok=True)
+        try:
+            manifest = self._read_manifest()
+        except FileNotFoundError:
+            manifest = {"segments": [], "next_segment": 0}
+        self._next_segment = max(self._next_segment, manifest["next_segment"])
+        old_names = set(manifest["segments"])
+        old_names.update(segment.name for segment in self._segments)
+
+        self._reset()
+        for batch in _batched(tasks, self.segment_size):
+            segment = self._add_segment()
+            for task in batch:
+                self._place(segment, task)
+            self._write_segment(segment)
+        self._write_manifest()
+        self._remove_files(old_names)
+        self._synced = True
+
+    def needs_all_tasks(self) -> bool:
+        # Tant que le disque n'a pas été lu ou écrit, save_changes réécrit tout
+        return not self._synced
+
+    def save_changes(self, tasks, changed, deleted):
+        if not self._synced:
+            self.save(tasks)
+            return
+
+        touched = {}
+        segment_count = len(self._segments)
+        for task_id in deleted:
+            segment = self._segment_of.pop(task_id, None)
+            if segment is not None:
+                del segment.tasks[task_id]
+                touched[segment.name] = segment
+        for task in changed:
+            segment = self._segment_of.get(task.id)
+            if segment is None:
+                # Les nouvelles tâches vont en fin du dernier segment pour
+                # conserver l'ordre d'insertion au rechargement
+                if (
+                    self._segments
+                    and len(self._segments[-1].tasks) < self.segment_size
+                ):
+                    segment = self._segments[-1]
+                else:
+                    segment = self._add_segment()
+            self._place(segment, task)
+            touched[segment.name] = segment
+
+        # Segments d'abord, manifeste ensuite, suppressions en dernier : un
+        # arrêt brutal laisse toujours un manifeste qui pointe sur des
+        # segments complets
+        emptied = []
+        for segment in touched.values():
+            if segment.tasks:
+                self._write_segment(segment)
+            else:
+                emptied.append(segment)
+        for segment in emptied:
+            self._segments.remove(segment)
+        if emptied or len(self._segments) != segment_count:
+            self._write_manifest()
+        self._remove_files(segment.name for segment in emptied)
+
+
+class SQLiteStorage(StorageBackend):
+    """Stockage SQLite : requêtes indexées exécutées par la base"""
+
+    supports_queries = True
+    records_mutations = True
+    thread_bound = True
+
+    COLUMNS = (
+        "id, title, description, priority, status, created_at, completed_at, "
+        "project_id"
+    )
+
+    def __init__(self, filename, batch_size=500):
+        self.filename = filename
+        # Les écritures sont regroupées dans une transaction validée toutes les
+        # batch_size mutations, ou à la sauvegarde
+        self.batch_size = batch_size
+        self._pending = 0
+        self._connection = sqlite3.connect(filename)
+        self._create_schema()
+
+    def _create_schema(self):
+        # L'ID n'a pas de type déclaré : entiers, anciens flottants et UUID
+        # sont stockés tels quels
+        # Les dates sont des microsecondes depuis 1970 pour des plages rapides
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS tasks (
+                id PRIMARY KEY,
+                title TEXT NOT NULL,
+                description TEXT NOT NULL,
+                priority TEXT NOT NULL,
+                status TEXT NOT NULL,
+                created_at INTEGER NOT NULL,
+                completed_at INTEGER,
+                project_id
+            );
+            CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status);
+            CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks (priority);
+            CREATE INDEX IF NOT EXISTS idx_tasks_project_id ON tasks (project_id);
+            CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks (created_at);
+            """
+        )
+
+    @staticmethod
+    def _task_to_row(task):
+        return (
+            task.id,
+            task.title,
+            task.description,
+            task.priority.value,
+            task.status.value,
+            to_epoch_us(task.created_at),
+            to_epoch_us(task.completed_at) if task.completed_at else None,
+            task.project_id,
+        )
+
+    @staticmethod
+    def _row_to_task(row, task_class):
+        task_id, title, description, priority, status, created_at = row[:6]
+        completed_at, project_id = row[6:]
+        # Les lignes viennent de notre propre table : pas de revalidation
+        return task_class._restore(
+            task_id,
+            title,
+            description,
+            Priority(priority),
+            Status(status),
+            from_epoch_us(created_at),
+            from_epoch_us(completed_at) if completed_at is not None else None,
+            project_id,
+        )
+
+    def _select(self, task_class, where="", params=()):
+        cursor = self._connection.execute(
+            f"SELECT {self.COLUMNS} FROM tasks {where} ORDER BY rowid", params
+        )
+        return [self._row_to_task(row, task_class) for row in cursor]
+
+    def _write_many(self, sql, params_seq):
+        # Écriture dans la transaction courante, en un seul executemany,
+        # validée par lots
+        params_seq = list(params_seq)
+        self._connection.executemany(sql, params_seq)
+        self._pending += len(params_seq)
+        if self._pending >= self.batch_size:
+            self.commit()
+
+    def commit(self):
+        self._connection.commit()
+        self._pending = 0
+
+    def load(self, task_class):
+        return self._select(task_class)
+
+    def save(self, tasks):
+        # Remplacement complet des tâches : la table est vidée puis réécrite
+        # dans une seule transaction
+        self.commit()
+        try:
+            self._connection.execute("DELETE FROM tasks")
+            self.import_tasks(tasks)
+        except BaseException:
+            self._connection.rollback()
+            raise
+
+    def save_changes(self, tasks, changed, deleted):
+        # Les mutations sont écrites au fil de l'eau : on valide la transaction
+        self.commit()
+
+    def needs_all_tasks(self) -> bool:
+        return False
+
+    def import_tasks(self, tasks):
+        # Copie en une transaction des tâches venant d'un autre stockage
+        self._connection.executemany(
+            f"INSERT OR REPLACE INTO tasks ({self.COLUMNS}) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (self._task_to_row(task) for task in tasks),
+        )
+        self.commit()
+
+    def record_add(self, task):
+        self.record_add_many([task])
+
+    def record_delete(self, task_id):
+        self.record_delete_many([task_id])
+
+    def record_update(self, task, field, value):
+        self.record_update_many([task], field, value)
+
+    def record_add_many(self, tasks):
+        self._write_many(
+            f"INSERT INTO tasks ({self.COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (self._task_to_row(task) for task in tasks),
+        )
+
+    def record_delete_many(self, task_ids):
+        self._write_many(
+            "DELETE FROM tasks WHERE id = ?", ((task_id,) for task_id in task_ids)
+        )
+
+    def record_update_many(self, tasks, field, value):
+        if field == "completed_at":
+            value = to_epoch_us(value) if value else None
+        else:
+            value = encode_field(field, value)
+        # field vient d'une liste fermée de champs suivis, jamais de l'extérieur
+        self._write_many(
+            f"UPDATE tasks SET {field} = ? WHERE id = ?",
+            ((value, task.id) for task in tasks),
+        )
+
+    def get_task(self, task_id, task_class):
+        tasks = self._select(task_class, "WHERE id = ?", (task_id,))
+        return tasks[0] if tasks else None
+
+    def get_tasks_by_status(self, status, task_class):
+        return self._select(task_class, "WHERE status = ?", (status.value,))
+
+    def get_tasks_by_priority(self, priority, task_class):
+        return self._select(task_class, "WHERE priority = ?", (priority.value,))
+
+    def get_tasks_by_project(self, project_id, task_class):
+        return self._select(task_class, "WHERE project_id IS ?", (project_id,))
+
+    def query(
+        self, task_class, where="", params=(), order="rowid", limit=None, offset=0
+    ):
+        # Filtres, tri et pagination construits par query.py et exécutés par
+        # la base
+        sql = f"SELECT {self.COLUMNS} FROM tasks"
+        if where:
+            sql += f" WHERE {where}"
+        sql += f" ORDER BY {order} LIMIT ? OFFSET ?"
+        params = (*params, -1 if limit is None else limit, offset)
+        return [
+            self._row_to_task(row, task_class)
+            for row in self._connection.execute(sql, params)
+        ]
+
+    def count(self, where="", params=()):
+        sql = "SELECT COUNT(*) FROM tasks"
+        if where:
+            sql += f" WHERE {where}"
+        return self._connection.execute(sql, params).fetchone()[0]
+
+    def get_statistics(self):
+        # Deux agrégats GROUP BY servis par les index status et priority
+        tasks_by_priority = {priority.value: 0 for priority in Priority}
+        tasks_by_status = {status.value: 0 for status in Status}
+        for priority, count in self._connection.execute(
+            "SELECT priority, COUNT(*) FROM tasks GROUP BY priority"
+        ):
+            tasks_by_priority[priority] = count
+        for status, count in self._connection.execute(
+            "SELECT status, COUNT(*) FROM tasks GROUP BY status"
+        ):
+            tasks_by_status[status] = count
+
+        return {
+            "total_tasks": sum(tasks_by_status.values()),
+            "completed_tasks": tasks_by_status[Status.DONE.value],
+            "tasks_by_priority": tasks_by_priority,
+            "tasks_by_status": tasks_by_status,
+        }
+
+    def close(self):
+        self.commit()
+        self._connection.close()
@@ -1,7 +1,8 @@
-import time
 from datetime import datetime
 from enum import Enum
 
+from .ids import TimeOrderedIdGenerator
+
 
 class Priority(Enum):
     # Définition des priorités (LOW, MEDIUM, HIGH, URGENT)
@@ -19,8 +20,25 @@ class Status(Enum):
     CANCELLED = "cancelled"
 
 
-class Task:
-    """Une tâche avec toutes ses propriétés"""
+class SlottedTask:
+    """Une tâche compacte : attributs en __slots__, sans __dict__ par instance"""
+
+    __slots__ = (
+        "_listener",
+        "_dirty",
+        "id",
+        "title",
+        "description",
+        "_priority",
+        "_status",
+        "created_at",
+        "_completed_at",
+        "_project_id",
+    )
+
+    # Générateur d'IDs partagé par toutes les tâches, remplaçable par tout
+    # appelable sans argument (CounterIdGenerator, UUIDIdGenerator, ...)
+    id_generator = TimeOrderedIdGenerator()
 
     def __init__(self, title, description="", priority=Priority.MEDIUM):
         # Validation des paramètres
@@ -31,14 +49,102 @@ class Task:
             raise ValueError("La priorité doit être une instance de Priority")
 
         # Initialisation des attributs
-        self.id = time.time()
+        # Les champs indexés par le gestionnaire sont stockés sous un nom privé
+        # et exposés par des propriétés qui notifient les changements
+        self._listener = None
+        self._dirty = False
+        self.id = type(self).id_generator()
         self.title = title.strip()
         self.description = description
-        self.priority = priority
-        self.status = Status.TODO
+        self._priority = priority
+        self._status = Status.TODO
         self.created_at = datetime.now()
-        self.completed_at = None
-        self.project_id = None
+        self._completed_at = None
+        self._project_id = None
+
+    @classmethod
+    def _restore(
+        cls,
+        task_id,
+        title,
+        description,
+        priority,
+        status,
+        created_at,
+        completed_at,
+        project_id,
+    ):
+        # Reconstruction directe d'une tâche déjà validée lors de son écriture :
+        # ni validation, ni ID généré, ni datetime.now() jetés ensuite
+        task = cls.__new__(cls)
+        task._listener = None
+        task._dirty = False
+        task.id = task_id
+        task.title = title
+        task.description = description
+        task._priority = priority
+        task._status = status
+        task.created_at = created_at
+        task._completed_at = completed_at
+        task._project_id = project_id
+        return task
+
+    def _notify(self, field, old, new):
+        # Marque la tâche comme modifiée et prévient l'écouteur (le
+        # gestionnaire propriétaire) d'un changement
+        if old != new:
+            self._dirty = True
+            if self._listener is not None:
+                self._listener(self, field, old, new)
+
+    @property
+    def dirty(self):
+        # Vrai si statut, priorité, projet ou completed_at ont changé depuis
+        # la création, le chargement ou le dernier mark_clean
+        return self._dirty
+
+    def mark_clean(self):
+        # Appelée une fois la tâche persistée
+        self._dirty = False
+
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, value):
+        old, self._status = self._status, value
+        self._notify("status", old, value)
+        # Une tâche rouverte n'est plus terminée : elle perd sa date de fin
+        if old == Status.DONE and value != Status.DONE:
+            self.completed_at = None
+
+    @property
+    def priority(self):
+        return self._priority
+
+    @priority.setter
+    def priority(self, value):
+        old, self._priority = self._priority, value
+        self._notify("priority", old, value)
+
+    @property
+    def completed_at(self):
+        return self._completed_at
+
+    @completed_at.setter
+    def completed_at(self, value):
+        old, self._completed_at = self._completed_at, value
+        self._notify("completed_at", old, value)
+
+    @property
+    def project_id(self):
+        return self._project_id
+
+    @project_id.setter
+    def project_id(self, value):
+        old, self._project_id = self._project_id, value
+        self._notify("project_id", old, value)
 
     def mark_completed(self):
         # Changement du statut à DONE
@@ -56,6 +162,34 @@ class Task:
         # Assignation de la tâche à un projet
         self.project_id = project_id
 
+    def copy(self):
+        # Copie détachée des champs persistés, sans écouteur ni marqueur
+        return type(self)._restore(
+            self.id,
+            self.title,
+            self.description,
+            self._priority,
+            self._status,
+            self.created_at,
+            self._completed_at,
+            self._project_id,
+        )
+
+    def __reduce__(self):
+        # Pickle (échanges entre processus) : champs persistés et attributs
+        # libres éventuels, sans l'écouteur du gestionnaire d'origine
+        fields = (
+            self.id,
+            self.title,
+            self.description,
+            self._priority,
+            self._status,
+            self.created_at,
+            self._completed_at,
+            self._project_id,
+        )
+        return type(self)._restore, fields, getattr(self, "__dict__", None) or None
+
     def to_dict(self):
         # Retour d'un dictionnaire pour la sérialisation JSON
         # Gestion de la conversion des Enum et datetime
@@ -72,25 +206,119 @@ class Task:
             "project_id": self.project_id,
         }
 
+    @staticmethod
+    def to_dicts(tasks):
+        # Sérialisation en lot : même format que to_dict, avec les conversions
+        # Enum -> chaîne précalculées et completed_at lu une seule fois
+        # Les dates répétées ne sont formatées qu'une fois ; une date avec
+        # fuseau est toujours formatée, deux fuseaux pouvant désigner le même
+        # instant sous deux écritures différentes
+        priority_values = _PRIORITY_VALUES
+        status_values = _STATUS_VALUES
+        isoformats = {}
+        tasks_data = []
+        append = tasks_data.append
+        for task in tasks:
+            created_at = task.created_at
+            created = isoformats.get(created_at)
+            if created is None or created_at.tzinfo is not None:
+                created = isoformats[created_at] = created_at.isoformat()
+            completed_at = task.completed_at
+            if completed_at is not None:
+                completed = isoformats.get(completed_at)
+                if completed is None or completed_at.tzinfo is not None:
+                    completed = isoformats[completed_at] = completed_at.isoformat()
+            else:
+                completed = None
+            append(
+                {
+                    "id": task.id,
+                    "title": task.title,
+                    "description": task.description,
+                    "priority": priority_values[task.priority],
+                    "status": status_values[task.status],
+                    "created_at": created,
+                    "completed_at": completed,
+                    "project_id": task.project_id,
+                }
+            )
+        return tasks_data
+
     @classmethod
     def from_dict(cls, data):
         # Création d'une Task depuis un dictionnaire
         # Gestion de la conversion des string vers Enum et datetime
-        task = cls(
-            title=data["title"],
-            description=data.get("description", ""),
-            priority=Priority[data["priority"].upper()],
+        # Le titre est validé comme dans __init__, sans générer d'ID ni de date
+        # aussitôt remplacés par ceux du dictionnaire
+        title = data["title"]
+        if not title or not title.strip():
+            raise ValueError("Le titre ne peut pas être vide")
+
+        return cls._restore(
+            data["id"],
+            title.strip(),
+            data.get("description", ""),
+            Priority[data["priority"].upper()],
+            Status[data["status"].upper()],
+            datetime.fromisoformat(data["created_at"]),
+            (
+                datetime.fromisoformat(data["completed_at"])
+                if data.get("completed_at")
+                else None
+            ),
+            data.get("project_id"),
         )
 
-        # Restauration des autres attributs
-        task.id = data["id"]
-        task.status = Status[data["status"].upper()]
-        task.created_at = datetime.fromisoformat(data["created_at"])
-        task.completed_at = (
-            datetime.fromisoformat(data["completed_at"])
-            if data.get("completed_at")
-            else None
+    @classmethod
+    def from_trusted_dict(cls, data):
+        # Chemin rapide pour des données écrites par to_dict (fichiers de
+        # stockage) : aucune validation, Enum retrouvées par table
+        completed_at = data.get("completed_at")
+        return cls._restore(
+            data["id"],
+            data["title"],
+            data.get("description", ""),
+            _lookup_enum(_PRIORITY_LOOKUP, Priority, data["priority"]),
+            _lookup_enum(_STATUS_LOOKUP, Status, data["status"]),
+            datetime.fromisoformat(data["created_at"]),
+            datetime.fromisoformat(completed_at) if completed_at else None,
+            data.get("project_id"),
         )
-        task.project_id = data.get("project_id")
 
-        return task
+    @classmethod
+    def from_dicts(cls, tasks_data):
+        # Construction en lot par le chemin rapide, pour les chargements
+        from_trusted_dict = cls.from_trusted_dict
+        return [from_trusted_dict(data) for data in tasks_data]
+
+
+# Tables de conversion partagées par les chemins de sérialisation en lot
+_PRIORITY_VALUES = {priority: priority.value for priority in Priority}
+_STATUS_VALUES = {status: status.value for status in Status}
+# Les fichiers contiennent la valeur ("high") ; le nom ("HIGH") reste accepté
+# comme avec Priority[...upper()]
+_PRIORITY_LOOKUP = {
+    **{priority.value: priority for priority in Priority},
+    **{priority.name: priority for priority in Priority},
+}
+_STATUS_LOOKUP = {
+    **{status.value: status for status in Status},
+    **{status.name: status for status in Status},
+}
+
+
+def _lookup_enum(lookup, enum_class, value):
+    member = lookup.get(value)
+    if member is None:
+        # Casse inhabituelle : même règle que from_dict
+        member = enum_class[value.upper()]
+    return member
+
+
+class Task(SlottedTask):
+    """Une tâche avec toutes ses propriétés"""
+
+    # Les champs restent dans les slots hérités ; le __dict__ ajouté ici
+    # n'est alloué que si on attache des attributs libres à la tâche
+    # Seul __dict__ est déclaré : pas de __weakref__, inutile aux tâches
+    __slots__ = ("__dict__",)
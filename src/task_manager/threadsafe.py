@@ -0,0 +1,282 @@
+import threading
+from typing import List, Optional
+
+from .manager import _UNCHANGED, TaskManager
+from .task import Priority, Status, Task
+
+# Position de chaque champ indexé dans le rangement mémorisé d'une tâche
+_INDEXED_FIELDS = {"status": 0, "priority": 1, "project_id": 2, "completed_at": 3}
+
+
+class _Guard:
+    """Gestionnaire de contexte réutilisable autour d'une paire acquire/release"""
+
+    __slots__ = ("_acquire", "_release")
+
+    def __init__(self, acquire, release):
+        self._acquire = acquire
+        self._release = release
+
+    def __enter__(self):
+        self._acquire()
+
+    def __exit__(self, *exc_info):
+        self._release()
+
+
+class ReadWriteLock:
+    """Verrou lecteurs-rédacteur : lectures simultanées, écriture exclusive"""
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = None
+        self._write_depth = 0
+        self._writers_waiting = 0
+        # Gardes créées une fois : `with lock.read:` et `with lock.write:`
+        self.read = _Guard(self.acquire_read, self.release_read)
+        self.write = _Guard(self.acquire_write, self.release_write)
+
+    def acquire_read(self):
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer == me:
+                # Lecture depuis une écriture du même thread : déjà exclusif
+                self._write_depth += 1
+                return
+            # Priorité aux rédacteurs en attente pour qu'un flot continu de
+            # lectures ne les affame pas
+            while self._writer is not None or self._writers_waiting:
+                self._condition.wait()
+            self._readers += 1
+
+    def release_read(self):
+        with self._condition:
+            if self._writer == threading.get_ident():
+                self._write_depth -= 1
+                return
+            self._readers -= 1
+            if not self._readers:
+                self._condition.notify_all()
+
+    def acquire_write(self):
+        # Réentrant pour le thread qui écrit déjà ; passer d'une lecture à une
+        # écriture dans le même thread n'est pas supporté
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer == me:
+                self._write_depth += 1
+                return
+            self._writers_waiting += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._condition.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = me
+            self._write_depth = 1
+
+    def release_write(self):
+        with self._condition:
+            self._write_depth -= 1
+            if not self._write_depth:
+                self._writer = None
+                self._condition.notify_all()
+
+
+class ConcurrentTaskManager(TaskManager):
+    """TaskManager partagé entre threads : lectures parallèles, mutations atomiques"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lock = ReadWriteLock()
+        # Valeurs [statut, priorité, projet, completed_at] sous lesquelles
+        # chaque tâche est rangée : un champ peut déjà avoir changé alors que
+        # son déplacement attend le verrou
+        self._placement = {}
+        # Les changements sont publiés sous le verrou d'écriture : un
+        # abonnement avec reprise le prend aussi, pour n'en manquer aucun
+        self.changes.guard = self._lock.write
+
+    @property
+    def tasks(self) -> List[Task]:
+        with self._lock.read:
+            return TaskManager.tasks.fget(self)
+
+    @tasks.setter
+    def tasks(self, tasks):
+        with self._lock.write:
+            self._placement = {}
+            TaskManager.tasks.fset(self, tasks)
+
+    def _index(self, task):
+        super()._index(task)
+        self._placement[task.id] = [
+            task.status,
+            task.priority,
+            task.project_id,
+            task.completed_at,
+        ]
+
+    def _indexed_values(self, task):
+        return self._placement.pop(task.id)
+
+    def _on_task_changed(self, task, field, old, new):
+        # Appelé depuis le thread qui modifie la tâche : le déplacement entre
+        # seaux se fait sous le verrou d'écriture
+        with self._lock.write:
+            if self._tasks.get(task.id) is not task:
+                # Supprimée pendant l'attente du verrou
+                return
+            # La valeur courante fait foi : si deux threads modifient le même
+            # champ, le second appel trouve la tâche déjà à sa place
+            new = getattr(task, field)
+            position = _INDEXED_FIELDS.get(field)
+            if position is not None:
+                placement = self._placement[task.id]
+                old = placement[position]
+                if old == new:
+                    return
+                placement[position] = new
+            super()._on_task_changed(task, field, old, new)
+
+    def _read_or_write(self):
+        # Un backend interrogeable ajoute aux index les tâches lues en base
+        return self._lock.write if self._storage_queries else self._lock.read
+
+    def add_task(self, title, description="", priority=Priority.MEDIUM):
+        with self._lock.write:
+            return super().add_task(title, description, priority)
+
+    def add_tasks(self, items) -> List:
+        with self._lock.write:
+            return super().add_tasks(items)
+
+    def get_task(self, task_id) -> Optional[Task]:
+        with self._read_or_write():
+            return super().get_task(task_id)
+
+    def get_tasks_by_status(self, status: Status) -> List[Task]:
+        with self._read_or_write():
+            return super().get_tasks_by_status(status)
+
+    def get_tasks_by_priority(self, priority: Priority) -> List[Task]:
+        with self._read_or_write():
+            return super().get_tasks_by_priority(priority)
+
+    def get_tasks_by_project(self, project_id) -> List[Task]:
+        with self._read_or_write():
+            return super().get_tasks_by_project(project_id)
+
+    def _run_query(self, function, query):
+        with self._read_or_write():
+            return super()._run_query(function, query)
+
+    def search(self, text, limit=None, prefix=True) -> List[Task]:
+        with self._lock.read:
+            return super().search(text, limit, prefix)
+
+    def reindex_task(self, task_id) -> bool:
+        with self._lock.write:
+            return super().reindex_task(task_id)
+
+    def get_tasks_created_between(self, start=None, end=None) -> List[Task]:
+        with self._read_or_write():
+            return super().get_tasks_created_between(start, end)
+
+    def get_tasks_completed_between(self, start=None, end=None) -> List[Task]:
+        with self._read_or_write():
+            return super().get_tasks_completed_between(start, end)
+
+    def get_recent_tasks(self, count) -> List[Task]:
+        with self._read_or_write():
+            return super().get_recent_tasks(count)
+
+    def get_recently_completed(self, count) -> List[Task]:
+        with self._read_or_write():
+            return super().get_recently_completed(count)
+
+    def peek_next(self) -> Optional[Task]:
+        # Écriture : les entrées périmées sont retirées du sommet de la file
+        with self._lock.write:
+            return super().peek_next()
+
+    def claim_next(self) -> Optional[Task]:
+        # Prise et passage à IN_PROGRESS sous le même verrou : deux threads ne
+        # reçoivent jamais la même tâche
+        with self._lock.write:
+            return super().claim_next()
+
+    # Baux : lecture et écriture du registre sous le même verrou d'écriture
+
+    def claim(self, worker_id, ttl) -> Optional[Task]:
+        with self._lock.write:
+            return super().claim(worker_id, ttl)
+
+    def heartbeat(self, task_id, worker_id, ttl) -> bool:
+        with self._lock.write:
+            return super().heartbeat(task_id, worker_id, ttl)
+
+    def release(self, task_id, worker_id, done=True) -> bool:
+        with self._lock.write:
+            return super().release(task_id, worker_id, done)
+
+    def get_lease(self, task_id):
+        with self._lock.write:
+            return super().get_lease(task_id)
+
+    def reap_expired_leases(self, now=None) -> List:
+        with self._lock.write:
+            return super().reap_expired_leases(now)
+
+    def delete_task(self, task_id) -> bool:
+        with self._lock.write:
+            return super().delete_task(task_id)
+
+    def delete_tasks(self, task_ids) -> int:
+        with self._lock.write:
+            return super().delete_tasks(task_ids)
+
+    def update_many(
+        self, task_ids, status=None, priority=None, project_id=_UNCHANGED
+    ) -> int:
+        with self._lock.write:
+            return super().update_many(task_ids, status, priority, project_id)
+
+    def save_to_file(self, filename=None):
+        # Exclusif : les changements en attente sont figés pendant l'écriture
+        with self._lock.write:
+            super().save_to_file(filename)
+
+    def load_from_file(self, filename=None):
+        with self._lock.write:
+            super().load_from_file(filename)
+
+    def has_unsaved_changes(self) -> bool:
+        with self._lock.read:
+            return super().has_unsaved_changes()
+
+    def close(self):
+        with self._lock.write:
+            super().close()
+
+    def get_statistics(self):
+        # Sous verrou de lecture, les compteurs forment un instantané cohérent
+        with self._lock.read:
+            return super().get_statistics()
+
+    def _recount_statistics(self):
+        # Recompte depuis les rangements mémorisés : un changement de champ en
+        # attente du verrou n'est pas encore visible dans les seaux
+        tasks_by_priority = {priority.value: 0 for priority in Priority}
+        tasks_by_status = {status.value: 0 for status in Status}
+        for status, priority, *_ in self._placement.values():
+            tasks_by_priority[priority.value] += 1
+            tasks_by_status[status.value] += 1
+
+        return {
+            "total_tasks": len(self._tasks),
+            "completed_tasks": tasks_by_status[Status.DONE.value],
+            "tasks_by_priority": tasks_by_priority,
+            "tasks_by_status": tasks_by_status,
+        }
@@ -0,0 +1,164 @@
+import bisect
+import itertools
+from contextlib import contextmanager
+from typing import List
+
+# Nombre de places libérées toléré avant de recompacter les listes
+_MIN_COMPACTION = 64
+
+
+class TimeRange:
+    """Vue sur une plage de TimeIndex, parcourue dans les deux sens"""
+
+    __slots__ = ("_tasks", "_live", "_start", "_stop", "_holes")
+
+    def __init__(self, tasks, live, start, stop, holes=False):
+        self._tasks = tasks
+        self._live = live
+        self._start = start
+        self._stop = stop
+        # Vrai si l'index a des places libérées par des retraits : elles sont
+        # sautées au parcours et décomptées, en C, de la taille
+        self._holes = holes
+
+    def __len__(self):
+        size = self._stop - self._start
+        if self._holes:
+            size -= self._live[self._start : self._stop].count(0)
+        return size
+
+    def __iter__(self):
+        if self._holes:
+            return itertools.compress(
+                self._tasks[self._start : self._stop],
+                self._live[self._start : self._stop],
+            )
+        return map(self._tasks.__getitem__, range(self._start, self._stop))
+
+    def __reversed__(self):
+        positions = range(self._stop - 1, self._start - 1, -1)
+        if self._holes:
+            return itertools.compress(
+                map(self._tasks.__getitem__, positions),
+                map(self._live.__getitem__, positions),
+            )
+        return map(self._tasks.__getitem__, positions)
+
+
+class TimeIndex:
+    """Tâches triées par date : plages et plus récentes en O(log n + k)"""
+
+    def __init__(self):
+        # Listes parallèles triées par date ; à date égale, ordre d'insertion
+        # Les tâches sans date (completed_at à None) ne sont pas indexées
+        self._keys = []
+        self._tasks = []
+        # Un octet par place : 0 pour une tâche retirée
+        # Un retrait libère sa place en O(log n) au lieu de décaler les listes ;
+        # les places libres sont recompactées quand elles dominent
+        self._live = bytearray()
+        self._dead = 0
+        self._bulk = False
+
+    def __len__(self):
+        return len(self._keys) - self._dead
+
+    @contextmanager
+    def bulk(self):
+        # Chargement : ajouts en fin de liste puis un seul tri stable, presque
+        # linéaire quand les tâches arrivent déjà dans l'ordre chronologique
+        self._bulk = True
+        try:
+            yield self
+        finally:
+            self._bulk = False
+            keys = self._keys
+            positions = range(len(keys))
+            if self._dead:
+                positions = itertools.compress(positions, self._live)
+            order = sorted(positions, key=keys.__getitem__)
+            self._keys = [keys[i] for i in order]
+            self._tasks = [self._tasks[i] for i in order]
+            self._live = bytearray(b"\x01") * len(order)
+            self._dead = 0
+
+    def add(self, task, key):
+        if key is None:
+            return
+        if self._bulk:
+            self._keys.append(key)
+            self._tasks.append(task)
+            self._live.append(1)
+            return
+        # Les nouvelles tâches ont la date la plus récente : insertion en fin
+        # de liste, sans décalage
+        position = bisect.bisect_right(self._keys, key)
+        self._keys.insert(position, key)
+        self._tasks.insert(position, task)
+        self._live.insert(position, 1)
+
+    def remove(self, task, key):
+        # key est la date sous laquelle la tâche a été indexée
+        if key is None:
+            return
+        keys = self._keys
+        tasks = self._tasks
+        position = bisect.bisect_left(keys, key)
+        while position < len(keys) and keys[position] == key:
+            if tasks[position] is task:
+                break
+            position += 1
+        else:
+            # Date modifiée sans réindexation : recherche par identité
+            position = next(
+                (i for i, indexed in enumerate(tasks) if indexed is task), None
+            )
+            if position is None:
+                return
+        # La place garde sa clé pour que les listes restent triées
+        tasks[position] = None
+        self._live[position] = 0
+        self._dead += 1
+        self._compact()
+
+    def _compact(self):
+        dead = self._dead
+        if dead > _MIN_COMPACTION and dead > len(self._keys) - dead:
+            live = self._live
+            self._keys = list(itertools.compress(self._keys, live))
+            self._tasks = list(itertools.compress(self._tasks, live))
+            self._live = bytearray(b"\x01") * len(self._keys)
+            self._dead = 0
+
+    def range(
+        self, start=None, end=None, start_inclusive=True, end_inclusive=False
+    ) -> TimeRange:
+        # Plage [start, end) par défaut ; une borne None n'est pas limitée
+        keys = self._keys
+        if start is None:
+            low = 0
+        elif start_inclusive:
+            low = bisect.bisect_left(keys, start)
+        else:
+            low = bisect.bisect_right(keys, start)
+        if end is None:
+            high = len(keys)
+        elif end_inclusive:
+            high = bisect.bisect_right(keys, end, low)
+        else:
+            high = bisect.bisect_left(keys, end, low)
+        return TimeRange(
+            self._tasks, self._live, low, max(low, high), self._dead > 0
+        )
+
+    def between(self, start=None, end=None) -> List:
+        # Tâches datées dans [start, end), par date croissante
+        return list(self.range(start, end))
+
+    def latest(self, count) -> List:
+        # Les count tâches les plus récentes, la plus récente d'abord
+        if count <= 0:
+            return []
+        if self._dead:
+            return list(itertools.islice(reversed(self.range()), count))
+        return self._tasks[-count:][::-1]
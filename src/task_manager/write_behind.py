@@ -0,0 +1,208 @@
+import queue
+import threading
+import time
+
+from .storage import StorageBackend
+
+# Opérations de la file du thread d'écriture
+_ADD = "add"
+_UPDATE = "update"
+_DELETE = "delete"
+_REPLACE = "replace"
+_FLUSH = "flush"
+_STOP = "stop"
+
+
+class WriteBehindStorage(StorageBackend):
+    """Écriture différée : les mutations sont persistées en arrière-plan"""
+
+    def __init__(
+        self, storage, flush_interval=1.0, flush_threshold=1000, max_queue=10_000
+    ):
+        # Backend réel, utilisé uniquement depuis le thread d'écriture une fois
+        # celui-ci démarré ; un backend lié à son thread (SQLiteStorage) ne
+        # convient donc pas
+        if storage.thread_bound:
+            raise ValueError(
+                f"Stockage {type(storage).__name__} lié à son thread, "
+                "incompatible avec l'écriture différée"
+            )
+        self.storage = storage
+        # Un backend journalisé reçoit chaque mutation depuis le thread
+        self.records_mutations = storage.records_mutations
+        # Délai maximal entre une mutation et son écriture, et nombre de
+        # tâches modifiées qui déclenche une écriture sans attendre le délai
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        # File bornée : quand le thread d'écriture prend du retard, les
+        # mutations bloquent l'appelant au lieu d'accumuler sans limite
+        self._queue = queue.Queue(maxsize=max_queue)
+        # Copie des tâches propre au thread d'écriture : les backends à
+        # réécriture complète la sérialisent sans toucher aux objets vivants
+        self._mirror = {}
+        self._changed = {}
+        self._deleted = set()
+        # Vrai quand un remplacement complet attend d'être écrit
+        self._replace = False
+        self._error = None
+        self._io_lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name="task-manager-write-behind", daemon=True
+        )
+        self._thread.start()
+
+    def load(self, task_class):
+        # Les mutations déjà en file sont écrites avant de relire le stockage
+        self.flush()
+        with self._io_lock:
+            tasks = list(self.storage.load(task_class))
+            # Le backend garde les objets chargés (miroir), le gestionnaire
+            # reçoit des copies qu'il peut modifier librement
+            self._mirror = {task.id: task for task in tasks}
+            self._changed = {}
+            self._deleted = set()
+            self._replace = False
+        return [task.copy() for task in tasks]
+
+    def save(self, tasks):
+        # Remplacement complet : les copies sont prises dans le thread appelant,
+        # l'écriture se fait en arrière-plan
+        self._put((_REPLACE, [task.copy() for task in tasks]))
+        self._put((_FLUSH, None))
+
+    def save_changes(self, tasks, changed, deleted):
+        # Les mutations sont déjà en file : on demande seulement une écriture
+        # au plus tôt, sans attendre qu'elle soit faite
+        self._put((_FLUSH, None))
+
+    def needs_all_tasks(self) -> bool:
+        # Le thread d'écriture a sa propre copie des tâches (miroir)
+        return False
+
+    def record_add(self, task):
+        self._put((_ADD, task.copy()))
+
+    def record_delete(self, task_id):
+        self._put((_DELETE, task_id))
+
+    def record_update(self, task, field, value):
+        self._put((_UPDATE, task.copy(), field, value))
+
+    def flush(self):
+        # Bloque jusqu'à ce que toutes les mutations en file soient écrites
+        done = threading.Event()
+        self._put((_FLUSH, done))
+        while not done.wait(0.1):
+            if not self._thread.is_alive():
+                raise RuntimeError("Le thread d'écriture différée s'est arrêté")
+        self._raise_error()
+
+    def close(self):
+        # Écrit ce qui reste, arrête le thread puis ferme le backend réel
+        if self._thread.is_alive():
+            self._put((_STOP, None))
+            self._thread.join()
+        self.storage.close()
+        self._raise_error()
+
+    def pending_changes(self):
+        # Nombre approximatif de mutations pas encore écrites
+        return self._queue.qsize() + len(self._changed) + len(self._deleted)
+
+    def _put(self, item):
+        if not self._thread.is_alive():
+            raise RuntimeError("Le stockage à écriture différée est fermé")
+        self._queue.put(item)
+
+    def _raise_error(self):
+        # Une erreur du thread d'écriture est remontée une seule fois à
+        # l'appelant ; les changements non écrits sont retentés ensuite
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _run(self):
+        deadline = None
+        while True:
+            timeout = None
+            if deadline is not None:
+                timeout = max(deadline - time.monotonic(), 0)
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._write()
+                deadline = None
+                continue
+
+            op = item[0]
+            if op == _FLUSH:
+                self._write()
+                deadline = None
+                if item[1] is not None:
+                    item[1].set()
+                continue
+            if op == _STOP:
+                self._write()
+                return
+
+            self._apply(item)
+            if len(self._changed) + len(self._deleted) >= self.flush_threshold:
+                self._write()
+                deadline = None
+            elif deadline is None:
+                deadline = time.monotonic() + self.flush_interval
+
+    def _apply(self, item):
+        # Fusionne une mutation dans les changements en attente : plusieurs
+        # modifications d'une même tâche ne donnent qu'une écriture
+        op = item[0]
+        with self._io_lock:
+            if op == _REPLACE:
+                self._mirror = {task.id: task for task in item[1]}
+                self._changed = {}
+                self._deleted = set()
+                self._replace = True
+                return
+            if op == _DELETE:
+                task_id = item[1]
+                self._mirror.pop(task_id, None)
+                self._changed.pop(task_id, None)
+                self._deleted.add(task_id)
+                self._forward(self.storage.record_delete, task_id)
+                return
+            task = item[1]
+            self._mirror[task.id] = task
+            self._changed[task.id] = task
+            self._deleted.discard(task.id)
+            if op == _ADD:
+                self._forward(self.storage.record_add, task)
+            else:
+                self._forward(self.storage.record_update, task, item[2], item[3])
+
+    def _forward(self, record, *args):
+        # Les backends journalisés reçoivent aussi chaque mutation
+        try:
+            record(*args)
+        except Exception as e:
+            self._error = e
+
+    def _write(self):
+        with self._io_lock:
+            try:
+                if self._replace:
+                    self.storage.save(self._mirror.values())
+                elif self._changed or self._deleted:
+                    self.storage.save_changes(
+                        self._mirror.values(),
+                        list(self._changed.values()),
+                        self._deleted,
+                    )
+                else:
+                    return
+            except Exception as e:
+                # Les changements restent en attente pour la prochaine écriture
+                self._error = e
+                return
+            self._replace = False
+            self._changed = {}
+            self._deleted = set()
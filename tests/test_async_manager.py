@@ -0,0 +1,225 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.task_manager import async_manager
+from src.task_manager.async_manager import AsyncTaskManager
+from src.task_manager.storage import (
+    SegmentedJSONStorage,
+    SQLiteStorage,
+    StorageBackend,
+)
+from src.task_manager.task import Priority, Status
+
+
+class GatedStorage(StorageBackend):
+    """Backend factice dont les écritures attendent un signal"""
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.saved = []
+        self.fail = False
+
+    def load(self, task_class):
+        self.gate.wait()
+        return []
+
+    def save(self, tasks):
+        self.gate.wait()
+        if self.fail:
+            raise OSError("disque plein")
+        self.saved.append([task.title for task in tasks])
+
+
+@pytest.mark.integration
+class TestAsyncTaskManager:
+    """Tests du gestionnaire asyncio"""
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        """Test sauvegarde puis chargement asynchrones"""
+        filename = str(tmp_path / "tasks.json")
+
+        async def scenario():
+            manager = AsyncTaskManager(filename)
+            task_id = await manager.add_task("Task", priority=Priority.HIGH)
+            (await manager.get_task(task_id)).mark_completed()
+            await manager.save_to_file()
+            await manager.close()
+
+            reloaded = AsyncTaskManager(filename)
+            await reloaded.load_from_file()
+            task = await reloaded.get_task(task_id)
+            stats = await reloaded.get_statistics()
+            await reloaded.close()
+            return task, stats
+
+        task, stats = asyncio.run(scenario())
+
+        assert task.status == Status.DONE
+        assert stats["completed_tasks"] == 1
+
+    def test_save_does_not_block_loop(self):
+        """Test les autres coroutines avancent pendant une sauvegarde"""
+        storage = GatedStorage()
+        storage.gate.set()
+
+        async def scenario():
+            manager = AsyncTaskManager(storage=storage)
+            await manager.add_task("Before")
+            storage.gate.clear()
+            save = asyncio.ensure_future(manager.save_to_file())
+            await asyncio.sleep(0.05)
+            # La boucle reste disponible : mutation pendant l'écriture
+            await manager.add_task("During")
+            assert not save.done()
+            storage.gate.set()
+            await save
+            await manager.save_to_file()
+            await manager.close()
+
+        asyncio.run(scenario())
+
+        # La tâche ajoutée pendant l'écriture part avec la sauvegarde suivante
+        assert storage.saved == [["Before"], ["Before", "During"]]
+
+    def test_failed_save_keeps_changes_pending(self):
+        """Test un échec de sauvegarde garde les changements en attente"""
+        storage = GatedStorage()
+        storage.gate.set()
+        storage.fail = True
+
+        async def scenario():
+            manager = AsyncTaskManager(storage=storage)
+            await manager.add_task("Task")
+            with pytest.raises(Exception, match="Erreur lors de la sauvegarde"):
+                await manager.save_to_file()
+            pending = manager.manager.has_unsaved_changes()
+            await manager.close()
+            return pending
+
+        assert asyncio.run(scenario()) is True
+
+    def test_load_swaps_state_at_once(self):
+        """Test le chargement remplace l'état d'un coup à la fin"""
+        storage = GatedStorage()
+
+        async def scenario():
+            manager = AsyncTaskManager(storage=storage)
+            await manager.add_task("Old")
+            load = asyncio.ensure_future(manager.load_from_file())
+            await asyncio.sleep(0.05)
+            # Avant la fin du chargement, l'ancien état est toujours servi
+            before = (await manager.get_statistics())["total_tasks"]
+            storage.gate.set()
+            await load
+            after = (await manager.get_statistics())["total_tasks"]
+            await manager.close()
+            return before, after
+
+        assert asyncio.run(scenario()) == (1, 0)
+
+    def test_mutations_during_load_apply_to_loaded_state(self):
+        """Test une mutation pendant un chargement attend le nouvel état"""
+        storage = GatedStorage()
+
+        async def scenario():
+            manager = AsyncTaskManager(storage=storage)
+            load = asyncio.ensure_future(manager.load_from_file())
+            await asyncio.sleep(0.05)
+            add = asyncio.ensure_future(manager.add_task("During"))
+            await asyncio.sleep(0.05)
+            waiting = not add.done()
+            storage.gate.set()
+            await load
+            task = await manager.get_task(await add)
+            await manager.close()
+            return waiting, task
+
+        waiting, task = asyncio.run(scenario())
+
+        assert waiting
+        assert task.title == "During"
+
+    def test_incremental_save_to_unread_segments(self, tmp_path):
+        """Test sauvegarde asynchrone vers des segments jamais lus"""
+        directory = str(tmp_path / "tasks.d")
+
+        async def scenario():
+            manager = AsyncTaskManager(storage=SegmentedJSONStorage(directory))
+            await manager.load_from_file()
+            await manager.add_tasks(["A", "B", "C"])
+            await manager.save_to_file()
+            await manager.close()
+
+            reloaded = AsyncTaskManager(storage=SegmentedJSONStorage(directory))
+            await reloaded.load_from_file()
+            stats = await reloaded.get_statistics()
+            await reloaded.close()
+            return stats
+
+        assert asyncio.run(scenario())["total_tasks"] == 3
+
+    def test_update_many_accepts_positional_arguments(self):
+        """Test update_many garde la signature du gestionnaire synchrone"""
+
+        async def scenario():
+            manager = AsyncTaskManager()
+            task_ids = await manager.add_tasks(["A", "B"])
+            count = await manager.update_many(task_ids, Status.DONE, Priority.HIGH)
+            return count, await manager.get_statistics()
+
+        count, stats = asyncio.run(scenario())
+
+        assert count == 2
+        assert stats["completed_tasks"] == 2
+        assert stats["tasks_by_priority"]["high"] == 2
+
+    def test_thread_bound_storage_is_rejected(self, tmp_path):
+        """Test un stockage lié à son thread est refusé"""
+        storage = SQLiteStorage(str(tmp_path / "tasks.db"))
+
+        with pytest.raises(ValueError, match="thread"):
+            AsyncTaskManager(storage=storage)
+        storage.close()
+
+    def test_async_iterators_yield_filtered_tasks(self, monkeypatch):
+        """Test les itérateurs asynchrones filtrent et rendent la main"""
+        monkeypatch.setattr(async_manager, "CHUNK_SIZE", 2)
+
+        async def scenario():
+            manager = AsyncTaskManager(storage=GatedStorage())
+            for i in range(5):
+                await manager.add_task(f"Task {i}", priority=Priority.URGENT)
+            await manager.add_task("Other", priority=Priority.LOW)
+            urgent = [
+                task.title
+                async for task in manager.iter_tasks_by_priority(Priority.URGENT)
+            ]
+            todo = [
+                task.title async for task in manager.iter_tasks_by_status(Status.TODO)
+            ]
+            await manager.close()
+            return urgent, todo
+
+        urgent, todo = asyncio.run(scenario())
+
+        assert urgent == [f"Task {i}" for i in range(5)]
+        assert len(todo) == 6
+
+    def test_concurrent_claims_share_the_queue(self):
+        """Test des coroutines concurrentes prennent chacune une tâche"""
+
+        async def scenario():
+            manager = AsyncTaskManager(storage=GatedStorage())
+            await manager.add_task("Low", priority=Priority.LOW)
+            await manager.add_task("Urgent", priority=Priority.URGENT)
+            first = await manager.peek_next()
+            claimed = await asyncio.gather(*(manager.claim_next() for _ in range(3)))
+            await manager.close()
+            return first, claimed
+
+        first, claimed = asyncio.run(scenario())
+
+        assert first.title == "Urgent"
+        assert [task and task.title for task in claimed] == ["Urgent", "Low", None]
@@ -0,0 +1,242 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.task_manager.async_manager import AsyncTaskManager
+from src.task_manager.changes import ChangeFeed
+from src.task_manager.manager import TaskManager
+from src.task_manager.storage import StorageBackend
+from src.task_manager.task import Priority, Status, Task
+from src.task_manager.threadsafe import ConcurrentTaskManager
+
+
+def kinds(changes):
+    return [change.kind for change in changes]
+
+
+@pytest.mark.unit
+class TestChangeFeed:
+    """Tests du flux de changements"""
+
+    def setup_method(self):
+        self.feed = ChangeFeed(history=3)
+        self.task = Task("Task")
+
+    def test_sequence_numbers_and_resume(self):
+        """Test numéros croissants et reprise après un numéro"""
+        for kind in ("add", "status", "priority"):
+            self.feed.publish(kind, self.task)
+
+        assert [change.sequence for change in self.feed.since(0)] == [1, 2, 3]
+        assert kinds(self.feed.since(1)) == ["status", "priority"]
+        assert self.feed.since(3) == []
+
+    def test_resume_outside_history_is_rejected(self):
+        """Test reprise impossible hors de l'historique ou après le dernier"""
+        for _ in range(7):
+            self.feed.publish("status", self.task)
+
+        assert len(self.feed.since(4)) == 3
+        with pytest.raises(ValueError, match="historique"):
+            self.feed.since(1)
+        with pytest.raises(ValueError, match="inconnue"):
+            self.feed.since(8)
+
+    def test_subscriber_errors_are_logged(self, caplog):
+        """Test une erreur d'abonné est journalisée sans priver les autres"""
+        received = []
+
+        def failing(change):
+            raise RuntimeError("abonné en panne")
+
+        self.feed.subscribe(failing)
+        self.feed.subscribe(received.append)
+
+        self.feed.publish("add", self.task)
+        assert kinds(received) == ["add"]
+        assert "abonné en panne" in caplog.text
+
+        self.feed.unsubscribe(failing)
+        self.feed.publish("delete", self.task)
+        assert kinds(received) == ["add", "delete"]
+
+    def test_subscribe_replays_missed_changes(self):
+        """Test un abonnement avec since rejoue les changements manqués"""
+        self.feed.publish("add", self.task)
+        self.feed.publish("status", self.task)
+        received = []
+
+        self.feed.subscribe(received.append, since=1)
+        self.feed.publish("delete", self.task)
+
+        assert kinds(received) == ["status", "delete"]
+
+
+@pytest.mark.integration
+class TestManagerChanges:
+    """Tests des changements publiés par le gestionnaire"""
+
+    def test_manager_and_task_mutations_are_published(self):
+        """Test ajouts, suppressions et mutateurs de Task dans l'ordre"""
+        manager = TaskManager()
+        received = []
+        manager.changes.subscribe(received.append)
+
+        task = manager.get_task(manager.add_task("Task"))
+        task.update_priority(Priority.HIGH)
+        task.assign_to_project("p1")
+        task.mark_completed()
+        other = manager.add_tasks(["Other"])[0]
+        manager.update_many([other], status=Status.CANCELLED)
+        manager.delete_tasks([task.id, other])
+
+        assert kinds(received) == [
+            "add",
+            "priority",
+            "project_id",
+            "status",
+            "completed_at",
+            "add",
+            "status",
+            "delete",
+            "delete",
+        ]
+        assert [change.sequence for change in received] == list(range(1, 10))
+        status = received[3]
+        assert (status.task, status.old, status.new) == (
+            task,
+            Status.TODO,
+            Status.DONE,
+        )
+        assert received[-1].task_id == other
+
+    def test_completion_subscriber(self):
+        """Test un abonné réagit aux complétions sans parcourir les tâches"""
+        manager = TaskManager()
+        completed = []
+
+        def on_change(change):
+            if change.kind == "status" and change.new == Status.DONE:
+                completed.append(change.task.title)
+
+        manager.changes.subscribe(on_change)
+        for title in ("A", "B"):
+            manager.add_task(title)
+        manager.tasks[1].mark_completed()
+
+        assert completed == ["B"]
+
+    def test_failing_subscriber_does_not_break_mutations(self):
+        """Test un abonné en échec n'interrompt pas les mutations"""
+        manager = TaskManager()
+
+        def failing(change):
+            raise RuntimeError("abonné en panne")
+
+        manager.changes.subscribe(failing)
+        task = manager.get_task(manager.add_task("Task"))
+        task.mark_completed()
+
+        assert task.status == Status.DONE
+        assert task.completed_at is not None
+        assert manager.changes.last_sequence == 3
+
+    def test_checkpoint_resume(self):
+        """Test un consommateur reprend après son dernier point de reprise"""
+        manager = TaskManager()
+        manager.add_task("A")
+        checkpoint = manager.changes.last_sequence
+        manager.add_task("B")
+        manager.tasks[0].mark_completed()
+
+        missed = manager.changes.since(checkpoint)
+
+        assert kinds(missed) == ["add", "status", "completed_at"]
+
+    def test_load_publishes_reset(self, tmp_path):
+        """Test un chargement publie un changement reset"""
+        manager = TaskManager(str(tmp_path / "tasks.json"))
+        manager.load_from_file()
+
+        assert kinds(manager.changes.since(0)) == ["reset"]
+
+    def test_concurrent_changes_are_numbered_once(self):
+        """Test des threads concurrents produisent une séquence sans trou"""
+        manager = ConcurrentTaskManager()
+        sequences = []
+        manager.changes.subscribe(lambda change: sequences.append(change.sequence))
+
+        def mutate():
+            for i in range(100):
+                manager.get_task(manager.add_task(f"Task {i}")).mark_completed()
+
+        threads = [threading.Thread(target=mutate) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(sequences) == list(range(1, 1201))
+
+
+@pytest.mark.integration
+class TestAsyncChanges:
+    """Tests de l'itérateur asynchrone des changements"""
+
+    def test_watch_yields_live_changes(self):
+        """Test l'itérateur reçoit les changements au fil de l'eau"""
+
+        async def scenario():
+            manager = AsyncTaskManager(storage=StorageBackend())
+            first = await manager.add_task("Before")
+            received = []
+
+            async def consume():
+                async for change in manager.changes.watch(since=0):
+                    received.append((change.kind, change.task_id))
+                    if len(received) == 3:
+                        return
+
+            consumer = asyncio.ensure_future(consume())
+            await asyncio.sleep(0)
+            second = await manager.add_task("After")
+            (await manager.get_task(second)).mark_completed()
+            await asyncio.wait_for(consumer, timeout=5)
+            await manager.close()
+            return received, first, second
+
+        received, first, second = asyncio.run(scenario())
+
+        assert received == [("add", first), ("add", second), ("status", second)]
+
+    def test_watch_wakes_up_on_other_threads(self):
+        """Test l'itérateur est réveillé par un changement d'un autre thread"""
+        manager = ConcurrentTaskManager()
+
+        async def scenario():
+            async def consume():
+                async for change in manager.changes.watch():
+                    return change.kind
+
+            consumer = asyncio.ensure_future(consume())
+            await asyncio.sleep(0)
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, manager.add_task, "Task")
+            return await asyncio.wait_for(consumer, timeout=5)
+
+        assert asyncio.run(scenario()) == "add"
+
+    def test_feed_survives_async_load(self, tmp_path):
+        """Test le flux et ses numéros survivent à un chargement asynchrone"""
+
+        async def scenario():
+            manager = AsyncTaskManager(str(tmp_path / "tasks.json"))
+            feed = manager.changes
+            await manager.add_task("Task")
+            await manager.save_to_file()
+            await manager.load_from_file()
+            await manager.close()
+            return manager.changes is feed, kinds(feed.since(0))
+
+        assert asyncio.run(scenario()) == (True, ["add", "reset"])
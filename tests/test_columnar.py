@@ -0,0 +1,129 @@
+from datetime import datetime
+
+import pytest
+
+from src.task_manager.columnar import ColumnarTaskStore, from_epoch_us, to_epoch_us
+from src.task_manager.manager import TaskManager
+from src.task_manager.task import Priority, Status, Task
+
+
+@pytest.mark.unit
+class TestColumnarTaskStore:
+    """Tests du stockage colonnaire"""
+
+    def setup_method(self):
+        self.store = ColumnarTaskStore()
+        self.task1_id = self.store.add_task("Préparer", "Slides", Priority.HIGH)
+        self.task2_id = self.store.add_task("Réserver", "Hôtel", Priority.LOW)
+        self.task3_id = self.store.add_task("Corriger", "Bug", Priority.HIGH)
+
+    def test_views_expose_task_api(self):
+        """Test les vues exposent l'API de Task"""
+        view = self.store.get_task(self.task2_id)
+
+        assert view.id == self.task2_id
+        assert view.title == "Réserver"
+        assert view.description == "Hôtel"
+        assert view.priority == Priority.LOW
+        assert view.status == Status.TODO
+        assert isinstance(view.created_at, datetime)
+        assert view.completed_at is None
+        assert view.project_id is None
+
+    def test_view_mutations_write_columns(self):
+        """Test les mutations d'une vue modifient les colonnes"""
+        view = self.store.get_task(self.task1_id)
+        view.mark_completed()
+        view.update_priority(Priority.URGENT)
+        view.assign_to_project("project-1")
+
+        fresh_view = self.store.get_task(self.task1_id)
+        assert fresh_view.status == Status.DONE
+        assert isinstance(fresh_view.completed_at, datetime)
+        assert fresh_view.priority == Priority.URGENT
+        assert fresh_view.project_id == "project-1"
+
+    def test_filters_and_statistics(self):
+        """Test filtres et statistiques par masques"""
+        self.store.get_task(self.task3_id).mark_completed()
+
+        high_ids = [v.id for v in self.store.get_tasks_by_priority(Priority.HIGH)]
+        done_ids = [v.id for v in self.store.get_tasks_by_status(Status.DONE)]
+        stats = self.store.get_statistics()
+
+        assert high_ids == [self.task1_id, self.task3_id]
+        assert done_ids == [self.task3_id]
+        assert stats["total_tasks"] == 3
+        assert stats["completed_tasks"] == 1
+        assert stats["tasks_by_priority"]["high"] == 2
+        assert stats["tasks_by_status"]["todo"] == 2
+
+    def test_delete_excludes_row_from_queries(self):
+        """Test suppression exclut la ligne des requêtes"""
+        assert self.store.delete_task(self.task1_id) is True
+        assert self.store.delete_task(self.task1_id) is False
+
+        assert self.store.get_task(self.task1_id) is None
+        assert len(self.store) == 2
+        assert [v.id for v in self.store.get_tasks_by_priority(Priority.HIGH)] == [
+            self.task3_id
+        ]
+        assert self.store.get_statistics()["tasks_by_status"]["todo"] == 2
+
+    def test_compact_drops_deleted_rows(self):
+        """Test compactage supprime les pierres tombales"""
+        self.store.delete_task(self.task2_id)
+        self.store.compact()
+
+        assert len(self.store._ids) == 2
+        assert [v.title for v in self.store] == ["Préparer", "Corriger"]
+        assert self.store.get_task(self.task3_id).description == "Bug"
+
+    def test_views_follow_rows_after_compact(self):
+        """Test une vue garde sa tâche après compactage et suppression"""
+        view = self.store.get_task(self.task3_id)
+        deleted = self.store.get_task(self.task2_id)
+        self.store.delete_task(self.task1_id)
+        self.store.delete_task(self.task2_id)
+        self.store.compact()
+
+        assert view.title == "Corriger"
+        view.mark_completed()
+        assert self.store.get_task(self.task3_id).status == Status.DONE
+        assert self.store.get_statistics()["completed_tasks"] == 1
+        with pytest.raises(ValueError, match="supprimée"):
+            deleted.title
+
+    def test_round_trip_with_manager_tasks(self):
+        """Test conversion depuis et vers des Task"""
+        manager = TaskManager("test_tasks.json")
+        task_id = manager.add_task("Planifier", "Vacances", Priority.MEDIUM)
+        manager.get_task(task_id).assign_to_project("perso")
+        manager.get_task(task_id).mark_completed()
+
+        store = ColumnarTaskStore.from_tasks(manager.tasks)
+        task = store.get_task(task_id).to_task()
+
+        assert isinstance(task, Task)
+        assert task.to_dict() == manager.get_task(task_id).to_dict()
+
+    def test_legacy_float_ids(self):
+        """Test anciens IDs flottants avec la colonne 'd'"""
+        task = Task("Ancienne tâche")
+        task.id = 1752231369.733616
+        store = ColumnarTaskStore.from_tasks([task], id_typecode="d")
+
+        assert store.get_task(1752231369.733616).title == "Ancienne tâche"
+
+    def test_duplicate_id_raises_error(self):
+        """Test ID en double refusé"""
+        task = self.store.get_task(self.task1_id).to_task()
+
+        with pytest.raises(ValueError, match="ID de tâche en double"):
+            self.store.append(task)
+
+    def test_epoch_conversion_is_exact(self):
+        """Test conversion datetime <-> microsecondes exacte"""
+        moment = datetime(2025, 7, 11, 12, 56, 9, 733621)
+
+        assert from_epoch_us(to_epoch_us(moment)) == moment
@@ -0,0 +1,104 @@
+from datetime import datetime
+
+import pytest
+
+from src.task_manager.ids import (
+    CounterIdGenerator,
+    TimeOrderedIdGenerator,
+    UUIDIdGenerator,
+)
+from src.task_manager.task import Task
+
+
+@pytest.mark.unit
+class TestIdGenerators:
+    """Tests des générateurs d'IDs"""
+
+    def test_counter_generator_is_sequential(self):
+        """Test compteur monotone"""
+        generator = CounterIdGenerator(start=10)
+
+        assert [generator() for _ in range(3)] == [10, 11, 12]
+
+    def test_time_ordered_ids_are_unique_and_sorted(self):
+        """Test IDs ordonnés uniques même dans une boucle serrée"""
+        generator = TimeOrderedIdGenerator()
+        ids = [generator() for _ in range(10000)]
+
+        assert len(set(ids)) == len(ids)
+        assert ids == sorted(ids)
+        assert all(0 < task_id < 2**63 for task_id in ids)
+
+    def test_time_ordered_ids_survive_clock_going_backwards(self):
+        """Test IDs croissants malgré une horloge qui recule"""
+        times = iter([1700000000.005, 1700000000.001, 1700000000.001])
+        generator = TimeOrderedIdGenerator(clock=lambda: next(times))
+        ids = [generator() for _ in range(3)]
+
+        assert ids == sorted(ids)
+        assert len(set(ids)) == 3
+
+    def test_time_ordered_sequence_overflow_borrows_next_ms(self):
+        """Test séquence épuisée passe à la milliseconde suivante"""
+        generator = TimeOrderedIdGenerator(clock=lambda: 1700000000.0)
+        ids = [generator() for _ in range(5000)]
+
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+
+    def test_time_ordered_encodes_node_and_time(self):
+        """Test ID encode le nœud et l'instant de création"""
+        moment = datetime(2024, 1, 1, 12, 0, 0)
+        generator = TimeOrderedIdGenerator(
+            node_id=7, clock=lambda: moment.timestamp()
+        )
+        task_id = generator()
+
+        assert TimeOrderedIdGenerator.datetime_of(task_id) == moment
+        assert task_id >= TimeOrderedIdGenerator.min_id_at(moment)
+        assert (task_id >> 12) & 0x3FF == 7
+
+    def test_time_ordered_rejects_invalid_node(self):
+        """Test identifiant de nœud invalide"""
+        with pytest.raises(ValueError, match="identifiant de nœud"):
+            TimeOrderedIdGenerator(node_id=1024)
+
+    def test_uuid_generator(self):
+        """Test IDs UUID"""
+        generator = UUIDIdGenerator()
+        first, second = generator(), generator()
+
+        assert first != second
+        assert len(first) == 32
+
+
+@pytest.mark.unit
+class TestTaskIdGenerator:
+    """Tests du générateur d'IDs utilisé par Task"""
+
+    def setup_method(self):
+        self.default_generator = Task.id_generator
+
+    def teardown_method(self):
+        Task.id_generator = self.default_generator
+
+    def test_task_uses_pluggable_generator(self):
+        """Test Task utilise le générateur configuré"""
+        Task.id_generator = CounterIdGenerator(start=100)
+
+        assert Task("A").id == 100
+        assert Task("B").id == 101
+
+    def test_from_dict_keeps_legacy_float_ids(self):
+        """Test anciens IDs flottants conservés au chargement"""
+        task = Task.from_dict(
+            {
+                "id": 1752231369.733616,
+                "title": "Préparer la présentation",
+                "priority": "high",
+                "status": "todo",
+                "created_at": "2025-07-11T12:56:09.733621",
+            }
+        )
+
+        assert task.id == 1752231369.733616
@@ -0,0 +1,244 @@
+import multiprocessing
+import time
+
+import pytest
+
+from src.task_manager.leases import FileLeaseStore, Lease, LeaseTable, lease_file
+from src.task_manager.manager import TaskManager
+from src.task_manager.storage import JSONFileStorage, SQLiteStorage
+from src.task_manager.task import Priority, Status
+from src.task_manager.threadsafe import ConcurrentTaskManager
+
+
+def open_manager(filename):
+    # Un gestionnaire par processus, sur le même fichier ou la même base
+    if filename.endswith(".db"):
+        storage = SQLiteStorage(filename)
+    else:
+        storage = JSONFileStorage(filename)
+    manager = TaskManager(filename, storage=storage, shared_leases=True)
+    manager.load_from_file()
+    return manager
+
+
+def create_tasks(filename, count):
+    manager = open_manager(filename)
+    task_ids = manager.add_tasks(f"Task {i}" for i in range(count))
+    manager.save_to_file()
+    manager.close()
+    return task_ids
+
+
+def work(filename, worker_id, results):
+    # Worker : prend et termine des tâches jusqu'à ce qu'il n'en reste plus
+    manager = open_manager(filename)
+    claimed = []
+    task = manager.claim(worker_id, ttl=30)
+    while task is not None:
+        claimed.append(task.id)
+        assert manager.release(task.id, worker_id)
+        task = manager.claim(worker_id, ttl=30)
+    manager.close()
+    results.put(claimed)
+
+
+def crash(filename, ttl):
+    # Worker arrêté sans rendre son bail
+    manager = open_manager(filename)
+    manager.claim("crashed", ttl)
+    manager.storage.close()
+
+
+@pytest.mark.unit
+class TestLeaseTable:
+    """Tests de la table des baux"""
+
+    def test_expire_returns_due_leases_in_order(self):
+        """Test seuls les baux échus sortent, par échéance"""
+        table = LeaseTable()
+        for task_id, expires_at in ((1, 30.0), (2, 10.0), (3, 20.0)):
+            table.put(Lease(task_id, "w", expires_at))
+
+        assert table.expire(5.0) == []
+        assert [lease.task_id for lease in table.expire(20.0)] == [2, 3]
+        assert [lease.task_id for lease in table] == [1]
+
+    def test_renewed_and_removed_leases_do_not_expire(self):
+        """Test un bail renouvelé ou rendu ne sort pas à l'ancienne échéance"""
+        table = LeaseTable()
+        table.put(Lease(1, "w", 10.0))
+        table.put(Lease(2, "w", 10.0))
+        table.put(Lease(1, "w", 50.0))
+        table.remove(2)
+
+        assert table.expire(20.0) == []
+        assert table.get(1).expires_at == 50.0
+
+    def test_heartbeats_do_not_grow_heap(self):
+        """Test des renouvellements répétés ne font pas grossir le tas"""
+        table = LeaseTable()
+        for i in range(1000):
+            table.put(Lease(1, "w", float(i)))
+
+        assert len(table._heap) <= 66
+
+    def test_file_store_keeps_finished_tasks(self, tmp_path):
+        """Test le fichier de baux garde les tâches terminées"""
+        store = FileLeaseStore(str(tmp_path / "tasks.leases.json"))
+        with store.transaction() as leases:
+            leases.put(Lease(1, "w", 10.0))
+            leases.finish(Lease(2, "w", 10.0))
+
+        with store.transaction() as leases:
+            assert leases.get(1).expires_at == 10.0
+            assert leases.get(2).finished
+            assert [lease.task_id for lease in leases.expire(100.0)] == [1]
+
+    def test_lease_file_name(self):
+        """Test nom du fichier de baux"""
+        assert lease_file("data/tasks.json") == "data/tasks.leases.json"
+
+
+@pytest.mark.integration
+class TestManagerLeases:
+    """Tests des baux du gestionnaire dans un processus"""
+
+    def setup_method(self):
+        self.manager = TaskManager()
+        self.low = self.manager.add_task("Low", priority=Priority.LOW)
+        self.urgent = self.manager.add_task("Urgent", priority=Priority.URGENT)
+
+    def test_claim_stamps_owner_and_deadline(self):
+        """Test claim pose un bail et passe la tâche à IN_PROGRESS"""
+        before = time.time()
+        task = self.manager.claim("w1", ttl=60)
+
+        lease = self.manager.get_lease(task.id)
+        assert task.id == self.urgent
+        assert task.status == Status.IN_PROGRESS
+        assert lease.worker_id == "w1"
+        assert before + 60 <= lease.expires_at <= time.time() + 60
+
+    def test_heartbeat_extends_only_own_lease(self):
+        """Test heartbeat prolonge le bail de son seul propriétaire"""
+        task = self.manager.claim("w1", ttl=60)
+        deadline = self.manager.get_lease(task.id).expires_at
+
+        assert self.manager.heartbeat(task.id, "w1", ttl=120)
+        assert self.manager.get_lease(task.id).expires_at > deadline
+        assert not self.manager.heartbeat(task.id, "w2", ttl=120)
+        assert not self.manager.heartbeat(self.low, "w1", ttl=120)
+
+    def test_expired_lease_returns_task_to_todo(self):
+        """Test un bail échu remet la tâche à TODO pour un autre worker"""
+        task = self.manager.claim("w1", ttl=60)
+
+        assert self.manager.reap_expired_leases(time.time() + 30) == []
+        assert self.manager.reap_expired_leases(time.time() + 61) == [task.id]
+        assert task.status == Status.TODO
+        assert not self.manager.heartbeat(task.id, "w1", ttl=60)
+        assert self.manager.claim("w2", ttl=60) is task
+
+    def test_release_completes_or_requeues(self):
+        """Test release termine la tâche ou la remet à faire"""
+        task = self.manager.claim("w1", ttl=60)
+        assert not self.manager.release(task.id, "w2")
+        assert self.manager.release(task.id, "w1", done=False)
+        assert task.status == Status.TODO
+
+        task = self.manager.claim("w2", ttl=60)
+        assert self.manager.release(task.id, "w2")
+        assert task.status == Status.DONE
+        assert self.manager.get_lease(task.id) is None
+        assert self.manager.claim("w2", ttl=60).id == self.low
+        assert self.manager.claim("w2", ttl=60) is None
+
+    def test_concurrent_manager_reaps_under_lock(self):
+        """Test baux sur le gestionnaire partagé entre threads"""
+        manager = ConcurrentTaskManager(debug=True)
+        task_id = manager.add_task("Task")
+        manager.claim("w1", ttl=0)
+
+        assert manager.claim("w2", ttl=60).id == task_id
+        assert manager.get_lease(task_id).worker_id == "w2"
+        assert manager.get_statistics()["tasks_by_status"]["in_progress"] == 1
+
+    def test_saved_completions_are_pruned(self, tmp_path):
+        """Test les marqueurs des tâches terminées sortent à la sauvegarde"""
+        filename = str(tmp_path / "tasks.json")
+        task_ids = create_tasks(filename, 3)
+        stale = open_manager(filename)
+        worker = open_manager(filename)
+        for _ in task_ids:
+            task = worker.claim("w1", ttl=30)
+            worker.release(task.id, "w1")
+        worker.save_to_file()
+
+        with FileLeaseStore(lease_file(filename)).transaction() as leases:
+            assert len(leases) == 0
+        # Chargée avant la sauvegarde, l'autre copie relit les statuts
+        assert stale.claim("w2", ttl=30) is None
+        assert stale.get_task(task_ids[0]).status == Status.DONE
+
+    def test_deleted_tasks_leave_the_registry(self, tmp_path):
+        """Test une tâche supprimée perd son bail et son marqueur"""
+        filename = str(tmp_path / "tasks.json")
+        create_tasks(filename, 2)
+        manager = open_manager(filename)
+        done = manager.claim("w1", ttl=30)
+        manager.release(done.id, "w1")
+        running = manager.claim("w1", ttl=30)
+
+        manager.delete_tasks([done.id, running.id])
+
+        with FileLeaseStore(lease_file(filename)).transaction() as leases:
+            assert len(leases) == 0
+
+    def test_unsupported_storage_is_rejected(self):
+        """Test baux partagés refusés par un stockage non partageable"""
+        with pytest.raises(ValueError, match="Baux partagés"):
+            TaskManager(write_behind=True, shared_leases=True)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("filename", ["tasks.json", "tasks.db"])
+class TestSharedLeases:
+    """Tests des baux partagés entre processus"""
+
+    def test_workers_claim_each_task_once(self, tmp_path, filename):
+        """Test des processus concurrents prennent chaque tâche une fois"""
+        filename = str(tmp_path / filename)
+        task_ids = create_tasks(filename, 40)
+        context = multiprocessing.get_context()
+        results = context.Queue()
+        workers = [
+            context.Process(target=work, args=(filename, f"w{i}", results))
+            for i in range(4)
+        ]
+        for process in workers:
+            process.start()
+        claimed = [task_id for _ in workers for task_id in results.get(timeout=60)]
+        for process in workers:
+            process.join()
+
+        assert sorted(claimed) == sorted(task_ids)
+        manager = open_manager(filename)
+        assert manager.claim("late", ttl=30) is None
+        manager.close()
+
+    def test_crashed_worker_lease_expires(self, tmp_path, filename):
+        """Test la tâche d'un worker arrêté est reprise après l'échéance"""
+        filename = str(tmp_path / filename)
+        first, second = create_tasks(filename, 2)
+        process = multiprocessing.get_context().Process(
+            target=crash, args=(filename, 0.5)
+        )
+        process.start()
+        process.join()
+        manager = open_manager(filename)
+
+        assert manager.claim("w1", ttl=30).id == second
+        assert manager.claim("w1", ttl=30) is None
+        time.sleep(0.6)
+        assert manager.claim("w1", ttl=30).id == first
+        manager.close()
@@ -1,10 +1,11 @@
 import json
-from unittest.mock import mock_open, patch
+from datetime import datetime
+from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
 
 from src.task_manager.manager import TaskManager
-from src.task_manager.task import Priority, Status
+from src.task_manager.task import Priority, SlottedTask, Status, Task
 
 
 @pytest.mark.unit
@@ -142,15 +143,24 @@ class TestTaskManagerPersistence:
         task1 = self.manager.get_task(self.task1_id)
         task1.mark_completed()
 
+    @patch("os.replace")
+    @patch("os.fsync")
     @patch("builtins.open", new_callable=mock_open)
     @patch("json.dump")
-    def test_save_to_file_success(self, mock_json_dump, mock_file):
+    def test_save_to_file_success(
+        self, mock_json_dump, mock_file, mock_fsync, mock_replace
+    ):
         """Test sauvegarde réussie"""
         # Exécution de la sauvegarde des tâches
         self.manager.save_to_file()
 
-        # Vérification que le fichier est ouvert en mode écriture avec le bon encodage
-        mock_file.assert_called_once_with("test_tasks.json", "w", encoding="utf-8")
+        # Vérification que le fichier temporaire est ouvert en mode écriture avec
+        # le bon encodage, synchronisé puis substitué au fichier cible
+        mock_file.assert_called_once_with(
+            "test_tasks.json.tmp", "w", encoding="utf-8", buffering=1024 * 1024
+        )
+        mock_fsync.assert_called_once()
+        mock_replace.assert_called_once_with("test_tasks.json.tmp", "test_tasks.json")
 
         # Vérification que json.dump est appelé pour la sérialisation
         mock_json_dump.assert_called_once()
@@ -288,3 +298,362 @@ class TestTaskManagerAdditional:
             self.manager.load_from_file()
 
         assert "Erreur lors du chargement" in str(excinfo.value)
+
+
+@pytest.mark.unit
+class TestTaskManagerIndex:
+    """Tests de l'index des tâches par ID"""
+
+    def setup_method(self):
+        self.manager = TaskManager("test_tasks.json")
+        self.task_ids = [
+            self.manager.add_task(f"Task {i}", priority=Priority.LOW)
+            for i in range(5)
+        ]
+
+    def test_ids_are_unique_in_tight_loop(self):
+        """Test IDs uniques pour des tâches créées en rafale"""
+        assert len(set(self.task_ids)) == 5
+
+    def test_delete_keeps_order_and_index(self):
+        """Test suppression conserve l'ordre et l'index"""
+        assert self.manager.delete_task(self.task_ids[1]) is True
+        assert self.manager.delete_task(self.task_ids[1]) is False
+
+        assert [t.id for t in self.manager.tasks] == [
+            self.task_ids[0],
+            self.task_ids[2],
+            self.task_ids[3],
+            self.task_ids[4],
+        ]
+        assert self.manager.get_task(self.task_ids[1]) is None
+        assert self.manager.get_task(self.task_ids[3]).title == "Task 3"
+
+    def test_assign_tasks_rebuilds_index(self):
+        """Test affectation de la liste reconstruit l'index"""
+        kept = self.manager.tasks[:2]
+        self.manager.tasks = kept
+
+        assert len(self.manager.tasks) == 2
+        assert self.manager.get_task(self.task_ids[0]) is kept[0]
+        assert self.manager.get_task(self.task_ids[4]) is None
+
+    def test_tasks_list_changes_do_not_touch_index(self):
+        """Test modifier la liste renvoyée ne désynchronise pas l'index"""
+        extra = Task("Extra")
+        self.manager.tasks.append(extra)
+        del self.manager.tasks[0]
+
+        assert len(self.manager.tasks) == 5
+        assert self.manager.get_task(extra.id) is None
+        assert self.manager.get_task(self.task_ids[0]) is not None
+
+    def test_assign_duplicate_ids_raises_error(self):
+        """Test IDs en double refusés"""
+        task = self.manager.tasks[0]
+        with pytest.raises(ValueError, match="ID de tâche en double"):
+            self.manager.tasks = [task, task]
+
+    @patch("builtins.open", new_callable=mock_open, read_data="[]")
+    @patch("json.load")
+    def test_load_from_file_indexes_tasks(self, mock_json_load, mock_file):
+        """Test chargement alimente l'index"""
+        mock_json_load.return_value = [
+            {
+                "id": 42.5,
+                "title": "Loaded Task",
+                "priority": "low",
+                "status": "todo",
+                "created_at": "2024-01-01T12:00:00",
+            }
+        ]
+        self.manager.load_from_file()
+
+        assert self.manager.get_task(42.5).title == "Loaded Task"
+        assert self.manager.get_task(self.task_ids[0]) is None
+
+
+@pytest.mark.unit
+class TestTaskManagerSecondaryIndexes:
+    """Tests des index par statut, priorité et projet"""
+
+    def setup_method(self):
+        self.manager = TaskManager("test_tasks.json")
+        self.task1_id = self.manager.add_task("Task 1", priority=Priority.HIGH)
+        self.task2_id = self.manager.add_task("Task 2", priority=Priority.LOW)
+        self.task1 = self.manager.get_task(self.task1_id)
+        self.task2 = self.manager.get_task(self.task2_id)
+
+    def test_mark_completed_moves_status_bucket(self):
+        """Test marquage comme terminée met à jour l'index de statut"""
+        self.task1.mark_completed()
+
+        assert self.manager.get_tasks_by_status(Status.DONE) == [self.task1]
+        assert self.manager.get_tasks_by_status(Status.TODO) == [self.task2]
+
+    def test_update_priority_moves_priority_bucket(self):
+        """Test changement de priorité met à jour l'index de priorité"""
+        self.task2.update_priority(Priority.URGENT)
+
+        assert self.manager.get_tasks_by_priority(Priority.LOW) == []
+        assert self.manager.get_tasks_by_priority(Priority.URGENT) == [self.task2]
+
+    def test_assign_to_project_moves_project_bucket(self):
+        """Test assignation à un projet met à jour l'index de projet"""
+        self.task1.assign_to_project("project-1")
+        self.task2.assign_to_project("project-1")
+        self.task2.assign_to_project("project-2")
+
+        assert self.manager.get_tasks_by_project("project-1") == [self.task1]
+        assert self.manager.get_tasks_by_project("project-2") == [self.task2]
+        assert self.manager.get_tasks_by_project(None) == []
+        assert self.manager.get_tasks_by_project("unknown") == []
+
+    def test_deleted_task_leaves_indexes(self):
+        """Test tâche supprimée retirée des index et plus suivie"""
+        self.task1.assign_to_project("project-1")
+        self.manager.delete_task(self.task1_id)
+
+        # Les changements sur une tâche supprimée n'affectent plus les index
+        self.task1.mark_completed()
+
+        assert self.manager.get_tasks_by_status(Status.DONE) == []
+        assert self.manager.get_tasks_by_priority(Priority.HIGH) == []
+        assert self.manager.get_tasks_by_project("project-1") == []
+
+
+@pytest.mark.unit
+class TestTaskManagerStatisticsCounters:
+    """Tests des compteurs incrémentaux des statistiques"""
+
+    def setup_method(self):
+        self.manager = TaskManager("test_tasks.json", debug=True)
+
+    def test_counters_follow_mutations(self):
+        """Test compteurs suivent ajouts, changements et suppressions"""
+        task1_id = self.manager.add_task("Task 1", priority=Priority.HIGH)
+        task2_id = self.manager.add_task("Task 2", priority=Priority.HIGH)
+        self.manager.get_task(task1_id).mark_completed()
+        self.manager.get_task(task2_id).update_priority(Priority.URGENT)
+        self.manager.delete_task(task1_id)
+
+        stats = self.manager.get_statistics()
+
+        assert stats["total_tasks"] == 1
+        assert stats["completed_tasks"] == 0
+        assert stats["tasks_by_priority"]["urgent"] == 1
+        assert stats["tasks_by_priority"]["high"] == 0
+        assert stats["tasks_by_status"]["todo"] == 1
+        assert stats["tasks_by_status"]["done"] == 0
+
+    def test_debug_mode_detects_drift(self):
+        """Test mode debug détecte des compteurs incohérents"""
+        task_id = self.manager.add_task("Task 1")
+        # Changement qui contourne la notification du gestionnaire
+        self.manager.get_task(task_id)._status = Status.DONE
+
+        with pytest.raises(RuntimeError, match="Statistiques incohérentes"):
+            self.manager.get_statistics()
+
+
+@pytest.mark.unit
+class TestTaskManagerTaskClass:
+    """Tests du choix de la classe de tâche"""
+
+    def test_manager_creates_slotted_tasks(self):
+        """Test gestionnaire configuré pour des tâches compactes"""
+        manager = TaskManager("test_tasks.json", task_class=SlottedTask)
+        task_id = manager.add_task("Compact Task", priority=Priority.HIGH)
+        task = manager.get_task(task_id)
+        task.mark_completed()
+
+        assert type(task) is SlottedTask
+        assert manager.get_tasks_by_status(Status.DONE) == [task]
+
+
+@pytest.mark.unit
+class TestTaskManagerChangeTracking:
+    """Tests du suivi des modifications entre deux sauvegardes"""
+
+    def setup_method(self):
+        self.manager = TaskManager()
+        self.manager.storage = MagicMock(supports_queries=False)
+        self.manager.storage.load.return_value = [
+            Task("Task 1"),
+            Task("Task 2"),
+        ]
+        self.manager.load_from_file()
+        self.first, self.second = self.manager.tasks
+
+    def test_loaded_manager_has_no_unsaved_changes(self):
+        """Test aucun changement en attente juste après le chargement"""
+        assert self.manager.has_unsaved_changes() is False
+
+    def test_save_sends_only_changes(self):
+        """Test la sauvegarde ne transmet que les changements"""
+        self.first.mark_completed()
+        new_id = self.manager.add_task("Task 3")
+        self.manager.delete_task(self.second.id)
+
+        self.manager.save_to_file()
+
+        self.manager.storage.save.assert_not_called()
+        tasks, changed, deleted = self.manager.storage.save_changes.call_args[0]
+        assert list(tasks) == self.manager.tasks
+        assert changed == [self.first, self.manager.get_task(new_id)]
+        assert deleted == {self.second.id}
+
+    def test_save_resets_changes_and_dirty_flags(self):
+        """Test la sauvegarde vide les changements et nettoie les tâches"""
+        self.first.update_priority(Priority.HIGH)
+        self.manager.save_to_file()
+
+        assert self.first.dirty is False
+        assert self.manager.has_unsaved_changes() is False
+
+    def test_added_then_deleted_task_is_only_deleted(self):
+        """Test une tâche ajoutée puis supprimée n'est plus à écrire"""
+        task_id = self.manager.add_task("Temporary")
+        self.manager.delete_task(task_id)
+        self.manager.save_to_file()
+
+        _, changed, deleted = self.manager.storage.save_changes.call_args[0]
+        assert changed == []
+        assert deleted == {task_id}
+
+    def test_replacing_tasks_requires_full_save(self):
+        """Test remplacer toutes les tâches force une sauvegarde complète"""
+        self.manager.tasks = [Task("Other")]
+        self.manager.save_to_file()
+
+        self.manager.storage.save.assert_called_once_with(self.manager.tasks)
+        self.manager.storage.save_changes.assert_not_called()
+
+    def test_export_keeps_pending_changes(self):
+        """Test un export vers un autre fichier garde les changements en attente"""
+        self.first.mark_completed()
+        with patch("src.task_manager.manager.JSONFileStorage") as export_storage:
+            self.manager.save_to_file("export.json")
+
+        export_storage.return_value.save.assert_called_once()
+        assert self.manager.has_unsaved_changes() is True
+
+
+@pytest.mark.unit
+class TestTaskManagerBulkOperations:
+    """Tests des opérations en masse"""
+
+    def setup_method(self):
+        self.manager = TaskManager(debug=True)
+        self.manager.storage = MagicMock(supports_queries=False)
+
+    def test_add_tasks(self):
+        """Test ajout en masse depuis des titres et des dicts"""
+        task_ids = self.manager.add_tasks(
+            ["Task 1", {"title": "Task 2", "priority": Priority.HIGH}]
+        )
+
+        assert [task.id for task in self.manager.tasks] == task_ids
+        assert self.manager.get_task(task_ids[1]).priority == Priority.HIGH
+        assert self.manager.get_statistics()["total_tasks"] == 2
+        self.manager.storage.record_add_many.assert_called_once_with(
+            self.manager.tasks
+        )
+        self.manager.storage.record_add.assert_not_called()
+
+    def test_add_tasks_is_all_or_nothing(self):
+        """Test un élément invalide n'ajoute aucune tâche"""
+        with pytest.raises(ValueError):
+            self.manager.add_tasks(["Task 1", ""])
+
+        assert self.manager.tasks == []
+
+    def test_delete_tasks(self):
+        """Test suppression en masse, IDs absents ou répétés ignorés"""
+        task_ids = self.manager.add_tasks(["Task 1", "Task 2", "Task 3"])
+
+        deleted = self.manager.delete_tasks([task_ids[0], task_ids[2], task_ids[0], 42])
+
+        assert deleted == 2
+        assert [task.id for task in self.manager.tasks] == [task_ids[1]]
+        assert self.manager.get_statistics()["total_tasks"] == 1
+        self.manager.storage.record_delete_many.assert_called_once_with(
+            [task_ids[0], task_ids[2]]
+        )
+
+    def test_update_many(self):
+        """Test mise à jour en masse des champs indexés"""
+        task_ids = self.manager.add_tasks(["Task 1", "Task 2", "Task 3"])
+        self.manager.get_task(task_ids[0]).update_priority(Priority.URGENT)
+
+        updated = self.manager.update_many(
+            task_ids[:2] + [42],
+            status=Status.IN_PROGRESS,
+            priority=Priority.URGENT,
+            project_id="project-1",
+        )
+
+        assert updated == 2
+        assert len(self.manager.get_tasks_by_status(Status.IN_PROGRESS)) == 2
+        assert len(self.manager.get_tasks_by_project("project-1")) == 2
+        assert self.manager.get_statistics()["tasks_by_priority"]["urgent"] == 2
+        # Un lot par champ, limité aux tâches dont la valeur change
+        storage = self.manager.storage
+        priority_call = storage.record_update_many.call_args_list[1]
+        assert priority_call.args[1:] == ("priority", Priority.URGENT)
+        assert [task.id for task in priority_call.args[0]] == [task_ids[1]]
+        storage.record_update.assert_called_once()  # update_priority ci-dessus
+
+    def test_update_many_can_unassign_project(self):
+        """Test project_id=None désassigne, l'omettre ne change rien"""
+        task_ids = self.manager.add_tasks(["Task 1", "Task 2"])
+        self.manager.update_many(task_ids, project_id="project-1")
+        self.manager.update_many(task_ids, status=Status.DONE)
+        assert len(self.manager.get_tasks_by_project("project-1")) == 2
+
+        self.manager.update_many(task_ids, project_id=None)
+        assert self.manager.get_tasks_by_project("project-1") == []
+
+    def test_update_many_stamps_completion(self):
+        """Test passage à DONE en masse daté comme mark_completed"""
+        task_ids = self.manager.add_tasks(["Task 1", "Task 2", "Task 3"])
+        self.manager.get_task(task_ids[2]).mark_completed()
+        done_at = self.manager.get_task(task_ids[2]).completed_at
+
+        before = datetime.now()
+        self.manager.update_many(task_ids, status=Status.DONE)
+
+        for task_id in task_ids[:2]:
+            assert self.manager.get_task(task_id).completed_at >= before
+        # Une tâche déjà terminée garde sa date
+        assert self.manager.get_task(task_ids[2]).completed_at == done_at
+        recent = self.manager.get_recently_completed(3)
+        assert {task.id for task in recent} == set(task_ids)
+        between = self.manager.get_tasks_completed_between(before)
+        assert sorted(task.id for task in between) == sorted(task_ids[:2])
+        completed_call = self.manager.storage.record_update_many.call_args_list[1]
+        assert completed_call.args[1] == "completed_at"
+
+    def test_reopened_task_leaves_completed_index(self):
+        """Test une tâche qui quitte DONE n'est plus parmi les terminées"""
+        task_ids = self.manager.add_tasks(["Task 1", "Task 2", "Task 3"])
+        self.manager.update_many(task_ids, status=Status.DONE)
+
+        self.manager.get_task(task_ids[0]).status = Status.TODO
+        self.manager.update_many(task_ids[1:2], status=Status.IN_PROGRESS)
+
+        recent = self.manager.get_recently_completed(3)
+        assert [task.id for task in recent] == [task_ids[2]]
+        assert self.manager.get_task(task_ids[1]).completed_at is None
+        reopened_call = self.manager.storage.record_update_many.call_args_list[-1]
+        assert reopened_call.args[1:] == ("completed_at", None)
+        assert [task.id for task in reopened_call.args[0]] == [task_ids[1]]
+
+    def test_update_many_validates_values(self):
+        """Test valeurs invalides refusées avant toute modification"""
+        task_ids = self.manager.add_tasks(["Task 1"])
+
+        with pytest.raises(ValueError):
+            self.manager.update_many(task_ids, priority="high")
+        with pytest.raises(ValueError):
+            self.manager.update_many(task_ids, status="done")
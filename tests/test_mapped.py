@@ -0,0 +1,86 @@
+import multiprocessing
+
+import pytest
+
+from src.task_manager.manager import TaskManager
+from src.task_manager.mapped import MappedSnapshot, write_mapped_snapshot
+from src.task_manager.task import Priority, SlottedTask, Status, Task
+
+
+def count_done_in_child(filename, queue):
+    # Lecteur d'un autre processus sur le même fichier projeté
+    with MappedSnapshot(filename) as snapshot:
+        queue.put(snapshot.get_statistics()["completed_tasks"])
+
+
+@pytest.mark.integration
+class TestMappedSnapshot:
+    """Tests du snapshot projeté en mémoire"""
+
+    def setup_method(self):
+        self.manager = TaskManager("demo_tasks.json")
+        self.manager.load_from_file()
+        task = Task("Tâche UUID", "Réserver l'hôtel", Priority.URGENT)
+        task.id = "0f8e2c4a9b"
+        task.assign_to_project("voyage")
+        self.manager.tasks = self.manager.tasks + [task]
+
+    def write(self, tmp_path):
+        filename = str(tmp_path / "tasks.map")
+        write_mapped_snapshot(filename, self.manager.tasks)
+        return filename
+
+    def test_records_materialize_lazily(self, tmp_path):
+        """Test tâches créées à l'accès, identiques à l'original"""
+        with MappedSnapshot(self.write(tmp_path)) as snapshot:
+            assert len(snapshot) == len(self.manager.tasks)
+            first = snapshot[0]
+            assert type(first) is SlottedTask
+            assert [t.to_dict() for t in snapshot] == [
+                t.to_dict() for t in self.manager.tasks
+            ]
+            with pytest.raises(IndexError):
+                snapshot[len(snapshot)]
+
+    def test_get_task_by_id(self, tmp_path):
+        """Test recherche par ID, y compris anciens IDs flottants et texte"""
+        with MappedSnapshot(self.write(tmp_path), task_class=Task) as snapshot:
+            legacy_id = self.manager.tasks[0].id
+
+            assert snapshot.get_task(legacy_id).title == "Préparer la présentation"
+            assert snapshot.get_task("0f8e2c4a9b").project_id == "voyage"
+            assert snapshot.get_task(123) is None
+
+    def test_filters_and_statistics(self, tmp_path):
+        """Test filtres et statistiques sur les colonnes d'octets"""
+        with MappedSnapshot(self.write(tmp_path)) as snapshot:
+            done = snapshot.get_tasks_by_status(Status.DONE)
+            urgent = snapshot.get_tasks_by_priority(Priority.URGENT)
+
+            assert [t.id for t in done] == [
+                t.id for t in self.manager.get_tasks_by_status(Status.DONE)
+            ]
+            assert len(urgent) == 2
+            assert snapshot.rows_by_priority(Priority.LOW) == [3]
+            assert snapshot.get_statistics() == self.manager.get_statistics()
+
+    def test_shared_between_processes(self, tmp_path):
+        """Test lecture du même snapshot depuis un autre processus"""
+        filename = self.write(tmp_path)
+        queue = multiprocessing.Queue()
+        process = multiprocessing.Process(
+            target=count_done_in_child, args=(filename, queue)
+        )
+        process.start()
+        process.join(timeout=30)
+
+        assert process.exitcode == 0
+        assert queue.get(timeout=5) == 2
+
+    def test_invalid_file_raises(self, tmp_path):
+        """Test fichier qui n'est pas un snapshot projetable"""
+        filename = tmp_path / "tasks.json"
+        filename.write_text("[]" * 20)
+
+        with pytest.raises(ValueError, match="snapshot projetable"):
+            MappedSnapshot(str(filename))
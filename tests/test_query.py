@@ -0,0 +1,272 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.task_manager.manager import TaskManager
+from src.task_manager.query import F, In
+from src.task_manager.storage import SQLiteStorage
+from src.task_manager.task import Priority, Status, Task
+from src.task_manager.threadsafe import ConcurrentTaskManager
+
+
+def populate(manager):
+    # 12 tâches : priorités en rotation, un quart terminées, projets p0 à p2
+    # sauf une tâche sur quatre, dates de création espacées d'un jour
+    start = datetime(2024, 1, 1)
+    priorities = list(Priority)
+    statuses = [Status.TODO, Status.IN_PROGRESS, Status.IN_PROGRESS, Status.DONE]
+    for i in range(12):
+        title = f"Bug {i}" if i % 3 == 0 else f"Tâche {i}"
+        task = Task(title, priority=priorities[i % 4])
+        task.created_at = start + timedelta(days=i)
+        task.status = statuses[i % 4]
+        if task.status == Status.DONE:
+            task.completed_at = task.created_at + timedelta(hours=12 - i)
+        if i % 4:
+            task.project_id = f"p{i % 3}"
+        manager._add(task)
+    return manager.tasks
+
+
+def expected(tasks, predicate):
+    return [task.id for task in tasks if predicate(task)]
+
+
+@pytest.mark.unit
+class TestPredicates:
+    """Tests des filtres"""
+
+    def test_unknown_field_is_rejected(self):
+        """Test un champ inconnu est refusé"""
+        manager = TaskManager()
+
+        with pytest.raises(ValueError, match="Champ inconnu"):
+            manager.query().order_by("deadline")
+
+    def test_enum_comparisons_become_value_lists(self):
+        """Test les comparaisons d'énumérations deviennent des listes"""
+        predicate = F.priority >= Priority.HIGH
+
+        assert isinstance(predicate, In)
+        assert predicate.values == (Priority.HIGH, Priority.URGENT)
+        assert (F.status != Status.DONE).values == (
+            Status.TODO,
+            Status.IN_PROGRESS,
+            Status.CANCELLED,
+        )
+
+    def test_enum_fields_require_enum_values(self):
+        """Test un champ énuméré n'accepte que son énumération"""
+        with pytest.raises(ValueError):
+            F.priority == "high"
+        with pytest.raises(ValueError):
+            F.status.in_(["done"])
+
+    def test_missing_values_never_compare(self):
+        """Test une valeur absente n'est ni avant ni après une autre"""
+        manager = TaskManager()
+        task = manager.get_task(manager.add_task("Task"))
+
+        assert not (F.completed_at < datetime.now()).matches(task)
+        assert not (F.completed_at >= datetime(1970, 1, 1)).matches(task)
+        assert (F.project_id == None).matches(task)  # noqa: E711
+        assert (F.project_id != "p1").matches(task)
+
+
+@pytest.mark.unit
+class TestQueryInMemory:
+    """Tests des requêtes servies par les index en mémoire"""
+
+    def setup_method(self):
+        self.manager = TaskManager()
+        self.tasks = populate(self.manager)
+
+    def test_combined_filters(self):
+        """Test priorités, statut, projet, dates et titre combinés"""
+        since = datetime(2024, 1, 2)
+        query = self.manager.query(
+            F.priority.in_([Priority.HIGH, Priority.URGENT]),
+            F.status != Status.DONE,
+            F.created_at >= since,
+        ).where(F.title.contains("BUG") | (F.project_id == "p2"))
+
+        assert [task.id for task in query] == expected(
+            self.tasks,
+            lambda t: t.priority in (Priority.HIGH, Priority.URGENT)
+            and t.status != Status.DONE
+            and t.created_at >= since
+            and ("bug" in t.title.lower() or t.project_id == "p2"),
+        )
+
+    def test_planner_picks_most_selective_index(self):
+        """Test le planificateur choisit l'index le plus sélectif"""
+        query = self.manager.query(
+            F.status.in_([Status.TODO, Status.IN_PROGRESS]),
+            F.priority == Priority.URGENT,
+        )
+
+        assert query.explain() == {
+            "source": "index",
+            "index": "priority",
+            "candidates": 3,
+            "residual": 1,
+        }
+
+    def test_falls_back_to_scan(self):
+        """Test parcours complet sans filtre indexable"""
+        query = self.manager.query(F.title.contains("bug"))
+
+        assert query.explain()["source"] == "scan"
+        assert query.count() == 4
+
+    def test_count_without_residual_uses_index_size(self):
+        """Test count sans filtre restant ne parcourt pas les tâches"""
+        query = self.manager.query(F.status == Status.IN_PROGRESS).offset(1)
+
+        assert query.count() == 5
+        assert query.limit(2).count() == 2
+
+    def test_index_follows_task_changes(self):
+        """Test les requêtes voient les changements de champ"""
+        task = self.tasks[0]
+        task.project_id = "moved"
+
+        assert self.manager.query(F.project_id == "moved").all() == [task]
+
+    def test_date_bounds_become_one_range(self):
+        """Test deux bornes sur une date forment une seule plage indexée"""
+        query = self.manager.query(
+            F.created_at >= datetime(2024, 1, 3),
+            F.created_at < datetime(2024, 1, 6),
+            F.title.contains("bug"),
+        )
+
+        assert query.explain() == {
+            "source": "index",
+            "index": "created_at",
+            "candidates": 3,
+            "residual": 1,
+        }
+        assert [task.title for task in query] == ["Bug 3"]
+
+    def test_most_recent_walks_date_index(self):
+        """Test les plus récentes sont lues dans l'index trié, sans tri"""
+        query = (
+            self.manager.query(F.title.contains("tâche"))
+            .order_by("-created_at")
+            .limit(3)
+        )
+
+        assert query.explain()["ordered"] is True
+        assert [task.title for task in query] == ["Tâche 11", "Tâche 10", "Tâche 8"]
+
+    def test_completed_at_order_keeps_unfinished_tasks(self):
+        """Test un tri sur completed_at sans borne garde les non terminées"""
+        query = self.manager.query().order_by("completed_at").limit(20)
+
+        assert "ordered" not in query.explain()
+        assert len(query.all()) == 12
+
+    def test_order_by_with_missing_values_last(self):
+        """Test tri décroissant, valeurs absentes en dernier"""
+        ordered = self.manager.query().order_by("-project_id", "created_at").all()
+
+        with_project = [t for t in self.tasks if t.project_id]
+        with_project.sort(key=lambda t: t.created_at)
+        with_project.sort(key=lambda t: t.project_id, reverse=True)
+        without = [t for t in self.tasks if t.project_id is None]
+        assert ordered == with_project + without
+
+    def test_order_by_priority_rank(self):
+        """Test les priorités sont triées par rang, pas par nom"""
+        ordered = self.manager.query().order_by("-priority").limit(3).all()
+
+        assert [task.priority for task in ordered] == [Priority.URGENT] * 3
+
+    def test_limit_offset_and_first(self):
+        """Test pagination et premier résultat"""
+        query = self.manager.query(F.priority != Priority.LOW).order_by("created_at")
+        everything = query.all()
+
+        assert query.offset(2).limit(3).all() == everything[2:5]
+        assert query.first() == everything[2]
+        assert query.offset(100).first() is None
+
+
+@pytest.mark.integration
+class TestQueryPushdown:
+    """Tests des requêtes poussées à SQLite"""
+
+    def setup_method(self):
+        self.manager = None
+
+    def teardown_method(self):
+        if self.manager is not None:
+            self.manager.close()
+
+    def test_same_results_as_in_memory(self, tmp_path):
+        """Test la base renvoie les mêmes résultats que la mémoire"""
+        filename = str(tmp_path / "tasks.db")
+        self.manager = TaskManager(filename, storage=SQLiteStorage(filename))
+        populate(self.manager)
+        memory = TaskManager()
+        populate(memory)
+
+        def run(manager):
+            query = manager.query(
+                (F.priority >= Priority.MEDIUM) & ~(F.status == Status.DONE),
+                (F.project_id == None) | (F.project_id == "p1"),  # noqa: E711
+                F.created_at < datetime(2024, 1, 11),
+            ).order_by("-priority", "completed_at", "-created_at")
+            return [t.title for t in query], query.count()
+
+        assert run(self.manager) == run(memory)
+
+    def test_filters_are_pushed_down(self, tmp_path):
+        """Test les filtres traduisibles partent en SQL, les autres non"""
+        filename = str(tmp_path / "tasks.db")
+        self.manager = TaskManager(filename, storage=SQLiteStorage(filename))
+        populate(self.manager)
+        self.manager.close()
+        self.manager = TaskManager(filename, storage=SQLiteStorage(filename))
+
+        query = self.manager.query(F.status == Status.TODO, F.title.contains("bug"))
+
+        assert query.explain() == {
+            "source": "sql",
+            "where": "((status IN (?)))",
+            "residual": 1,
+        }
+        assert [task.title for task in query] == ["Bug 0"]
+        # Seules les lignes retenues sont chargées en mémoire
+        assert len(self.manager.tasks) == 1
+
+    def test_pagination_and_count_in_sql(self, tmp_path):
+        """Test limite, décalage et comptage exécutés par la base"""
+        filename = str(tmp_path / "tasks.db")
+        self.manager = TaskManager(filename, storage=SQLiteStorage(filename))
+        tasks = populate(self.manager)
+
+        query = self.manager.query(F.project_id != None)  # noqa: E711
+        page = query.order_by("created_at").offset(2).limit(4).all()
+
+        assert page == [t for t in tasks if t.project_id][2:6]
+        assert query.count() == 4
+        assert query.limit(None).offset(0).count() == 9
+
+
+@pytest.mark.integration
+class TestConcurrentQuery:
+    """Tests des requêtes sur le gestionnaire partagé entre threads"""
+
+    def test_query_runs_under_lock(self):
+        """Test une requête sur ConcurrentTaskManager"""
+        manager = ConcurrentTaskManager(debug=True)
+        tasks = populate(manager)
+
+        done = manager.query(F.status == Status.DONE).all()
+
+        assert [task.id for task in done] == expected(
+            tasks, lambda t: t.status == Status.DONE
+        )
+        assert manager.query(F.status == Status.DONE).count() == 3
@@ -0,0 +1,160 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.task_manager.manager import TaskManager
+from src.task_manager.ready import ReadyQueue
+from src.task_manager.storage import SQLiteStorage
+from src.task_manager.task import Priority, Status, Task
+from src.task_manager.threadsafe import ConcurrentTaskManager
+
+START = datetime(2024, 1, 1)
+
+
+def queued_tasks():
+    # Créées un jour d'écart : Low 0, Urgent 1, High 2, Urgent 3
+    tasks = []
+    for i, priority in enumerate(
+        (Priority.LOW, Priority.URGENT, Priority.HIGH, Priority.URGENT)
+    ):
+        task = Task(f"{priority.name.title()} {i}", priority=priority)
+        task.created_at = START + timedelta(days=i)
+        tasks.append(task)
+    return tasks
+
+
+def claim_all(manager):
+    titles = []
+    task = manager.claim_next()
+    while task is not None:
+        titles.append(task.title)
+        task = manager.claim_next()
+    return titles
+
+
+@pytest.mark.unit
+class TestReadyQueue:
+    """Tests de la file des tâches à faire"""
+
+    def test_priority_then_age(self):
+        """Test la plus prioritaire sort d'abord, puis la plus ancienne"""
+        queue = ReadyQueue()
+        for task in reversed(queued_tasks()):
+            queue.push(task)
+
+        titles = [queue.pop().title for _ in range(4)]
+
+        assert titles == ["Urgent 1", "Urgent 3", "High 2", "Low 0"]
+        assert queue.pop() is None
+
+    def test_discarded_and_replaced_entries_are_skipped(self):
+        """Test les entrées retirées ou remplacées ne sortent jamais"""
+        queue = ReadyQueue()
+        tasks = queued_tasks()
+        for task in tasks:
+            queue.push(task)
+        queue.discard(tasks[1].id)
+        tasks[3].priority = Priority.LOW
+        queue.push(tasks[3])
+
+        assert len(queue) == 3
+        assert queue.peek() is tasks[2]
+        assert [queue.pop() for _ in range(3)] == [tasks[2], tasks[0], tasks[3]]
+
+    def test_stale_entries_are_compacted(self):
+        """Test le tas est reconstruit quand les entrées périmées dominent"""
+        queue = ReadyQueue()
+        tasks = [Task(f"Task {i}") for i in range(500)]
+        for task in tasks:
+            queue.push(task)
+        for task in tasks[:400]:
+            queue.discard(task.id)
+
+        assert len(queue._heap) < 300
+        assert queue.peek() is tasks[400]
+
+
+@pytest.mark.integration
+class TestManagerScheduling:
+    """Tests de peek_next et claim_next"""
+
+    def test_claim_moves_task_to_in_progress(self):
+        """Test claim_next passe la tâche à IN_PROGRESS"""
+        manager = TaskManager()
+        manager.tasks = queued_tasks()
+
+        assert manager.peek_next().title == "Urgent 1"
+        task = manager.claim_next()
+
+        assert task.status == Status.IN_PROGRESS
+        assert manager.get_tasks_by_status(Status.IN_PROGRESS) == [task]
+        assert manager.peek_next().title == "Urgent 3"
+
+    def test_queue_follows_task_changes(self):
+        """Test complétion, annulation, suppression, priorité et réouverture"""
+        manager = TaskManager()
+        manager.tasks = queued_tasks()
+        low, urgent, high, last = manager.tasks
+
+        urgent.mark_completed()
+        last.status = Status.CANCELLED
+        manager.delete_task(high.id)
+        assert manager.peek_next() is low
+
+        last.status = Status.TODO
+        low.update_priority(Priority.URGENT)
+        manager.add_task("New", priority=Priority.URGENT)
+
+        assert claim_all(manager) == ["Low 0", "Urgent 3", "New"]
+        assert manager.claim_next() is None
+
+    def test_reindex_after_created_at_change(self):
+        """Test réindexation après modification de created_at"""
+        manager = TaskManager()
+        manager.tasks = queued_tasks()
+        manager.tasks[3].created_at = START - timedelta(days=1)
+
+        manager.reindex_task(manager.tasks[3].id)
+
+        assert manager.peek_next().title == "Urgent 3"
+
+    def test_sqlite_backend(self, tmp_path):
+        """Test même ordre avec le backend SQLite"""
+        filename = str(tmp_path / "tasks.db")
+        manager = TaskManager(filename, storage=SQLiteStorage(filename))
+        for task in queued_tasks():
+            manager._add(task)
+        manager.close()
+        manager = TaskManager(filename, storage=SQLiteStorage(filename))
+
+        titles = claim_all(manager)
+        manager.close()
+        manager = TaskManager(filename, storage=SQLiteStorage(filename))
+        in_progress = manager.get_statistics()["tasks_by_status"]["in_progress"]
+        manager.close()
+
+        assert titles == ["Urgent 1", "Urgent 3", "High 2", "Low 0"]
+        assert in_progress == 4
+
+    def test_concurrent_workers_claim_each_task_once(self):
+        """Test des threads concurrents ne prennent jamais la même tâche"""
+        manager = ConcurrentTaskManager(debug=True)
+        manager.add_tasks(
+            {"title": f"Task {i}", "priority": list(Priority)[i % 4]}
+            for i in range(400)
+        )
+
+        def work(worker):
+            claimed = []
+            task = manager.claim_next()
+            while task is not None:
+                claimed.append(task.id)
+                task = manager.claim_next()
+            return claimed
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            claimed = [i for ids in executor.map(work, range(8)) for i in ids]
+
+        assert len(claimed) == len(set(claimed)) == 400
+        assert manager.get_statistics()["tasks_by_status"]["in_progress"] == 400
@@ -0,0 +1,219 @@
+import asyncio
+import marshal
+
+import pytest
+
+from src.task_manager import search as search_module
+from src.task_manager.async_manager import AsyncTaskManager
+from src.task_manager.manager import TaskManager
+from src.task_manager.search import SearchIndex, normalize, search_file, tokenize
+from src.task_manager.task import Task
+from src.task_manager.threadsafe import ConcurrentTaskManager
+
+
+@pytest.mark.unit
+class TestTokenize:
+    """Tests de la normalisation du texte"""
+
+    def test_accents_and_case_are_ignored(self):
+        """Test accents et majuscules ignorés"""
+        assert normalize("Préparer l'ÉTÉ") == "preparer l'ete"
+        assert tokenize("Réserver la salle, l'équipe") == [
+            "reserver",
+            "la",
+            "salle",
+            "l",
+            "equipe",
+        ]
+
+    def test_empty_text(self):
+        """Test texte vide"""
+        assert tokenize("") == []
+
+    def test_search_file_name(self):
+        """Test nom du fichier d'index"""
+        assert search_file("data/tasks.json") == "data/tasks.search.idx"
+
+
+@pytest.mark.unit
+class TestSearchIndex:
+    """Tests de l'index inversé"""
+
+    def setup_method(self):
+        self.index = SearchIndex()
+        self.tasks = [
+            Task("Préparer la réunion", "Ordre du jour"),
+            Task("Réserver la salle", "Pour la réunion de lundi"),
+            Task("Corriger le bug", "Réunion de suivi préparée"),
+        ]
+        for task in self.tasks:
+            self.index.add(task)
+
+    def ids(self, *args, **kwargs):
+        return [task_id for task_id, _ in self.index.search(*args, **kwargs)]
+
+    def test_all_terms_must_match(self):
+        """Test chaque mot de la requête doit être présent"""
+        assert self.ids("reunion salle") == [self.tasks[1].id]
+        assert self.ids("reunion absent") == []
+
+    def test_prefix_matching(self):
+        """Test recherche par début de mot"""
+        assert self.ids("prep") == [self.tasks[0].id, self.tasks[2].id]
+        assert self.ids("prep", prefix=False) == []
+
+    def test_title_matches_rank_first(self):
+        """Test un mot du titre compte plus qu'un mot de la description"""
+        assert self.ids("REUNION") == [
+            self.tasks[0].id,
+            self.tasks[1].id,
+            self.tasks[2].id,
+        ]
+        assert self.ids("reunion", limit=1) == [self.tasks[0].id]
+
+    def test_remove_and_reindex(self):
+        """Test retrait et réindexation d'un texte modifié"""
+        self.index.remove(self.tasks[1].id)
+        assert self.ids("salle") == []
+
+        self.tasks[0].title = "Nouveau titre"
+        self.index.add(self.tasks[0])
+        assert self.ids("nouveau") == [self.tasks[0].id]
+        assert self.ids("ordre") == [self.tasks[0].id]
+        assert "preparer" not in self.index._postings
+
+    def test_vocabulary_stays_sorted(self):
+        """Test le vocabulaire reste trié après ajouts et retraits"""
+        with self.index.bulk():
+            self.index.add(Task("Zèbre abricot"))
+            self.index.remove(self.tasks[2].id)
+        self.index.add(Task("Mangue"))
+
+        assert self.index._terms == sorted(self.index._postings)
+
+    def test_save_and_load(self, tmp_path):
+        """Test l'index rechargé répond comme l'original"""
+        filename = str(tmp_path / "tasks.search.idx")
+        self.index.save(filename)
+
+        loaded = SearchIndex()
+        assert loaded.load(filename) is True
+        assert not loaded.modified
+        assert loaded.search("reunion") == self.index.search("reunion")
+
+    def test_unreadable_file_leaves_index_empty(self, tmp_path):
+        """Test un fichier illisible ou d'une autre version est ignoré"""
+        filename = tmp_path / "tasks.search.idx"
+        filename.write_bytes(b"pas un index")
+        assert SearchIndex().load(str(filename)) is False
+
+        filename.write_bytes(marshal.dumps((99, {}, {})))
+        index = SearchIndex()
+        assert index.load(str(filename)) is False
+        assert len(index) == 0
+
+
+@pytest.mark.integration
+class TestManagerSearch:
+    """Tests de la recherche plein texte du gestionnaire"""
+
+    def test_index_follows_adds_and_deletes(self):
+        """Test ajouts et suppressions mettent l'index à jour"""
+        manager = TaskManager(search=True)
+        first = manager.add_task("Préparer la démo")
+        second = manager.add_tasks(["Démo client", "Autre chose"])[0]
+
+        assert [task.id for task in manager.search("demo")] == [first, second]
+        manager.delete_task(first)
+        assert [task.id for task in manager.search("démo")] == [second]
+
+    def test_reindex_after_title_change(self):
+        """Test réindexation après modification du titre"""
+        manager = TaskManager(search=True)
+        task_id = manager.add_task("Ancien titre")
+        manager.get_task(task_id).title = "Nouveau titre"
+
+        assert manager.reindex_task(task_id) is True
+        assert manager.search("ancien") == []
+        assert [task.id for task in manager.search("nouv")] == [task_id]
+        assert manager.reindex_task(42) is False
+
+    def test_search_requires_index(self):
+        """Test recherche refusée sans index"""
+        with pytest.raises(RuntimeError):
+            TaskManager().search("demo")
+
+    def test_persisted_index_is_reused(self, tmp_path, monkeypatch):
+        """Test l'index persisté évite de retokeniser au chargement"""
+        filename = str(tmp_path / "tasks.json")
+        manager = TaskManager(filename, persist_search=True)
+        kept = manager.add_task("Réserver la salle")
+        removed = manager.add_task("Préparer la réunion")
+        manager.save_to_file()
+        assert (tmp_path / "tasks.search.idx").exists()
+
+        # Modifications du fichier de tâches sans l'index
+        other = TaskManager(filename)
+        other.load_from_file()
+        other.delete_task(removed)
+        added = other.add_task("Réunion de lundi")
+        other.save_to_file()
+
+        tokenized = []
+        original = search_module.tokenize
+        monkeypatch.setattr(
+            search_module,
+            "tokenize",
+            lambda text: tokenized.append(text) or original(text),
+        )
+        reloaded = TaskManager(filename, persist_search=True)
+        reloaded.load_from_file()
+
+        # Seule la tâche ajoutée est tokenisée (titre et description)
+        assert tokenized == ["Réunion de lundi", ""]
+        assert [task.id for task in reloaded.search("reunion")] == [added]
+        assert [task.id for task in reloaded.search("salle")] == [kept]
+
+    def test_concurrent_manager_search(self):
+        """Test recherche sur le gestionnaire partagé entre threads"""
+        manager = ConcurrentTaskManager(search=True)
+        task_id = manager.add_task("Préparer la démo")
+
+        assert [task.id for task in manager.search("PREP")] == [task_id]
+
+    def test_async_manager_search(self, tmp_path):
+        """Test recherche et chargement avec le gestionnaire asyncio"""
+        filename = str(tmp_path / "tasks.json")
+
+        async def scenario():
+            manager = AsyncTaskManager(filename, persist_search=True)
+            task_id = await manager.add_task("Préparer la démo")
+            await manager.save_to_file()
+            await manager.load_from_file()
+            results = await manager.search("demo")
+            await manager.close()
+            return task_id, [task.id for task in results]
+
+        task_id, results = asyncio.run(scenario())
+
+        assert results == [task_id]
+
+    def test_async_manager_persists_index(self, tmp_path):
+        """Test le gestionnaire asyncio écrit l'index à la sauvegarde et à close"""
+        filename = str(tmp_path / "tasks.json")
+        index_file = tmp_path / "tasks.search.idx"
+
+        async def scenario():
+            manager = AsyncTaskManager(filename, persist_search=True)
+            await manager.add_task("Préparer la démo")
+            await manager.save_to_file()
+            saved = index_file.exists()
+            index_file.unlink()
+            await manager.add_task("Réserver la salle")
+            await manager.close()
+            return saved
+
+        assert asyncio.run(scenario())
+        reloaded = TaskManager(filename, persist_search=True)
+        reloaded.search_index.load(reloaded.search_file)
+        assert len(reloaded.search_index) == 2
@@ -0,0 +1,127 @@
+import pickle
+
+import pytest
+
+from src.task_manager.sharding import ShardedTaskManager, shard_file, shard_of
+from src.task_manager.task import Priority, Status, Task
+
+
+@pytest.mark.unit
+class TestShardRouting:
+    """Tests du partitionnement par ID"""
+
+    def test_shard_of_is_stable_and_in_range(self):
+        """Test le shard d'un ID est stable et borné"""
+        for task_id in (1, 2**62 + 17, 1752231369.733616, "abc"):
+            shard = shard_of(task_id, 4)
+            assert 0 <= shard < 4
+            assert shard_of(task_id, 4) == shard
+
+    def test_time_ordered_ids_spread_over_shards(self):
+        """Test des IDs consécutifs se répartissent sur tous les shards"""
+        shards = {shard_of(Task("Task").id, 4) for _ in range(200)}
+
+        assert shards == {0, 1, 2, 3}
+
+    def test_shard_file_name(self):
+        """Test nom du fichier d'un shard"""
+        assert shard_file("data/tasks.json", 2) == "data/tasks.shard-2.json"
+
+    def test_task_pickles_without_listener(self):
+        """Test une tâche passe d'un processus à l'autre sans son écouteur"""
+        task = Task("Task", "Description", Priority.HIGH)
+        task._listener = print
+        task.mark_completed()
+
+        copy = pickle.loads(pickle.dumps(task))
+
+        assert copy.to_dict() == task.to_dict()
+        assert copy._listener is None
+
+
+@pytest.mark.integration
+class TestShardedTaskManager:
+    """Tests du gestionnaire réparti sur plusieurs processus"""
+
+    def setup_method(self):
+        self.manager = None
+
+    def teardown_method(self):
+        if self.manager is not None:
+            self.manager.close()
+
+    def start(self, tmp_path, shards=3):
+        self.manager = ShardedTaskManager(str(tmp_path / "tasks.json"), shards=shards)
+        return self.manager
+
+    def test_routed_operations(self, tmp_path):
+        """Test ajout, lecture, modification et suppression routés"""
+        manager = self.start(tmp_path)
+        task_id = manager.add_task("Task", priority=Priority.LOW)
+
+        assert manager.get_task(task_id).title == "Task"
+        assert manager.mark_completed(task_id) is True
+        assert manager.update_priority(task_id, Priority.URGENT) is True
+        assert manager.assign_to_project(task_id, "project-1") is True
+        task = manager.get_task(task_id)
+        assert task.status == Status.DONE
+        assert task.priority == Priority.URGENT
+        assert task.project_id == "project-1"
+        assert manager.delete_task(task_id) is True
+        assert manager.get_task(task_id) is None
+        assert manager.mark_completed(task_id) is False
+
+    def test_fan_out_queries_and_statistics(self, tmp_path):
+        """Test filtres et statistiques fusionnés depuis tous les shards"""
+        manager = self.start(tmp_path)
+        task_ids = [manager.add_task(f"Task {i}") for i in range(30)]
+        for task_id in task_ids[:10]:
+            manager.mark_completed(task_id)
+
+        done = manager.get_tasks_by_status(Status.DONE)
+        stats = manager.get_statistics()
+
+        assert sorted(task.id for task in done) == sorted(task_ids[:10])
+        assert stats["total_tasks"] == 30
+        assert stats["completed_tasks"] == 10
+        assert stats["tasks_by_status"]["todo"] == 20
+        assert sum(stats["tasks_by_priority"].values()) == 30
+
+    def test_validation_errors_are_raised_in_parent(self, tmp_path):
+        """Test les erreurs sont levées chez l'appelant"""
+        manager = self.start(tmp_path)
+
+        with pytest.raises(ValueError):
+            manager.add_task("")
+        with pytest.raises(ValueError):
+            manager.update_priority(1, "high")
+
+    def test_shard_errors_are_propagated(self, tmp_path):
+        """Test une erreur dans un shard remonte à l'appelant"""
+        manager = self.start(tmp_path)
+        task = Task("Task")
+        manager.import_tasks([task])
+
+        with pytest.raises(ValueError, match="ID de tâche en double"):
+            manager.import_tasks([task])
+        # Les canaux restent utilisables après l'erreur
+        assert manager.get_statistics()["total_tasks"] == 1
+
+    def test_save_and_reload_per_shard_files(self, tmp_path):
+        """Test chaque shard sauvegarde et recharge son propre fichier"""
+        manager = self.start(tmp_path)
+        tasks = [Task(f"Task {i}") for i in range(20)]
+        assert manager.import_tasks(tasks) == 20
+        manager.save_to_file()
+        manager.close()
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "tasks.shard-0.json",
+            "tasks.shard-1.json",
+            "tasks.shard-2.json",
+        ]
+
+        manager = self.start(tmp_path)
+        manager.load_from_file()
+        assert manager.get_statistics()["total_tasks"] == 20
+        assert manager.get_task(tasks[7].id).title == "Task 7"
@@ -0,0 +1,141 @@
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from src.task_manager.manager import TaskManager
+from src.task_manager.snapshot import (
+    BinarySnapshotStorage,
+    json_to_snapshot,
+    load_snapshot,
+    snapshot_to_json,
+)
+from src.task_manager.task import Priority, SlottedTask, Task
+
+
+@pytest.mark.integration
+class TestBinarySnapshot:
+    """Tests du snapshot binaire"""
+
+    def setup_method(self):
+        self.manager = TaskManager("demo_tasks.json")
+        self.manager.load_from_file()
+        # Variété de types d'ID et de projets
+        task = self.manager.get_task(self.manager.add_task("Tâche ID entier"))
+        task.assign_to_project("projet-é")
+        task = Task("Tâche UUID", "", Priority.URGENT)
+        task.id = "0f8e2c4a9b"
+        task.assign_to_project(42)
+        task.mark_completed()
+        self.manager.tasks = self.manager.tasks + [task]
+
+    def test_round_trip_preserves_tasks(self, tmp_path):
+        """Test aller-retour binaire sans perte"""
+        storage = BinarySnapshotStorage(str(tmp_path / "tasks.bin"))
+        storage.save(self.manager.tasks)
+        loaded = storage.load(Task)
+
+        assert [t.to_dict() for t in loaded] == [
+            t.to_dict() for t in self.manager.tasks
+        ]
+        assert [type(t.id) for t in loaded] == [
+            type(t.id) for t in self.manager.tasks
+        ]
+
+    def test_manager_with_snapshot_storage(self, tmp_path):
+        """Test gestionnaire adossé au snapshot binaire"""
+        filename = str(tmp_path / "tasks.bin")
+        self.manager.storage = BinarySnapshotStorage(filename)
+        self.manager.storage_file = filename
+        self.manager.save_to_file()
+
+        reloaded = TaskManager(
+            filename, storage=BinarySnapshotStorage(filename), task_class=SlottedTask
+        )
+        reloaded.load_from_file()
+
+        assert reloaded.get_statistics() == self.manager.get_statistics()
+        assert all(type(task) is SlottedTask for task in reloaded.tasks)
+
+    def test_json_converters(self, tmp_path):
+        """Test conversion JSON -> binaire -> JSON"""
+        snapshot_file = str(tmp_path / "demo.bin")
+        json_file = tmp_path / "demo.json"
+        json_to_snapshot("demo_tasks.json", snapshot_file)
+        snapshot_to_json(snapshot_file, str(json_file))
+
+        with open("demo_tasks.json", encoding="utf-8") as f:
+            assert json.loads(json_file.read_text(encoding="utf-8")) == json.load(f)
+
+    @pytest.mark.parametrize(
+        "data",
+        [b"", b"JSON" + bytes(10), b"TMSN\x09\x00" + bytes(8)],
+    )
+    def test_invalid_header_raises(self, data):
+        """Test en-tête invalide"""
+        with pytest.raises(ValueError):
+            load_snapshot(data)
+
+    def test_truncated_snapshot_raises(self, tmp_path):
+        """Test snapshot tronqué"""
+        filename = tmp_path / "tasks.bin"
+        BinarySnapshotStorage(str(filename)).save(self.manager.tasks)
+        data = filename.read_bytes()
+
+        with pytest.raises(ValueError, match="corrompu"):
+            load_snapshot(data[:-3])
+        with pytest.raises(ValueError, match="corrompu"):
+            load_snapshot(data + b"x")
+
+    def test_round_trip_with_nul_and_edge_values(self, tmp_path):
+        """Test chaînes contenant NUL, ID flottant et liste vide"""
+        task = Task("Titre\x00avec NUL", "")
+        task.id = 1.5
+        task.mark_completed()
+        tasks = [task, Task("Autre", "desc\x00")]
+        storage = BinarySnapshotStorage(str(tmp_path / "tasks.bin"))
+
+        storage.save(tasks)
+        assert [t.to_dict() for t in storage.load(Task)] == [
+            t.to_dict() for t in tasks
+        ]
+        storage.save([])
+        assert storage.load(Task) == []
+
+    def test_dumps_any_task_like_object(self, tmp_path):
+        """Test sauvegarde d'objets qui n'ont que les attributs publics"""
+        task = Task("Tâche", "desc", Priority.HIGH)
+        task.assign_to_project("p")
+        task.mark_completed()
+        fields = (
+            "id",
+            "title",
+            "description",
+            "priority",
+            "status",
+            "created_at",
+            "completed_at",
+            "project_id",
+        )
+        view = SimpleNamespace(**{field: getattr(task, field) for field in fields})
+        storage = BinarySnapshotStorage(str(tmp_path / "tasks.bin"))
+
+        storage.save([view])
+        assert [t.to_dict() for t in storage.load(Task)] == [task.to_dict()]
+
+    def test_aware_datetime_raises(self, tmp_path):
+        """Test date avec fuseau horaire refusée"""
+        task = Task("Tâche")
+        task.created_at = datetime.now(timezone.utc)
+
+        with pytest.raises(ValueError, match="fuseau horaire"):
+            BinarySnapshotStorage(str(tmp_path / "tasks.bin")).save([task])
+
+    def test_unsupported_id_raises(self, tmp_path):
+        """Test type d'ID non supporté"""
+        task = Task("Tâche")
+        task.id = (1, 2)
+
+        with pytest.raises(ValueError, match="ID de tâche non supporté"):
+            BinarySnapshotStorage(str(tmp_path / "tasks.bin")).save([task])
@@ -0,0 +1,537 @@
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.task_manager.manager import TaskManager
+from src.task_manager.storage import (
+    JournaledStorage,
+    JSONFileStorage,
+    SegmentedJSONStorage,
+    SQLiteStorage,
+    atomic_write,
+    iter_task_dicts,
+    iter_tasks_from_file,
+    write_tasks_compact,
+)
+from src.task_manager.task import Priority, Status, Task
+
+
+def journaled_manager(path, **kwargs):
+    # Gestionnaire dont le snapshot et le journal vivent dans tmp_path
+    filename = str(path / "tasks.json")
+    return TaskManager(filename, storage=JournaledStorage(filename, **kwargs))
+
+
+@pytest.mark.integration
+class TestJournaledStorage:
+    """Tests du stockage journalisé"""
+
+    def test_mutations_are_replayed_on_load(self, tmp_path):
+        """Test les mutations journalisées sont rejouées au chargement"""
+        manager = journaled_manager(tmp_path)
+        task1_id = manager.add_task("Task 1", priority=Priority.LOW)
+        task2_id = manager.add_task("Task 2")
+        task1 = manager.get_task(task1_id)
+        task1.mark_completed()
+        task1.update_priority(Priority.URGENT)
+        task1.assign_to_project("project-1")
+        manager.delete_task(task2_id)
+        manager.close()
+
+        reloaded = journaled_manager(tmp_path)
+        reloaded.load_from_file()
+
+        assert [task.id for task in reloaded.tasks] == [task1_id]
+        assert reloaded.get_task(task1_id).to_dict() == task1.to_dict()
+        assert reloaded.get_tasks_by_status(Status.DONE)[0].id == task1_id
+        assert not reloaded.get_task(task1_id).dirty
+
+    def test_save_does_not_rewrite_snapshot_below_threshold(self, tmp_path):
+        """Test sauvegarde sans réécriture du snapshot sous le seuil"""
+        manager = journaled_manager(tmp_path)
+        manager.add_task("Task 1")
+        manager.save_to_file()
+
+        assert not (tmp_path / "tasks.json").exists()
+        lines = (tmp_path / "tasks.json.journal").read_text().splitlines()
+        assert json.loads(lines[0])["op"] == "add"
+
+    def test_compaction_writes_snapshot_and_resets_journal(self, tmp_path):
+        """Test compactage au-delà du seuil"""
+        manager = journaled_manager(tmp_path, compact_threshold=1)
+        task_id = manager.add_task("Task 1")
+        manager.get_task(task_id).mark_completed()
+        manager.save_to_file()
+
+        assert (tmp_path / "tasks.json.journal").stat().st_size == 0
+        snapshot = json.loads((tmp_path / "tasks.json").read_text())
+        assert snapshot[0]["status"] == "done"
+
+        # Les mutations suivantes repartent dans le journal vide
+        manager.add_task("Task 2")
+        manager.close()
+        reloaded = journaled_manager(tmp_path)
+        reloaded.load_from_file()
+        assert len(reloaded.tasks) == 2
+
+    def test_torn_last_line_is_ignored(self, tmp_path):
+        """Test une dernière ligne tronquée par un crash est ignorée"""
+        manager = journaled_manager(tmp_path)
+        task_id = manager.add_task("Task 1")
+        manager.close()
+        with open(tmp_path / "tasks.json.journal", "ab") as f:
+            f.write(b'{"op": "delete", "id"')
+
+        reloaded = journaled_manager(tmp_path)
+        reloaded.load_from_file()
+        reloaded.add_task("Task 2")
+        reloaded.close()
+
+        assert reloaded.get_task(task_id) is not None
+        again = journaled_manager(tmp_path)
+        again.load_from_file()
+        assert len(again.tasks) == 2
+
+    def test_torn_tail_is_cut_before_appending(self, tmp_path):
+        """Test un ajout sans chargement après une ligne tronquée"""
+        manager = journaled_manager(tmp_path)
+        manager.add_task("Task 1")
+        manager.close()
+        with open(tmp_path / "tasks.json.journal", "ab") as f:
+            f.write(b'{"op": "delete", "id"')
+
+        writer = journaled_manager(tmp_path)
+        writer.add_task("Task 2")
+        writer.close()
+
+        reloaded = journaled_manager(tmp_path)
+        reloaded.load_from_file()
+        assert [task.title for task in reloaded.tasks] == ["Task 1", "Task 2"]
+
+    def test_compaction_without_load_keeps_other_tasks(self, tmp_path):
+        """Test compactage par un gestionnaire qui n'a pas chargé le fichier"""
+        manager = journaled_manager(tmp_path)
+        manager.add_tasks([f"Task {i}" for i in range(50)])
+        manager.save_to_file()
+        manager.close()
+
+        writer = journaled_manager(tmp_path, compact_threshold=1)
+        writer.add_task("Task 50")
+        writer.save_to_file()
+        writer.close()
+
+        assert (tmp_path / "tasks.json.journal").stat().st_size == 0
+        reloaded = journaled_manager(tmp_path)
+        reloaded.load_from_file()
+        assert len(reloaded.tasks) == 51
+
+    def test_fsync_is_batched(self, tmp_path):
+        """Test les fsync sont groupés"""
+        manager = journaled_manager(tmp_path, sync_every=10, sync_interval=3600)
+        with patch("os.fsync") as mock_fsync:
+            for i in range(25):
+                manager.add_task(f"Task {i}")
+
+        assert mock_fsync.call_count == 2
+
+    def test_bulk_mutations_are_replayed(self, tmp_path):
+        """Test les opérations en masse sont rejouées depuis le journal"""
+        manager = journaled_manager(tmp_path)
+        task_ids = manager.add_tasks([f"Task {i}" for i in range(5)])
+        manager.update_many(task_ids[:3], status=Status.DONE, project_id="p")
+        manager.delete_tasks(task_ids[3:])
+        manager.close()
+
+        reloaded = journaled_manager(tmp_path)
+        reloaded.load_from_file()
+
+        assert [task.id for task in reloaded.tasks] == task_ids[:3]
+        assert all(task.status == Status.DONE for task in reloaded.tasks)
+        assert all(task.project_id == "p" for task in reloaded.tasks)
+
+    def test_full_save_after_import_writes_snapshot(self, tmp_path):
+        """Test tâches importées d'un autre fichier puis sauvegardées"""
+        manager = journaled_manager(tmp_path)
+        manager.add_task("Remplacée")
+        manager.load_from_file("demo_tasks.json")
+        manager.save_to_file()
+        manager.close()
+
+        reloaded = journaled_manager(tmp_path)
+        reloaded.load_from_file()
+
+        assert [task.to_dict() for task in reloaded.tasks] == [
+            task.to_dict() for task in manager.tasks
+        ]
+
+
+@pytest.mark.unit
+class TestStreamingLoader:
+    """Tests du chargeur en flux"""
+
+    def test_matches_json_load_with_tiny_chunks(self):
+        """Test résultat identique à json.load, même avec des blocs minuscules"""
+        with open("demo_tasks.json", encoding="utf-8") as f:
+            expected = json.load(f)
+
+        for chunk_size in (1, 7, 4096):
+            with open("demo_tasks.json", encoding="utf-8") as f:
+                assert list(iter_task_dicts(f, chunk_size)) == expected
+
+    def test_numbers_split_across_chunks(self):
+        """Test nombres coupés entre deux blocs"""
+        f = io.StringIO("[12345, 6.75e2 ,\n 7]")
+
+        assert list(iter_task_dicts(f, chunk_size=2)) == [12345, 675.0, 7]
+
+    def test_empty_array(self):
+        """Test tableau vide"""
+        assert list(iter_task_dicts(io.StringIO("  [ ]  "))) == []
+
+    @pytest.mark.parametrize(
+        "content", ['{"id": 1}', '[{"id": 1} {"id": 2}]', '[{"id": 1},', "[1,]", ""]
+    )
+    def test_malformed_documents_raise(self, content):
+        """Test documents invalides"""
+        with pytest.raises(ValueError):
+            list(iter_task_dicts(io.StringIO(content), chunk_size=3))
+
+    def test_iter_tasks_from_file_yields_tasks(self):
+        """Test générateur de Task depuis un fichier"""
+        tasks = iter_tasks_from_file("demo_tasks.json")
+
+        first = next(tasks)
+        assert isinstance(first, Task)
+        assert first.title == "Préparer la présentation"
+        assert len(list(tasks)) == 4
+
+    def test_manager_streaming_load_fills_indexes(self):
+        """Test chargement en flux alimente les index du gestionnaire"""
+        manager = TaskManager(
+            "demo_tasks.json", storage=JSONFileStorage("demo_tasks.json", stream=True)
+        )
+        manager.load_from_file()
+
+        assert len(manager.tasks) == 5
+        assert len(manager.get_tasks_by_status(Status.DONE)) == 2
+
+    def test_manager_streaming_load_missing_file(self, tmp_path):
+        """Test chargement en flux d'un fichier inexistant"""
+        filename = str(tmp_path / "missing.json")
+        manager = TaskManager(filename, storage=JSONFileStorage(filename, stream=True))
+        manager.load_from_file()
+
+        assert manager.tasks == []
+
+    def test_manager_streaming_load_truncated_file_keeps_tasks(self, tmp_path):
+        """Test fichier tronqué : les tâches et index précédents sont conservés"""
+        with open("demo_tasks.json", encoding="utf-8") as f:
+            content = f.read()
+        filename = tmp_path / "tasks.json"
+        filename.write_text(content, encoding="utf-8")
+        manager = TaskManager(
+            str(filename), storage=JSONFileStorage(str(filename), stream=True)
+        )
+        manager.load_from_file()
+        filename.write_text(content[: len(content) // 2], encoding="utf-8")
+
+        with pytest.raises(Exception, match="Erreur lors du chargement"):
+            manager.load_from_file()
+
+        assert len(manager.tasks) == 5
+        assert len(manager.get_tasks_by_status(Status.DONE)) == 2
+        manager.tasks[0].status = Status.DONE
+        assert len(manager.get_tasks_by_status(Status.DONE)) == 3
+
+
+def sqlite_manager(path):
+    # Gestionnaire adossé à une base SQLite dans tmp_path
+    filename = str(path / "tasks.db")
+    return TaskManager(filename, storage=SQLiteStorage(filename, batch_size=2))
+
+
+@pytest.mark.integration
+class TestSQLiteStorage:
+    """Tests du backend SQLite"""
+
+    def setup_method(self):
+        self.manager = None
+
+    def teardown_method(self):
+        if self.manager is not None:
+            self.manager.close()
+
+    def populate(self, path):
+        manager = sqlite_manager(path)
+        self.task1_id = manager.add_task("Task 1", "Desc 1", Priority.HIGH)
+        self.task2_id = manager.add_task("Task 2", "Desc 2", Priority.LOW)
+        self.task3_id = manager.add_task("Task 3", "Desc 3", Priority.HIGH)
+        task1 = manager.get_task(self.task1_id)
+        task1.mark_completed()
+        task1.assign_to_project("project-1")
+        manager.delete_task(self.task2_id)
+        manager.close()
+
+    def test_queries_are_pushed_down_without_loading(self, tmp_path):
+        """Test requêtes servies par la base sans chargement préalable"""
+        self.populate(tmp_path)
+        self.manager = sqlite_manager(tmp_path)
+
+        high_ids = [t.id for t in self.manager.get_tasks_by_priority(Priority.HIGH)]
+        done = self.manager.get_tasks_by_status(Status.DONE)
+
+        assert high_ids == [self.task1_id, self.task3_id]
+        assert [t.id for t in done] == [self.task1_id]
+        assert done[0].completed_at is not None
+        assert self.manager.get_tasks_by_project("project-1")[0].id == self.task1_id
+        assert self.manager.get_task(self.task2_id) is None
+
+    def test_statistics_are_computed_in_sql(self, tmp_path):
+        """Test statistiques calculées par la base"""
+        self.populate(tmp_path)
+        self.manager = sqlite_manager(tmp_path)
+        stats = self.manager.get_statistics()
+
+        assert stats["total_tasks"] == 2
+        assert stats["completed_tasks"] == 1
+        assert stats["tasks_by_priority"] == {
+            "low": 0,
+            "medium": 0,
+            "high": 2,
+            "urgent": 0,
+        }
+        assert stats["tasks_by_status"]["todo"] == 1
+
+    def test_returned_tasks_are_tracked(self, tmp_path):
+        """Test une tâche lue en base est unique et ses mutations persistées"""
+        self.populate(tmp_path)
+        self.manager = sqlite_manager(tmp_path)
+        task = self.manager.get_task(self.task3_id)
+
+        assert self.manager.get_tasks_by_priority(Priority.HIGH)[1] is task
+        task.update_priority(Priority.URGENT)
+        assert self.manager.get_tasks_by_priority(Priority.URGENT) == [task]
+        assert self.manager.delete_task(self.task1_id) is True
+        assert self.manager.get_statistics()["total_tasks"] == 1
+
+    def test_load_from_file_reads_all_rows(self, tmp_path):
+        """Test chargement complet depuis la base"""
+        self.populate(tmp_path)
+        self.manager = sqlite_manager(tmp_path)
+        self.manager.load_from_file()
+
+        assert [task.id for task in self.manager.tasks] == [
+            self.task1_id,
+            self.task3_id,
+        ]
+        assert self.manager.get_task(self.task1_id).project_id == "project-1"
+
+    def test_loaded_manager_queries_its_indexes(self, tmp_path):
+        """Test requêtes servies par les index une fois la table chargée"""
+        self.populate(tmp_path)
+        self.manager = sqlite_manager(tmp_path)
+        self.manager.load_from_file()
+        task = self.manager.get_task(self.task3_id)
+
+        with patch.object(SQLiteStorage, "_select") as select:
+            assert self.manager.get_tasks_by_priority(Priority.HIGH)[1] is task
+            assert self.manager.get_tasks_by_status(Status.DONE)[0].id == (
+                self.task1_id
+            )
+            assert self.manager.get_statistics()["total_tasks"] == 2
+        select.assert_not_called()
+
+    def test_import_tasks_from_json(self, tmp_path):
+        """Test import du format JSON existant"""
+        json_manager = TaskManager("demo_tasks.json")
+        json_manager.load_from_file()
+        self.manager = sqlite_manager(tmp_path)
+        self.manager.storage.import_tasks(json_manager.tasks)
+
+        assert self.manager.get_statistics() == json_manager.get_statistics()
+        legacy_id = json_manager.tasks[0].id
+        assert self.manager.get_task(legacy_id).to_dict() == (
+            json_manager.tasks[0].to_dict()
+        )
+
+    def test_bulk_mutations_are_written(self, tmp_path):
+        """Test les opérations en masse atteignent la base"""
+        self.manager = sqlite_manager(tmp_path)
+        task_ids = self.manager.add_tasks([f"Task {i}" for i in range(5)])
+        self.manager.update_many(task_ids[:3], priority=Priority.URGENT)
+        self.manager.delete_tasks(task_ids[3:])
+        self.manager.close()
+
+        self.manager = sqlite_manager(tmp_path)
+        self.manager.load_from_file()
+
+        assert [task.id for task in self.manager.tasks] == task_ids[:3]
+        assert self.manager.get_statistics()["tasks_by_priority"]["urgent"] == 3
+
+    def test_replaced_tasks_are_saved(self, tmp_path):
+        """Test tâches importées servies en mémoire puis réécrites en base"""
+        self.populate(tmp_path)
+        self.manager = sqlite_manager(tmp_path)
+        self.manager.load_from_file("demo_tasks.json")
+        expected = self.manager.get_statistics()
+
+        assert expected["total_tasks"] == len(self.manager.tasks)
+        assert self.manager.get_task(self.task3_id) is None
+        self.manager.save_to_file()
+        assert self.manager.get_statistics() == expected
+        self.manager.close()
+
+        self.manager = sqlite_manager(tmp_path)
+        self.manager.load_from_file()
+        assert self.manager.get_statistics() == expected
+
+
+@pytest.mark.integration
+class TestAtomicSave:
+    """Tests de la sauvegarde atomique et du mode compact"""
+
+    def setup_method(self):
+        self.manager = TaskManager("demo_tasks.json")
+        self.manager.load_from_file()
+
+    def test_compact_mode_round_trip(self, tmp_path):
+        """Test mode compact relu à l'identique et plus petit"""
+        pretty_file = tmp_path / "pretty.json"
+        compact_file = tmp_path / "compact.json"
+        JSONFileStorage(str(pretty_file)).save(self.manager.tasks)
+        JSONFileStorage(str(compact_file), compact=True).save(self.manager.tasks)
+
+        compact_text = compact_file.read_text(encoding="utf-8")
+        assert "\n" not in compact_text
+        assert "Préparer" in compact_text
+        assert len(compact_text) < len(pretty_file.read_text(encoding="utf-8"))
+        assert json.loads(compact_text) == json.loads(pretty_file.read_text())
+
+    def test_failed_write_keeps_previous_file(self, tmp_path):
+        """Test un échec d'écriture laisse l'ancien fichier intact"""
+        target = tmp_path / "tasks.json"
+        storage = JSONFileStorage(str(target), compact=True)
+        storage.save(self.manager.tasks)
+        previous = target.read_bytes()
+
+        broken = Task("Broken")
+        broken.id = object()  # non sérialisable en JSON
+        with pytest.raises(TypeError):
+            storage.save(self.manager.tasks + [broken])
+
+        assert target.read_bytes() == previous
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_compact_empty_list(self, tmp_path):
+        """Test sauvegarde compacte sans tâche"""
+        target = tmp_path / "tasks.json"
+        JSONFileStorage(str(target), compact=True).save([])
+
+        assert target.read_text() == "[]"
+
+    def test_compact_batches_join_correctly(self):
+        """Test lots d'encodage correctement séparés"""
+        f = io.StringIO()
+        write_tasks_compact(f, self.manager.tasks, batch_size=2)
+
+        assert json.loads(f.getvalue()) == [
+            task.to_dict() for task in self.manager.tasks
+        ]
+
+
+def segmented_manager(path, segment_size=2):
+    # Gestionnaire à stockage segmenté dans tmp_path
+    directory = str(path / "tasks.d")
+    storage = SegmentedJSONStorage(directory, segment_size=segment_size)
+    return TaskManager(directory, storage=storage)
+
+
+@pytest.mark.integration
+class TestSegmentedJSONStorage:
+    """Tests du stockage segmenté et des sauvegardes incrémentales"""
+
+    def build(self, tmp_path, count=5):
+        manager = segmented_manager(tmp_path)
+        task_ids = [manager.add_task(f"Task {i}") for i in range(count)]
+        manager.save_to_file()
+        return manager, task_ids
+
+    def segment_files(self, tmp_path):
+        return sorted(p.name for p in (tmp_path / "tasks.d").glob("segment-*"))
+
+    def test_round_trip_keeps_insertion_order(self, tmp_path):
+        """Test rechargement à l'identique, dans l'ordre d'insertion"""
+        manager, task_ids = self.build(tmp_path)
+        manager.tasks[1].mark_completed()
+        manager.save_to_file()
+
+        reloaded = segmented_manager(tmp_path)
+        reloaded.load_from_file()
+
+        assert [task.id for task in reloaded.tasks] == task_ids
+        assert Task.to_dicts(reloaded.tasks) == Task.to_dicts(manager.tasks)
+        assert self.segment_files(tmp_path) == [
+            "segment-000000.json",
+            "segment-000001.json",
+            "segment-000002.json",
+        ]
+
+    def test_update_rewrites_only_its_segment(self, tmp_path):
+        """Test une modification ne réécrit que son segment"""
+        manager, task_ids = self.build(tmp_path)
+        manager.load_from_file()
+        manager.get_task(task_ids[3]).mark_completed()
+
+        with patch(
+            "src.task_manager.storage.atomic_write", wraps=atomic_write
+        ) as write:
+            manager.save_to_file()
+
+        written = [call.args[0] for call in write.call_args_list]
+        assert written == [str(tmp_path / "tasks.d" / "segment-000001.json")]
+
+    def test_additions_fill_last_segment(self, tmp_path):
+        """Test les ajouts complètent le dernier segment puis en ouvrent un"""
+        manager, task_ids = self.build(tmp_path)
+        task_ids += [manager.add_task("Task 5"), manager.add_task("Task 6")]
+        manager.save_to_file()
+
+        reloaded = segmented_manager(tmp_path)
+        reloaded.load_from_file()
+
+        assert [task.id for task in reloaded.tasks] == task_ids
+        assert len(self.segment_files(tmp_path)) == 4
+
+    def test_emptied_segment_is_removed(self, tmp_path):
+        """Test un segment vidé disparaît du manifeste et du disque"""
+        manager, task_ids = self.build(tmp_path)
+        manager.delete_task(task_ids[0])
+        manager.delete_task(task_ids[1])
+        manager.save_to_file()
+
+        reloaded = segmented_manager(tmp_path)
+        reloaded.load_from_file()
+
+        assert [task.id for task in reloaded.tasks] == task_ids[2:]
+        assert "segment-000000.json" not in self.segment_files(tmp_path)
+
+    def test_full_save_replaces_previous_segments(self, tmp_path):
+        """Test une sauvegarde complète ne laisse pas d'anciens segments"""
+        manager, _ = self.build(tmp_path)
+        manager.tasks = [Task("Only")]
+        manager.save_to_file()
+
+        reloaded = segmented_manager(tmp_path)
+        reloaded.load_from_file()
+
+        assert [task.title for task in reloaded.tasks] == ["Only"]
+        assert len(self.segment_files(tmp_path)) == 1
+
+    def test_missing_directory_loads_empty(self, tmp_path):
+        """Test un répertoire absent donne une liste vide"""
+        manager = segmented_manager(tmp_path)
+        manager.load_from_file()
+
+        assert manager.tasks == []
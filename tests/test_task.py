@@ -1,8 +1,8 @@
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
-from src.task_manager.task import Priority, Status, Task
+from src.task_manager.task import Priority, SlottedTask, Status, Task
 
 
 @pytest.mark.unit
@@ -20,7 +20,7 @@ class TestTaskCreation:
         assert task.completed_at is None
         assert task.project_id is None
         assert isinstance(task.created_at, datetime)
-        assert isinstance(task.id, float)
+        assert isinstance(task.id, int)
 
     def test_create_task_complete(self):
         """Test création tâche avec tous les paramètres"""
@@ -33,7 +33,7 @@ class TestTaskCreation:
         assert task.completed_at is None
         assert task.project_id is None
         assert isinstance(task.created_at, datetime)
-        assert isinstance(task.id, float)
+        assert isinstance(task.id, int)
 
     def test_create_task_empty_title_raises_error(self):
         """Test titre vide lève une erreur"""
@@ -74,6 +74,13 @@ class TestTaskOperations:
         assert self.task.completed_at is not None
         assert isinstance(self.task.completed_at, datetime)
 
+    def test_leaving_done_clears_completed_at(self):
+        """Test une tâche rouverte perd sa date de fin"""
+        self.task.mark_completed()
+        self.task.status = Status.TODO
+
+        assert self.task.completed_at is None
+
     def test_update_priority_valid(self):
         """Test mise à jour priorité valide"""
         self.task.update_priority(Priority.HIGH)
@@ -147,3 +154,186 @@ class TestTaskSerialization:
         assert recreated_task.created_at == self.task.created_at
         assert recreated_task.completed_at == self.task.completed_at
         assert recreated_task.project_id == self.task.project_id
+
+
+@pytest.mark.unit
+class TestTaskChangeNotification:
+    """Tests de notification des changements"""
+
+    def setup_method(self):
+        self.task = Task("Test Task")
+        self.changes = []
+        self.task._listener = lambda task, field, old, new: self.changes.append(
+            (field, old, new)
+        )
+
+    def test_mutators_notify_listener(self):
+        """Test les mutateurs notifient l'écouteur"""
+        self.task.update_priority(Priority.URGENT)
+        self.task.assign_to_project("project-1")
+        self.task.mark_completed()
+
+        assert self.changes == [
+            ("priority", Priority.MEDIUM, Priority.URGENT),
+            ("project_id", None, "project-1"),
+            ("status", Status.TODO, Status.DONE),
+            ("completed_at", None, self.task.completed_at),
+        ]
+
+    def test_unchanged_value_does_not_notify(self):
+        """Test une valeur inchangée ne notifie pas"""
+        self.task.update_priority(Priority.MEDIUM)
+        self.task.status = Status.TODO
+
+        assert self.changes == []
+
+
+@pytest.mark.unit
+class TestSlottedTask:
+    """Tests de la représentation compacte des tâches"""
+
+    def test_slotted_task_has_no_instance_dict(self):
+        """Test SlottedTask n'a pas de __dict__ par instance"""
+        task = SlottedTask("Compact Task")
+
+        assert not hasattr(task, "__dict__")
+        with pytest.raises(AttributeError):
+            task.extra = True
+
+    def test_slotted_task_keeps_attribute_api(self):
+        """Test SlottedTask garde la même API d'attributs"""
+        task = SlottedTask("Compact Task", "Description", Priority.LOW)
+        task.assign_to_project("project-1")
+        task.mark_completed()
+
+        assert task.title == "Compact Task"
+        assert task.priority == Priority.LOW
+        assert task.status == Status.DONE
+        assert task.project_id == "project-1"
+        assert isinstance(task.completed_at, datetime)
+
+    def test_slotted_task_round_trip(self):
+        """Test sérialisation aller-retour de SlottedTask"""
+        task = SlottedTask("Compact Task", "Description", Priority.URGENT)
+        task.mark_completed()
+        recreated_task = SlottedTask.from_dict(task.to_dict())
+
+        assert type(recreated_task) is SlottedTask
+        assert recreated_task.to_dict() == task.to_dict()
+
+    def test_task_still_accepts_extra_attributes(self):
+        """Test Task accepte toujours des attributs libres"""
+        task = Task("Task")
+        task.completed = False
+
+        assert task.completed is False
+
+    def test_task_has_no_weakref_slot(self):
+        """Test Task n'ajoute que __dict__ aux slots hérités"""
+        assert Task.__slots__ == ("__dict__",)
+        assert not hasattr(Task("Task"), "__weakref__")
+
+
+@pytest.mark.unit
+class TestBulkSerialization:
+    """Tests des chemins de sérialisation en lot"""
+
+    def setup_method(self):
+        self.tasks = [
+            Task("Task 1", "Description", Priority.HIGH),
+            Task("Task 2", priority=Priority.LOW),
+        ]
+        self.tasks[0].mark_completed()
+        self.tasks[1].assign_to_project("project-1")
+
+    def test_to_dicts_matches_to_dict(self):
+        """Test to_dicts produit le même format que to_dict"""
+        assert Task.to_dicts(self.tasks) == [task.to_dict() for task in self.tasks]
+
+    def test_to_dicts_repeated_and_zoned_dates(self):
+        """Test dates répétées et même instant dans deux fuseaux"""
+        moment = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+        self.tasks.append(Task("Task 3"))
+        self.tasks[0].created_at = datetime(2024, 1, 1, 12)
+        self.tasks[1].created_at = datetime(2024, 1, 1, 12)
+        self.tasks[0].completed_at = moment
+        self.tasks[2].created_at = moment.astimezone(timezone(timedelta(hours=2)))
+
+        data = Task.to_dicts(self.tasks)
+
+        assert data == [task.to_dict() for task in self.tasks]
+        assert data[2]["created_at"] == "2024-01-01T14:00:00+02:00"
+
+    def test_from_dicts_round_trip(self):
+        """Test reconstruction en lot depuis to_dicts"""
+        recreated = SlottedTask.from_dicts(Task.to_dicts(self.tasks))
+
+        assert all(type(task) is SlottedTask for task in recreated)
+        assert Task.to_dicts(recreated) == Task.to_dicts(self.tasks)
+
+    def test_from_trusted_dict_does_not_generate_id(self):
+        """Test le chemin rapide n'appelle pas le générateur d'IDs"""
+        data = self.tasks[0].to_dict()
+        original_generator = Task.id_generator
+        Task.id_generator = lambda: pytest.fail("ID généré inutilement")
+        try:
+            task = Task.from_trusted_dict(data)
+            task_from_dict = Task.from_dict(data)
+        finally:
+            Task.id_generator = original_generator
+
+        assert task.id == data["id"]
+        assert task_from_dict.to_dict() == data
+
+    def test_from_trusted_dict_accepts_enum_names(self):
+        """Test le chemin rapide accepte aussi les noms d'Enum"""
+        data = dict(self.tasks[1].to_dict(), priority="LOW", status="In_Progress")
+        task = Task.from_trusted_dict(data)
+
+        assert task.priority == Priority.LOW
+        assert task.status == Status.IN_PROGRESS
+
+    def test_from_dict_still_validates_title(self):
+        """Test from_dict valide toujours le titre"""
+        data = dict(self.tasks[0].to_dict(), title="  ")
+
+        with pytest.raises(ValueError, match="Le titre ne peut pas être vide"):
+            Task.from_dict(data)
+
+
+@pytest.mark.unit
+class TestTaskDirtyTracking:
+    """Tests du suivi des modifications d'une tâche"""
+
+    def test_new_and_restored_tasks_are_clean(self):
+        """Test une tâche créée ou rechargée n'est pas modifiée"""
+        task = Task("Task")
+
+        assert task.dirty is False
+        assert Task.from_dict(task.to_dict()).dirty is False
+
+    def test_tracked_fields_mark_task_dirty(self):
+        """Test statut, priorité, projet et completed_at marquent la tâche"""
+        for change in (
+            lambda task: task.update_priority(Priority.HIGH),
+            lambda task: task.assign_to_project("project-1"),
+            lambda task: task.mark_completed(),
+        ):
+            task = Task("Task")
+            change(task)
+            assert task.dirty is True
+
+    def test_unchanged_value_keeps_task_clean(self):
+        """Test une valeur inchangée ne marque pas la tâche"""
+        task = Task("Task")
+        task.update_priority(Priority.MEDIUM)
+
+        assert task.dirty is False
+
+    def test_mark_clean(self):
+        """Test mark_clean remet le marqueur à zéro"""
+        task = Task("Task")
+        task.mark_completed()
+        task.mark_clean()
+
+        assert task.dirty is False
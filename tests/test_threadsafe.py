@@ -0,0 +1,167 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.task_manager.task import Priority, Status
+from src.task_manager.threadsafe import ConcurrentTaskManager, ReadWriteLock
+
+
+@pytest.mark.unit
+class TestReadWriteLock:
+    """Tests du verrou lecteurs-rédacteur"""
+
+    def test_readers_share_the_lock(self):
+        """Test plusieurs lecteurs tiennent le verrou en même temps"""
+        lock = ReadWriteLock()
+        barrier = threading.Barrier(3, timeout=5)
+
+        def read():
+            with lock.read:
+                # Bloquerait jusqu'au timeout si les lectures s'excluaient
+                barrier.wait()
+
+        threads = [threading.Thread(target=read) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not barrier.broken
+
+    def test_writer_excludes_readers(self):
+        """Test un rédacteur bloque les lecteurs"""
+        lock = ReadWriteLock()
+        entered = threading.Event()
+
+        def read():
+            with lock.read:
+                entered.set()
+
+        with lock.write:
+            reader = threading.Thread(target=read)
+            reader.start()
+            assert not entered.wait(0.1)
+        reader.join(5)
+
+        assert entered.is_set()
+
+    def test_writer_is_reentrant(self):
+        """Test le rédacteur peut relire et réécrire sans se bloquer"""
+        lock = ReadWriteLock()
+
+        with lock.write:
+            with lock.read:
+                with lock.write:
+                    pass
+
+        with lock.write:
+            pass
+
+
+@pytest.mark.integration
+class TestConcurrentTaskManager:
+    """Tests du gestionnaire partagé entre threads"""
+
+    def setup_method(self):
+        self.manager = ConcurrentTaskManager(debug=True)
+
+    def run_threads(self, worker, count=8):
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            return list(executor.map(worker, range(count)))
+
+    def test_concurrent_adds_are_not_lost(self):
+        """Test aucun ajout concurrent n'est perdu"""
+
+        def add(worker):
+            return [self.manager.add_task(f"Task {worker}-{i}") for i in range(200)]
+
+        task_ids = [task_id for ids in self.run_threads(add) for task_id in ids]
+
+        assert len(set(task_ids)) == 1600
+        assert self.manager.get_statistics()["total_tasks"] == 1600
+
+    def test_concurrent_deletes_remove_each_task_once(self):
+        """Test chaque suppression concurrente réussit une seule fois"""
+        task_ids = [self.manager.add_task(f"Task {i}") for i in range(500)]
+
+        def delete(worker):
+            return sum(self.manager.delete_task(task_id) for task_id in task_ids)
+
+        assert sum(self.run_threads(delete)) == 500
+        assert self.manager.tasks == []
+
+    def test_concurrent_changes_keep_buckets_consistent(self):
+        """Test des changements concurrents d'une même tâche gardent les index"""
+        task_ids = [self.manager.add_task(f"Task {i}") for i in range(20)]
+        statuses = list(Status)
+        priorities = list(Priority)
+
+        def change(worker):
+            for i in range(300):
+                task = self.manager.get_task(task_ids[(worker + i) % len(task_ids)])
+                task.status = statuses[(worker + i) % len(statuses)]
+                task.update_priority(priorities[(worker * i) % len(priorities)])
+                # En mode debug, lève si les compteurs divergent du recomptage
+                self.manager.get_statistics()
+
+        self.run_threads(change)
+
+        for task_id in task_ids:
+            task = self.manager.get_task(task_id)
+            assert task in self.manager.get_tasks_by_status(task.status)
+            assert task in self.manager.get_tasks_by_priority(task.priority)
+        stats = self.manager.get_statistics()
+        assert sum(stats["tasks_by_status"].values()) == 20
+        assert sum(stats["tasks_by_priority"].values()) == 20
+
+    def test_statistics_are_consistent_during_mutations(self):
+        """Test les statistiques restent cohérentes pendant les mutations"""
+        stop = threading.Event()
+        snapshots = []
+
+        def mutate():
+            while not stop.is_set():
+                task_id = self.manager.add_task("Task")
+                self.manager.get_task(task_id).mark_completed()
+                self.manager.delete_task(task_id)
+
+        writers = [threading.Thread(target=mutate) for _ in range(4)]
+        for writer in writers:
+            writer.start()
+        try:
+            for _ in range(200):
+                snapshots.append(self.manager.get_statistics())
+        finally:
+            stop.set()
+            for writer in writers:
+                writer.join()
+
+        for stats in snapshots:
+            assert sum(stats["tasks_by_status"].values()) == stats["total_tasks"]
+            assert sum(stats["tasks_by_priority"].values()) == stats["total_tasks"]
+
+    def test_change_after_delete_is_ignored(self):
+        """Test un changement sur une tâche supprimée ne touche pas aux index"""
+        task_id = self.manager.add_task("Task")
+        task = self.manager.get_task(task_id)
+        self.manager.delete_task(task_id)
+        task.mark_completed()
+
+        assert self.manager.get_statistics()["completed_tasks"] == 0
+
+    def test_concurrent_bulk_updates_keep_buckets_consistent(self):
+        """Test des mises à jour en masse concurrentes gardent les index"""
+        task_ids = self.manager.add_tasks([f"Task {i}" for i in range(50)])
+        statuses = list(Status)
+
+        def update(worker):
+            for i in range(50):
+                status = statuses[(worker + i) % len(statuses)]
+                self.manager.update_many(task_ids[worker % 2 :: 2], status=status)
+                self.manager.get_statistics()
+
+        self.run_threads(update, count=4)
+
+        stats = self.manager.get_statistics()
+        assert sum(stats["tasks_by_status"].values()) == 50
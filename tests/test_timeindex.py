@@ -0,0 +1,178 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.task_manager.manager import TaskManager
+from src.task_manager.storage import SQLiteStorage
+from src.task_manager.task import Task
+from src.task_manager.threadsafe import ConcurrentTaskManager
+from src.task_manager.timeindex import TimeIndex
+
+START = datetime(2024, 1, 1)
+
+
+def day(n):
+    return START + timedelta(days=n)
+
+
+def dated_tasks(count):
+    # Une tâche par jour ; les tâches paires terminées le lendemain midi
+    tasks = []
+    for i in range(count):
+        task = Task(f"Task {i}")
+        task.created_at = day(i)
+        if i % 2 == 0:
+            task.mark_completed()
+            task.completed_at = day(i) + timedelta(hours=36)
+        tasks.append(task)
+    return tasks
+
+
+@pytest.mark.unit
+class TestTimeIndex:
+    """Tests de l'index trié par date"""
+
+    def setup_method(self):
+        self.index = TimeIndex()
+        self.tasks = dated_tasks(5)
+        # Ajouts dans le désordre
+        for i in (3, 0, 4, 1, 2):
+            self.index.add(self.tasks[i], self.tasks[i].created_at)
+
+    def test_range_bounds(self):
+        """Test plages semi-ouvertes et bornes incluses ou exclues"""
+        assert self.index.between(day(1), day(3)) == self.tasks[1:3]
+        assert self.index.between(None, day(2)) == self.tasks[:2]
+        assert self.index.between(day(3)) == self.tasks[3:]
+        assert list(self.index.range(day(1), day(3), False, True)) == self.tasks[2:4]
+        assert self.index.between(day(3), day(1)) == []
+
+    def test_range_view(self):
+        """Test la vue a une taille en O(1) et se parcourt dans les deux sens"""
+        view = self.index.range(day(1), day(4))
+
+        assert len(view) == 3
+        assert list(reversed(view)) == self.tasks[3:0:-1]
+
+    def test_latest(self):
+        """Test les plus récentes d'abord"""
+        assert self.index.latest(2) == [self.tasks[4], self.tasks[3]]
+        assert self.index.latest(0) == []
+        assert self.index.latest(10) == self.tasks[::-1]
+
+    def test_remove_keeps_other_tasks_with_same_date(self):
+        """Test le retrait ne touche que la tâche donnée à date égale"""
+        twin = Task("Twin")
+        twin.created_at = day(2)
+        self.index.add(twin, twin.created_at)
+
+        self.index.remove(self.tasks[2], day(2))
+
+        assert self.index.between(day(2), day(3)) == [twin]
+        assert len(self.index) == 5
+
+    def test_remove_after_untracked_date_change(self):
+        """Test retrait d'une tâche dont la date a changé sans réindexation"""
+        self.tasks[1].created_at = day(99)
+
+        self.index.remove(self.tasks[1], self.tasks[1].created_at)
+
+        assert self.index.between() == [self.tasks[i] for i in (0, 2, 3, 4)]
+
+    def test_removed_places_are_skipped_then_compacted(self):
+        """Test les places libérées sont sautées puis recompactées"""
+        tasks = dated_tasks(200)
+        index = TimeIndex()
+        for task in tasks:
+            index.add(task, task.created_at)
+        for task in tasks[10:190:2]:
+            index.remove(task, task.created_at)
+
+        kept = tasks[:10] + tasks[11:190:2] + tasks[190:]
+        view = index.range(day(5), day(15))
+        assert len(index) == len(kept)
+        assert len(view) == 7
+        assert list(reversed(view)) == list(reversed(list(view)))
+        assert index.between() == kept
+        assert index.latest(12) == kept[::-1][:12]
+
+        for task in kept[:60]:
+            index.remove(task, task.created_at)
+        assert len(index._keys) < len(tasks) - 100
+        assert index.between() == kept[60:]
+
+    def test_bulk_sorts_once_stably(self):
+        """Test l'ajout en masse trie à la fin, ordre d'arrivée à date égale"""
+        index = TimeIndex()
+        tasks = [Task(f"Task {i}") for i in range(4)]
+        with index.bulk():
+            for task, n in zip(tasks, (2, 1, 2, 1)):
+                index.add(task, day(n))
+            index.add(Task("Sans date"), None)
+
+        assert index.between() == [tasks[1], tasks[3], tasks[0], tasks[2]]
+
+
+@pytest.mark.integration
+class TestManagerTimeQueries:
+    """Tests des requêtes par date du gestionnaire"""
+
+    def test_created_and_completed_ranges(self):
+        """Test plages de création et de complétion"""
+        manager = TaskManager()
+        manager.tasks = dated_tasks(6)
+        tasks = manager.tasks
+
+        assert manager.get_tasks_created_between(day(2), day(4)) == tasks[2:4]
+        assert manager.get_tasks_completed_between(day(1), day(4)) == [
+            tasks[0],
+            tasks[2],
+        ]
+        assert manager.get_recent_tasks(2) == [tasks[5], tasks[4]]
+        assert manager.get_recently_completed(1) == [tasks[4]]
+
+    def test_indexes_follow_adds_completions_and_deletes(self):
+        """Test ajouts, complétions et suppressions mettent les index à jour"""
+        manager = ConcurrentTaskManager()
+        first = manager.add_task("First")
+        second = manager.add_task("Second")
+        manager.get_task(second).mark_completed()
+
+        assert [t.id for t in manager.get_recent_tasks(5)] == [second, first]
+        assert [t.id for t in manager.get_recently_completed(5)] == [second]
+
+        manager.get_task(first).mark_completed()
+        assert [t.id for t in manager.get_recently_completed(5)] == [first, second]
+
+        manager.delete_task(second)
+        assert [t.id for t in manager.get_recent_tasks(5)] == [first]
+        assert [t.id for t in manager.get_tasks_completed_between()] == [first]
+
+    def test_reindex_after_created_at_change(self):
+        """Test réindexation après modification de created_at"""
+        manager = TaskManager()
+        manager.tasks = dated_tasks(3)
+        task = manager.tasks[0]
+        task.created_at = day(10)
+
+        manager.reindex_task(task.id)
+
+        assert manager.get_recent_tasks(1) == [task]
+
+    def test_sqlite_backend_queries(self, tmp_path):
+        """Test mêmes résultats avec le backend SQLite"""
+        filename = str(tmp_path / "tasks.db")
+        manager = TaskManager(filename, storage=SQLiteStorage(filename))
+        for task in dated_tasks(6):
+            manager._add(task)
+        manager.close()
+        manager = TaskManager(filename, storage=SQLiteStorage(filename))
+
+        titles = [t.title for t in manager.get_tasks_created_between(day(2), day(4))]
+        completed = [t.title for t in manager.get_tasks_completed_between(day(1))]
+        recent = [t.title for t in manager.get_recently_completed(2)]
+        manager.close()
+
+        assert titles == ["Task 2", "Task 3"]
+        assert completed == ["Task 0", "Task 2", "Task 4"]
+        assert recent == ["Task 4", "Task 2"]
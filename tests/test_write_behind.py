@@ -0,0 +1,178 @@
+import threading
+import time
+
+import pytest
+
+from src.task_manager.manager import TaskManager
+from src.task_manager.storage import JSONFileStorage, SQLiteStorage, StorageBackend
+from src.task_manager.task import Priority, Status
+from src.task_manager.write_behind import WriteBehindStorage
+
+
+class RecordingStorage(StorageBackend):
+    """Backend factice qui enregistre les écritures reçues"""
+
+    def __init__(self):
+        self.saves = []
+        self.changes = []
+        # Retient les écritures tant qu'il n'est pas levé
+        self.gate = threading.Event()
+        self.gate.set()
+        self.fail = False
+
+    def load(self, task_class):
+        return []
+
+    def save(self, tasks):
+        self.gate.wait()
+        self.saves.append([task.id for task in tasks])
+
+    def save_changes(self, tasks, changed, deleted):
+        self.gate.wait()
+        if self.fail:
+            raise OSError("disque plein")
+        self.changes.append(([task.to_dict() for task in changed], set(deleted)))
+
+
+def wait_for(condition, timeout=5.0):
+    # Attend qu'une condition écrite par le thread d'arrière-plan soit vraie
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition jamais atteinte"
+        time.sleep(0.01)
+
+
+@pytest.mark.integration
+class TestWriteBehindStorage:
+    """Tests de l'écriture différée"""
+
+    def make_manager(self, **kwargs):
+        self.backend = RecordingStorage()
+        storage = WriteBehindStorage(self.backend, **kwargs)
+        manager = TaskManager(storage=storage)
+        manager.load_from_file()
+        return manager
+
+    def test_thread_bound_storage_is_rejected(self, tmp_path):
+        """Test un stockage lié à son thread est refusé"""
+        storage = SQLiteStorage(str(tmp_path / "tasks.db"))
+
+        with pytest.raises(ValueError, match="thread"):
+            WriteBehindStorage(storage)
+        storage.close()
+
+    def test_json_round_trip_after_close(self, tmp_path):
+        """Test les mutations sont sur disque après close"""
+        filename = str(tmp_path / "tasks.json")
+        manager = TaskManager(filename, write_behind=True)
+        task_id = manager.add_task("Task", priority=Priority.HIGH)
+        manager.save_to_file()
+        manager.get_task(task_id).mark_completed()
+        manager.close()
+
+        reloaded = TaskManager(filename)
+        reloaded.load_from_file()
+
+        assert reloaded.get_task(task_id).status == Status.DONE
+
+    def test_save_does_not_wait_for_write(self):
+        """Test save_to_file rend la main sans attendre l'écriture"""
+        manager = self.make_manager()
+        self.backend.gate.clear()
+        manager.add_task("Task")
+        manager.save_to_file()
+
+        assert self.backend.changes == []
+        self.backend.gate.set()
+        manager.flush()
+        assert len(self.backend.changes) == 1
+        manager.close()
+
+    def test_changes_to_same_task_are_merged(self):
+        """Test plusieurs modifications d'une tâche donnent une écriture"""
+        manager = self.make_manager(flush_interval=60)
+        task_id = manager.add_task("Task")
+        task = manager.get_task(task_id)
+        task.update_priority(Priority.URGENT)
+        task.mark_completed()
+        manager.flush()
+
+        ((changed, deleted),) = self.backend.changes
+        assert [data["id"] for data in changed] == [task_id]
+        assert changed[0]["status"] == "done"
+        assert deleted == set()
+        manager.close()
+
+    def test_threshold_triggers_write(self):
+        """Test le seuil de tâches modifiées déclenche une écriture"""
+        manager = self.make_manager(flush_interval=60, flush_threshold=3)
+        for i in range(3):
+            manager.add_task(f"Task {i}")
+
+        wait_for(lambda: len(self.backend.changes) == 1)
+        assert len(self.backend.changes[0][0]) == 3
+        manager.close()
+
+    def test_interval_triggers_write(self):
+        """Test le délai déclenche une écriture sans flush"""
+        manager = self.make_manager(flush_interval=0.05)
+        manager.add_task("Task")
+
+        wait_for(lambda: len(self.backend.changes) == 1)
+        manager.close()
+
+    def test_full_queue_applies_backpressure(self):
+        """Test une file pleine bloque l'appelant"""
+        manager = self.make_manager(flush_threshold=1, max_queue=1)
+        self.backend.gate.clear()
+
+        def add_many():
+            for i in range(5):
+                manager.add_task(f"Task {i}")
+
+        writer = threading.Thread(target=add_many)
+        writer.start()
+        writer.join(0.2)
+        assert writer.is_alive()
+
+        self.backend.gate.set()
+        writer.join(5)
+        assert not writer.is_alive()
+        manager.close()
+
+    def test_write_error_is_reported_and_retried(self):
+        """Test une erreur d'écriture remonte puis les changements sont retentés"""
+        manager = self.make_manager(flush_interval=60)
+        self.backend.fail = True
+        task_id = manager.add_task("Task")
+
+        with pytest.raises(Exception, match="disque plein"):
+            manager.flush()
+
+        self.backend.fail = False
+        manager.flush()
+        assert [data["id"] for data in self.backend.changes[0][0]] == [task_id]
+        manager.close()
+
+    def test_closed_storage_rejects_mutations(self):
+        """Test un stockage fermé refuse les mutations"""
+        manager = self.make_manager()
+        manager.close()
+
+        with pytest.raises(RuntimeError):
+            manager.add_task("Task")
+
+    def test_full_save_uses_copies(self, tmp_path):
+        """Test la sauvegarde complète écrit les tâches remplacées"""
+        filename = str(tmp_path / "tasks.json")
+        storage = WriteBehindStorage(JSONFileStorage(filename))
+        manager = TaskManager(filename, storage=storage)
+        manager.add_task("Task 1")
+        manager.add_task("Task 2")
+        manager.save_to_file()
+        manager.flush()
+
+        reloaded = TaskManager(filename)
+        reloaded.load_from_file()
+        assert [task.title for task in reloaded.tasks] == ["Task 1", "Task 2"]
+        manager.close()